@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+AI Work Scheduler Module for ClickUp Task Extractor
+
+Contains:
+- AIWorkScheduler: one bounded thread pool running AI jobs of several kinds
+  (summaries, ETAs) interleaved, with combined progress and per-kind counters
+
+Jobs may be queued before the pool starts and submitted while it runs, from
+a completion callback (e.g. a follow-up ETA job once a summary batch
+finishes) or from another thread (a producer still fetching tasks). Completion
+callbacks always run on the thread executing :meth:`AIWorkScheduler.run`, one
+at a time, so they can touch records, caches and the console without locks.
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, NamedTuple
+
+
+class _Job(NamedTuple):
+    kind: str
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    units: int
+    on_result: Callable[[Any], None] | None
+    on_error: Callable[[Exception], None] | None
+
+
+class AIWorkScheduler:
+    """
+    Run AI jobs of several kinds on one shared, bounded pool.
+
+    Each kind has a plural label used in progress lines and a ``done``/``total``
+    counter measured in *units* (tasks), so a summary batch covering five tasks
+    advances the summary counter by five. Work known up front but submitted
+    later can be reserved with :meth:`expect`; work that turns out to need no
+    job is counted with :meth:`mark_done`.
+
+    By default :meth:`run` returns once every job has finished. After
+    :meth:`keep_open` it keeps waiting for new submissions until
+    :meth:`close` is called, so a producer thread can feed it work while it
+    runs elsewhere. A ``KeyboardInterrupt`` (or any other ``BaseException``)
+    escaping :meth:`run`, or a call to :meth:`cancel`, cancels every queued
+    job so no further CLI processes start.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        labels: dict[str, str],
+        report: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Pool size shared by every kind of job
+            labels: Job kind -> plural label (e.g. ``{"summary": "summaries"}``)
+            report: Receives one Rich-markup progress line per finished job
+        """
+        self.max_workers = max(1, max_workers)
+        self.labels = dict(labels)
+        self.report = report
+        self.counters: dict[str, dict[str, int]] = {
+            kind: {"done": 0, "total": 0} for kind in self.labels
+        }
+        self._inbox: list[_Job] = []
+        self._running: dict[Future, _Job] = {}
+        self._lock = threading.Lock()
+        self._wakeup: Future = Future()
+        self._open = False
+        self._cancelled = False
+
+    def _wake(self) -> None:
+        """Interrupt run()'s wait so it sees new jobs or state (caller holds the lock)."""
+        if not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    def keep_open(self) -> None:
+        """Keep run() waiting for submissions until close() is called."""
+        with self._lock:
+            self._open = True
+
+    def close(self) -> None:
+        """Let run() return once the submitted jobs have finished."""
+        with self._lock:
+            self._open = False
+            self._wake()
+
+    def cancel(self) -> None:
+        """Make run() cancel queued jobs and return without waiting for them."""
+        with self._lock:
+            self._cancelled = True
+            self._wake()
+
+    def expect(self, kind: str, units: int) -> None:
+        """Reserve ``units`` of ``kind`` in the totals ahead of their submission."""
+        with self._lock:
+            self.counters[kind]["total"] += units
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        units: int = 1,
+        expected: bool = False,
+        on_result: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """
+        Queue ``fn(*args)`` as a job of ``kind``.
+
+        Args:
+            kind: Job kind (a key of ``labels``)
+            fn: Callable run on a worker thread
+            *args: Positional arguments for ``fn``
+            units: Tasks this job covers
+            expected: The units were already reserved with expect()
+            on_result: Called with the return value on the scheduler thread
+            on_error: Called with an ``Exception`` raised by ``fn``; without
+                one the exception propagates out of run()
+        """
+        with self._lock:
+            if not expected:
+                self.counters[kind]["total"] += units
+            self._inbox.append(_Job(kind, fn, args, units, on_result, on_error))
+            self._wake()
+
+    def mark_done(self, kind: str, units: int = 1) -> None:
+        """Count reserved units of ``kind`` that finished without a job."""
+        with self._lock:
+            self.counters[kind]["done"] += units
+
+    def progress_line(self) -> str:
+        """Return e.g. ``"3/12 summaries, 1/4 ETAs processed"``."""
+        with self._lock:
+            parts = [
+                f"{counts['done']}/{counts['total']} {self.labels[kind]}"
+                for kind, counts in self.counters.items()
+                if counts["total"]
+            ]
+        return f"{', '.join(parts)} processed"
+
+    def run(self) -> None:
+        """Run submitted jobs, and any submitted meanwhile, until none remain."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while True:
+                    with self._lock:
+                        if self._cancelled:
+                            break
+                        jobs, self._inbox = self._inbox, []
+                        if self._wakeup.done():
+                            self._wakeup = Future()
+                        wakeup = self._wakeup
+                        idle = not jobs and not self._running and not self._open
+                    if idle:
+                        break
+                    for job in jobs:
+                        self._running[executor.submit(job.fn, *job.args)] = job
+                    done, _ = wait(
+                        [*self._running, wakeup], return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        if future is wakeup:
+                            continue
+                        job = self._running.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as exc:
+                            if job.on_error is None:
+                                raise
+                            job.on_error(exc)
+                        else:
+                            if job.on_result is not None:
+                                job.on_result(result)
+                        self.mark_done(job.kind, job.units)
+                        if self.report is not None:
+                            self.report(f"  [dim]{self.progress_line()}[/dim]")
+                if self._cancelled:
+                    executor.shutdown(wait=False, cancel_futures=True)
+            except BaseException:
+                # Ctrl+C etc.: without cancel_futures the with-block's shutdown
+                # would still run every queued job, spawning fresh `claude`
+                # subprocesses after the user interrupted (issue #168).
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                self._running.clear()
@@ -7,8 +7,11 @@ Contains:
 - AI summary generation using the Google Gemini API
 - Rate limiting and retry logic
 - Progress bar functionality for wait times
+- Batched multi-task Claude summaries with per-task fallback
+- Content-addressed cache keys for generated summaries
 """
 
+import hashlib
 import json
 import os
 import shutil
@@ -16,7 +19,7 @@ import subprocess
 import tempfile
 import threading
 import time
-from typing import Callable, Mapping, Sequence, TypeAlias
+from typing import Any, Callable, Mapping, Sequence, TypeAlias
 
 # Gemini model used for AI summaries.
 #
@@ -52,6 +55,82 @@ _CLAUDE_SUMMARY_SYSTEM_PROMPT = (
     "with no markdown, no preamble, and no tool use."
 )
 
+# Per-task summary prompts ({task_name} / {field_block} placeholders). Kept as
+# module constants so summary_cache_key() can fingerprint them: editing a
+# template invalidates every summary cached under the old wording.
+_CLAUDE_SUMMARY_PROMPT = """Summarize the current status of this task in 1-2 first-person sentences.
+
+Task: {task_name}
+
+Here are the available fields (ignore any marked "(not provided)"):
+
+{field_block}
+
+Focus on what I have done or still need to do. Be specific and actionable. Output only the summary sentence(s)."""
+
+# Multi-task variant: several numbered tasks in one `claude` call, answered as
+# JSON lines so each summary can be mapped back to its task. CLI start-up
+# dominates a short summary's cost, so batching cuts both wall time and the
+# number of calls counted against the subscription.
+_CLAUDE_BATCH_SYSTEM_PROMPT = (
+    "You are a task-status summarizer. You will receive several numbered tasks. "
+    "For EACH task reply with exactly one line of JSON of the form "
+    '{"id": <task number>, "summary": "<1-2 sentence first-person status summary>"}. '
+    "Output only those JSON lines - no markdown, no code fences, no preamble, "
+    "and no tool use."
+)
+
+_CLAUDE_BATCH_TASK_BLOCK = """### Task {id}
+Task: {task_name}
+{field_block}"""
+
+_CLAUDE_BATCH_PROMPT = """Summarize the current status of each task below in 1-2 first-person sentences (e.g. "I completed...", "I need to..."). Ignore any fields marked "(not provided)". Be specific and actionable.
+
+{task_blocks}
+
+Reply with one JSON line per task, in order: {{"id": <task number>, "summary": "..."}}"""
+
+# Fused prompt: tasks that need both a summary and an ETA get them from one
+# `claude` call instead of one call per pass, answered as JSON lines like the
+# batched summary prompt.
+_CLAUDE_FUSED_SYSTEM_PROMPT = (
+    "You summarize task status and estimate completion dates. You will receive "
+    "one or more numbered tasks. For EACH task reply with exactly one line of "
+    'JSON of the form {"id": <task number>, "summary": "<1-2 sentence '
+    'first-person status summary>", "eta": "<MM/DD/YYYY>"}. Output only those '
+    "JSON lines - no markdown, no code fences, no preamble, and no tool use."
+)
+
+_CLAUDE_FUSED_TASK_BLOCK = """### Task {id}
+Task: {task_name}
+{field_block}
+Priority: {priority}
+Status: {status}
+Context:
+{context}"""
+
+_CLAUDE_FUSED_PROMPT = """Today's date: {today}
+
+For each task below, summarize its current status in 1-2 first-person sentences (e.g. "I completed...", "I need to..."), ignoring any fields marked "(not provided)", and estimate a realistic completion date (ETA).
+
+ETA guidelines: Urgent within 1-2 days; High within 3-5 days; Normal within ~1 week;
+Low within ~2 weeks. Tasks already "in progress" or "investigating" may finish
+sooner; complex issues may need more time.
+
+{task_blocks}
+
+Reply with one JSON line per task, in order: {{"id": <task number>, "summary": "...", "eta": "MM/DD/YYYY"}}"""
+
+_GEMINI_SUMMARY_PROMPT = """Please provide a concise 1-2 sentence summary of the current status of this task using the available fields, written as if you are the user describing your own work (use first-person voice, e.g., "I completed...", "I need to..."):
+
+Task: {task_name}
+
+Here are the available fields (values may be "(not provided)" when absent):
+
+{field_block}
+
+Focus on the current state and what you have done or need to do. Be specific and actionable. Ignore any fields marked "(not provided)"."""
+
 # Seconds to allow a single `claude` CLI summary call before giving up.
 _CLAUDE_TIMEOUT_SECONDS = int(os.environ.get("CLAUDE_SUMMARY_TIMEOUT", "120"))
 
@@ -221,6 +300,66 @@ def _normalize_field_entries(
     return [(str(label), str(value)) for label, value in field_entries]
 
 
+def format_field_block(
+    field_entries: Sequence[tuple[str, str]] | Mapping[str, str],
+) -> str:
+    """Render field entries as the ``Label: value`` lines sent in prompts."""
+    return "\n".join(
+        f"{label}: {value}"
+        for label, value in _normalize_field_entries(field_entries)
+        if label
+    )
+
+
+def summary_cache_key(
+    source: str,
+    task_name: str,
+    field_entries: Sequence[tuple[str, str]] | Mapping[str, str],
+) -> str:
+    """
+    Return a content address for a generated summary.
+
+    The key hashes everything that determines the generated text: the
+    provider (``"claude"`` or ``"gemini"``), its model, its prompt template
+    (and system prompt), the task name and the normalized field entries. Any
+    change to one of them yields a new key, so stale summaries are never
+    served — they simply age out of the cache.
+
+    Args:
+        source: Provider name, ``"claude"`` or ``"gemini"``
+        task_name: Name of the task
+        field_entries: Iterable of (field label, value) pairs sent in the prompt
+
+    Returns:
+        ``"summary:<sha256 hex>"``
+    """
+    if source == "claude":
+        # Single, batched and fused (summary+ETA) prompts produce
+        # interchangeable summaries, so every template is fingerprinted under
+        # the one "claude" key.
+        model = CLAUDE_SUMMARY_MODEL
+        template = "\n".join(
+            (
+                _CLAUDE_SUMMARY_SYSTEM_PROMPT,
+                _CLAUDE_SUMMARY_PROMPT,
+                _CLAUDE_BATCH_SYSTEM_PROMPT,
+                _CLAUDE_BATCH_TASK_BLOCK,
+                _CLAUDE_BATCH_PROMPT,
+                _CLAUDE_FUSED_SYSTEM_PROMPT,
+                _CLAUDE_FUSED_TASK_BLOCK,
+                _CLAUDE_FUSED_PROMPT,
+            )
+        )
+    else:
+        model = GEMINI_MODEL
+        template = _GEMINI_SUMMARY_PROMPT
+    payload = json.dumps(
+        [source, model, template, task_name, _normalize_field_entries(field_entries)],
+        ensure_ascii=False,
+    )
+    return "summary:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def _try_ai_summary(
     task_name: str, field_block: str, gemini_api_key: str
 ) -> tuple[SummaryResult, bool]:
@@ -242,15 +381,9 @@ def _try_ai_summary(
         configure(api_key=gemini_api_key)
         model = GenerativeModel(GEMINI_MODEL)
 
-        prompt = f"""Please provide a concise 1-2 sentence summary of the current status of this task using the available fields, written as if you are the user describing your own work (use first-person voice, e.g., "I completed...", "I need to..."):
-
-Task: {task_name}
-
-Here are the available fields (values may be "(not provided)" when absent):
-
-{field_block}
-
-Focus on the current state and what you have done or need to do. Be specific and actionable. Ignore any fields marked "(not provided)"."""
+        prompt = _GEMINI_SUMMARY_PROMPT.format(
+            task_name=task_name, field_block=field_block
+        )
 
         config = types.GenerationConfig(
             temperature=0.3,
@@ -729,30 +862,116 @@ def get_claude_summary(
         The summary string, or None if the CLI is unavailable, errors, hits a
         usage limit, or returns no text (callers fall back to base content).
     """
-    normalized_entries = _normalize_field_entries(field_entries)
-    field_block = "\n".join(
-        f"{label}: {value}" for label, value in normalized_entries if label
-    )
+    field_block = format_field_block(field_entries)
     if not field_block:
         return "No content available for summary."
 
-    prompt = f"""Summarize the current status of this task in 1-2 first-person sentences.
-
-Task: {task_name}
-
-Here are the available fields (ignore any marked "(not provided)"):
-
-{field_block}
-
-Focus on what I have done or still need to do. Be specific and actionable. Output only the summary sentence(s)."""
+    prompt = _CLAUDE_SUMMARY_PROMPT.format(task_name=task_name, field_block=field_block)
 
     text, _ = run_claude_cli(
         prompt, _CLAUDE_SUMMARY_SYSTEM_PROMPT, label="summary"
     )
     if not text:
         return None
+    return _finish_summary(text)
+
 
+def _finish_summary(text: str) -> str:
+    """Collapse a summary onto one line and make sure it ends with a period."""
     summary = text.replace("\n", " ").strip()
     if not summary.endswith("."):
         summary += "."
     return summary
+
+
+def parse_batch_lines(text: str, count: int) -> dict[int, dict[str, Any]]:
+    """Map task numbers (1-based) to their objects in a JSON-lines batch reply.
+
+    Lines that are not a JSON object with an in-range integer ``id`` and a
+    non-empty string ``summary`` are ignored (code fences, stray prose); the
+    caller re-requests any task left unmapped. Summaries are returned on one
+    line ending with a period; any other keys are passed through as-is.
+    """
+    items: dict[int, dict[str, Any]] = {}
+    for line in (text or "").splitlines():
+        line = line.strip().rstrip(",")
+        if not line.startswith("{"):
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(item, dict):
+            continue
+        task_id, summary = item.get("id"), item.get("summary")
+        if (
+            isinstance(task_id, int)
+            and 1 <= task_id <= count
+            and isinstance(summary, str)
+            and summary.strip()
+            and task_id not in items
+        ):
+            items[task_id] = {**item, "summary": _finish_summary(summary)}
+    return items
+
+
+def get_claude_summaries(
+    tasks: Sequence[tuple[str, Sequence[tuple[str, str]] | Mapping[str, str]]],
+    progress_pause_callback: Callable[[], None] | None = None,
+) -> list[SummaryResult]:
+    """
+    Summarize several tasks with a single ``claude`` CLI call.
+
+    The tasks are sent as numbered blocks and the CLI is asked for one JSON
+    line per task. When the call returns output, any task it does not cover —
+    a line was malformed, an id was missing — falls back to its own
+    :func:`get_claude_summary` call. When the call itself fails (timeout, CLI
+    error, usage limit) every task gets None instead: the same failure would
+    likely repeat once per task. A single task skips the batch format
+    entirely.
+
+    Args:
+        tasks: ``(task_name, field_entries)`` pairs to summarize.
+        progress_pause_callback: Accepted for parity with get_claude_summary().
+
+    Returns:
+        One summary (or None, as for get_claude_summary) per task, in order.
+    """
+    if len(tasks) == 1:
+        task_name, field_entries = tasks[0]
+        return [get_claude_summary(task_name, field_entries, progress_pause_callback)]
+
+    results: list[SummaryResult] = [None] * len(tasks)
+    blocks: list[str] = []
+    batch_index: list[int] = []  # batch task number - 1 -> index in ``tasks``
+    for index, (task_name, field_entries) in enumerate(tasks):
+        field_block = format_field_block(field_entries)
+        if not field_block:
+            results[index] = "No content available for summary."
+            continue
+        batch_index.append(index)
+        blocks.append(
+            _CLAUDE_BATCH_TASK_BLOCK.format(
+                id=len(batch_index), task_name=task_name, field_block=field_block
+            )
+        )
+
+    if blocks:
+        text, _ = run_claude_cli(
+            _CLAUDE_BATCH_PROMPT.format(task_blocks="\n\n".join(blocks)),
+            _CLAUDE_BATCH_SYSTEM_PROMPT,
+            label="summary batch",
+        )
+        if text is None:
+            # Callers keep the base notes for these tasks.
+            return results
+        parsed = parse_batch_lines(text, len(batch_index))
+        for number, index in enumerate(batch_index, start=1):
+            if number in parsed:
+                results[index] = parsed[number]["summary"]
+            else:
+                task_name, field_entries = tasks[index]
+                results[index] = get_claude_summary(
+                    task_name, field_entries, progress_pause_callback
+                )
+    return results
@@ -4,18 +4,48 @@
 ClickUp API Client Module
 
 Contains:
-- APIClient protocol for structural typing
+- APIClient / AsyncAPIClient protocols for structural typing
 - ClickUpAPIClient class for HTTP API interactions
+- AsyncClickUpAPIClient asyncio counterpart (optional, requires httpx)
 - Error handling and debugging for API requests
-- Retry logic with exponential backoff for transient errors
+- Retry logic for transient errors: server-directed waits (Retry-After,
+  X-RateLimit-Reset) else exponential backoff, a per-run retry budget and an
+  optional per-request deadline
+- Pooled keep-alive HTTP sessions shared across worker threads
+- RateLimiter token bucket shared by every request (plan-tier aware)
+- iter_task_pages paginator with next-page prefetch
+- JSONArrayStream incremental parser for streamed task pages
+- Optional on-disk cache (TTL + ETag revalidation) for hierarchy endpoints
 """
 
+import asyncio
+import codecs
+import hashlib
+import json
+import logging
+import os
+import re
 import requests
+import threading
 import time
 import random
-from typing import Any, Protocol
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Collection, Iterable, Iterator, Protocol
+from requests.adapters import HTTPAdapter
+from disk_cache import DiskCache
 from logger_config import get_logger
 
+# httpx powers the optional asyncio client; the synchronous client only needs
+# requests.
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 
@@ -37,6 +67,304 @@ class ShardRoutingError(APIError):
     pass
 
 
+# Sentinel returned by ClickUpAPIClient._request for an HTTP 304 revalidation.
+_NOT_MODIFIED = object()
+
+# ClickUp's documented per-token request limits (requests per minute) by
+# workspace plan, selectable by name in CLICKUP_RATE_LIMIT.
+RATE_LIMIT_TIERS: dict[str, int] = {
+    "free": 100,
+    "unlimited": 100,
+    "business": 100,
+    "business_plus": 1000,
+    "enterprise": 10000,
+}
+DEFAULT_RATE_LIMIT = RATE_LIMIT_TIERS["free"]
+
+
+def configured_rate_limit(default: int = DEFAULT_RATE_LIMIT) -> int:
+    """
+    Resolve requests per minute from ``CLICKUP_RATE_LIMIT`` (min 1).
+
+    Accepts a number (e.g. ``1000``) or a plan tier from RATE_LIMIT_TIERS
+    (e.g. ``business_plus``); anything else falls back to ``default``.
+    """
+    configured = os.environ.get("CLICKUP_RATE_LIMIT", "").strip().lower()
+    if not configured:
+        return default
+    tier = RATE_LIMIT_TIERS.get(configured.replace("-", "_").replace(" ", "_"))
+    if tier is not None:
+        return tier
+    try:
+        return max(1, int(configured))
+    except ValueError:
+        return default
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket pacing requests under ClickUp's rate limit.
+
+    The bucket holds up to one minute's worth of tokens and refills at
+    ``rate_per_minute / 60`` tokens per second; :meth:`acquire` takes one
+    token per HTTP request, blocking until one is available. The server's
+    own accounting wins when it is stricter: :meth:`observe` caps the
+    tokens at ``X-RateLimit-Remaining`` (minus a one-request safety margin)
+    and, once that reaches zero, holds every caller until
+    ``X-RateLimit-Reset``. Concurrent workers therefore slow down just
+    before the limit instead of bursting into 429s.
+    """
+
+    SAFETY_MARGIN = 1  # requests kept in reserve below the server's count
+    # Longest hold for X-RateLimit-Reset: one rate-limit window, so a skewed
+    # clock cannot block every caller for longer.
+    MAX_RESET_WAIT = 60  # seconds
+
+    def __init__(self, rate_per_minute: int = DEFAULT_RATE_LIMIT) -> None:
+        """
+        Initialize the limiter with a full bucket.
+
+        Args:
+            rate_per_minute: Sustained requests per minute (the plan limit)
+        """
+        self.rate_per_minute = max(1, rate_per_minute)
+        self.capacity = float(self.rate_per_minute)
+        self._rate = self.rate_per_minute / 60.0  # tokens per second
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0  # monotonic time the server's window resets
+        self._lock = threading.Lock()
+        self.waited = 0.0  # total seconds callers spent blocked
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update (caller holds the lock)."""
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _take(self) -> float:
+        """Take a token if one is free (returns 0.0), else return the wait needed."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    def _record_wait(self, waited: float) -> float:
+        with self._lock:
+            self.waited += waited
+        return waited
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting (0.0 when a token was free)
+        """
+        waited = 0.0
+        while (delay := self._take()) > 0:
+            time.sleep(delay)
+            waited += delay
+        return self._record_wait(waited)
+
+    async def acquire_async(self) -> float:
+        """Like :meth:`acquire`, but yields to the event loop while waiting."""
+        waited = 0.0
+        while (delay := self._take()) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        return self._record_wait(waited)
+
+    def observe(self, headers: Any) -> None:
+        """
+        Align the bucket with a response's rate-limit headers.
+
+        Args:
+            headers: Response headers; ``X-RateLimit-Remaining`` (requests
+                left in the window) and ``X-RateLimit-Reset`` (epoch seconds
+                when it resets) are used when present and numeric
+        """
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            allowed = remaining - self.SAFETY_MARGIN
+            self._tokens = min(self._tokens, max(0.0, allowed))
+            if allowed <= 0 and reset is not None:
+                # Nothing left in this window: wait for the server's reset
+                # (wall-clock epoch) rather than trickling in refills.
+                wait = min(max(0.0, reset - time.time()), self.MAX_RESET_WAIT)
+                self._blocked_until = max(self._blocked_until, now + wait)
+
+
+def _retry_after_seconds(headers: Any) -> float | None:
+    """Return the ``Retry-After`` delay in seconds (delta or HTTP-date), else None."""
+    seconds = _header_number(headers, "Retry-After")
+    if seconds is not None:
+        return max(0.0, seconds)
+    try:
+        value = headers.get("Retry-After")
+    except AttributeError:
+        return None
+    if not isinstance(value, str):
+        return None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _header_number(headers: Any, name: str) -> float | None:
+    """Return header ``name`` as a number, or None when absent or malformed."""
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    if not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class JSONArrayStream:
+    """
+    Iterate the items of one array member of a JSON object as it downloads.
+
+    ``json.loads`` needs the whole body before returning anything; this
+    parser decodes the body chunk by chunk and yields each element of
+    ``key`` (e.g. ``{"tasks": [...], "last_page": true}``) as soon as it is
+    complete, so only the current item and one chunk are held in memory.
+    With ``fields`` each item is projected to those keys before it is
+    yielded. The object's other members are collected into :attr:`extras`,
+    complete once iteration finishes.
+
+    Elements are decoded with ``json.JSONDecoder.raw_decode`` (the C
+    scanner), so per-item cost matches ``json.loads``.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        key: str = "tasks",
+        fields: Collection[str] | None = None,
+        source: str = "response",
+    ) -> None:
+        """
+        Args:
+            chunks: Raw UTF-8 body chunks
+            key: Top-level member whose array items are yielded
+            fields: Keys to keep in each (dict) item; None keeps everything
+            source: What is parsed, for error messages (e.g. the URL)
+        """
+        self.key = key
+        self.fields = fields
+        self.source = source
+        self.extras: dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._scanner = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            self._expect("{")
+            if self._peek() == "}":
+                return
+            while True:
+                name = self._value()
+                self._expect(":")
+                if name == self.key and self._peek() == "[":
+                    self._pos += 1
+                    if self._peek() == "]":
+                        self._pos += 1
+                    else:
+                        while True:
+                            yield self._project(self._value())
+                            if self._expect(",", "]") == "]":
+                                break
+                else:
+                    self.extras[name] = self._value()
+                if self._expect(",", "}") == "}":
+                    return
+        finally:
+            # Release the source (e.g. the HTTP response) once parsing ends,
+            # early or not.
+            close = getattr(self._chunks, "close", None)
+            if close is not None:
+                close()
+
+    def _project(self, item: Any) -> Any:
+        if self.fields is None or not isinstance(item, dict):
+            return item
+        return {field: item[field] for field in self.fields if field in item}
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer (dropping parsed text)."""
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise APIError(f"Invalid JSON response from {self.source}: truncated")
+
+    def _expect(self, *tokens: str) -> str:
+        char = self._peek()
+        if char not in tokens:
+            raise APIError(
+                f"Invalid JSON response from {self.source}: expected "
+                f"{' or '.join(repr(t) for t in tokens)}, got {char!r}"
+            )
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value, reading more chunks as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._scanner.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise APIError(f"Invalid JSON response from {self.source}: {e}") from e
+            # A number (or literal) ending at the buffer end may continue in
+            # the next chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
 class APIClient(Protocol):
     """Protocol defining the interface for API clients."""
 
@@ -45,8 +373,23 @@ class APIClient(Protocol):
         ...
 
 
-class ClickUpAPIClient:
-    """HTTP client for ClickUp API v2 with error handling, debugging, and retry logic."""
+class AsyncAPIClient(Protocol):
+    """Protocol defining the interface for asyncio API clients."""
+
+    async def get(self, endpoint: str) -> Any:
+        """Make a GET request to the API endpoint."""
+        ...
+
+
+class _ClickUpClientBase:
+    """
+    Transport-independent parts of the ClickUp API clients.
+
+    Holds authentication, rate limiting, the retry policy (server-directed
+    waits, budget, deadline), response-cache bookkeeping and response/error
+    handling, so the synchronous and asyncio clients behave identically and
+    differ only in how a request is sent and how they wait.
+    """
 
     BASE_URL = "https://api.clickup.com/api/v2"
 
@@ -54,6 +397,10 @@ class ClickUpAPIClient:
     MAX_RETRIES = 3
     INITIAL_BACKOFF = 1  # seconds
     MAX_BACKOFF = 30  # seconds
+    # Longest server-directed wait (Retry-After / X-RateLimit-Reset) honored;
+    # ClickUp's rate-limit window is one minute, so anything far beyond it is
+    # a bogus header or clock skew and the request fails instead.
+    MAX_SERVER_DELAY = 90  # seconds
     RETRYABLE_STATUS_CODES = {
         502,
         503,
@@ -61,18 +408,125 @@ class ClickUpAPIClient:
         429,
     }  # Bad Gateway, Service Unavailable, Gateway Timeout, Rate Limit
 
+    # Retries allowed across all requests of one client (i.e. one run), so a
+    # degraded API fails the run quickly instead of every request backing off
+    # in turn. Overridable via CLICKUP_RETRY_BUDGET.
+    DEFAULT_RETRY_BUDGET = 50
+
     DEFAULT_TIMEOUT = 30  # seconds
 
-    def __init__(self, api_key: str, timeout: int = DEFAULT_TIMEOUT) -> None:
-        """
-        Initialize the ClickUp API client.
+    # Workspace hierarchy endpoints that rarely change, with how long (in
+    # seconds) a cached response is served without asking ClickUp again.
+    # Anything not matched here (tasks, pagination) is never cached.
+    CACHE_TTLS: tuple[tuple[re.Pattern[str], int], ...] = (
+        (re.compile(r"^/team$"), 24 * 3600),
+        (re.compile(r"^/team/[^/?]+/space$"), 6 * 3600),
+        (re.compile(r"^/space/[^/?]+/folder$"), 3600),
+        (re.compile(r"^/folder/[^/?]+/list$"), 3600),
+        (re.compile(r"^/space/[^/?]+/list\?archived=false$"), 3600),
+        (re.compile(r"^/list/[^/?]+$"), 3600),
+    )
 
-        Args:
-            api_key: ClickUp API key for authentication
-            timeout: Request timeout in seconds (default: 30)
-        """
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = DEFAULT_TIMEOUT,
+        cache: DiskCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_budget: int | None = None,
+        deadline: float | None = None,
+    ) -> None:
         self.headers = {"Authorization": api_key, "Content-Type": "application/json"}
         self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter or RateLimiter(configured_rate_limit())
+        self.retry_budget = (
+            retry_budget
+            if retry_budget is not None
+            else self._configured_retry_budget()
+        )
+        self.deadline = deadline if deadline is not None else self._configured_deadline()
+        self.retries_used = 0
+        self._retry_lock = threading.Lock()
+        # Response body bytes received (successful, parsed responses).
+        self.bytes_received = 0
+        self._bytes_lock = threading.Lock()
+        # Cache keys are scoped to the API key (hashed, never stored) so two
+        # accounts sharing a cache directory never see each other's data.
+        self._cache_scope = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+    def _configured_retry_budget(self) -> int:
+        """Resolve the retry budget from ``CLICKUP_RETRY_BUDGET`` (min 0)."""
+        try:
+            configured = int(
+                os.environ.get("CLICKUP_RETRY_BUDGET", self.DEFAULT_RETRY_BUDGET)
+            )
+        except ValueError:
+            configured = self.DEFAULT_RETRY_BUDGET
+        return max(0, configured)
+
+    def _configured_deadline(self) -> float | None:
+        """Resolve the per-request deadline from ``CLICKUP_REQUEST_DEADLINE``.
+
+        Unset, malformed or non-positive values mean no deadline.
+        """
+        try:
+            configured = float(os.environ.get("CLICKUP_REQUEST_DEADLINE", 0))
+        except ValueError:
+            return None
+        return configured if configured > 0 else None
+
+    def _cache_ttl(self, endpoint: str) -> int | None:
+        """Return the cache TTL for ``endpoint``, or None if it is not cacheable."""
+        if self.cache is None:
+            return None
+        for pattern, ttl in self.CACHE_TTLS:
+            if pattern.match(endpoint):
+                return ttl
+        return None
+
+    def _cache_probe(
+        self, endpoint: str, cache_ttl: int, fresh: bool = False
+    ) -> tuple[str, Any, dict | None, dict[str, str] | None]:
+        """
+        Look ``endpoint`` up in the response cache.
+
+        With ``fresh`` a stored entry is never served as-is, only used to
+        revalidate (a 304 confirms it is still current).
+
+        Returns:
+            ``(cache_key, fresh_value, stale_entry, revalidation_headers)``;
+            ``fresh_value`` is None unless the entry can be served as-is
+        """
+        cache_key = f"{self._cache_scope}:{endpoint}"
+        cached = None if fresh else self.cache.get(cache_key, max_age=cache_ttl)
+        if cached is not None:
+            logger.debug(f"💾 Cache hit for {endpoint}")
+            return cache_key, cached, None, None
+
+        if self.cache.refresh:
+            # --refresh-cache bypasses stored entries entirely (they may be
+            # the problem), so no conditional request: a full fetch.
+            return cache_key, None, None, None
+
+        # Expired: revalidate with the stored ETag so an unchanged resource
+        # costs a body-less 304 instead of a full fetch.
+        stale = self.cache.entry(cache_key)
+        etag = stale.get("etag") if stale else None
+        headers = {"If-None-Match": etag} if isinstance(etag, str) else None
+        return cache_key, None, stale, headers
+
+    def _cache_update(
+        self, cache_key: str, stale: dict | None, data: Any, response_etag: Any
+    ) -> Any:
+        """Store (or, for a 304, re-validate) a fetched response and return it."""
+        if data is _NOT_MODIFIED:
+            self.cache.touch(cache_key)
+            return stale["value"]
+
+        metadata = {"etag": response_etag} if isinstance(response_etag, str) else {}
+        self.cache.put(cache_key, data, **metadata)
+        return data
 
     def _exponential_backoff_with_jitter(self, attempt: int) -> float:
         """
@@ -88,72 +542,92 @@ class ClickUpAPIClient:
         jitter = random.uniform(0, backoff * 0.1)  # Add up to 10% jitter
         return backoff + jitter
 
-    def get(self, endpoint: str) -> Any:
+    def _retry_delay(self, attempt: int, resp: Any = None) -> float:
         """
-        Make a GET request to the ClickUp API with retry logic.
-
-        Args:
-            endpoint: API endpoint (without base URL)
+        Return how long to wait before retrying.
 
-        Returns:
-            JSON response from the API
+        The server's instructions win: ``Retry-After`` (seconds or HTTP-date),
+        then for a 429 the ``X-RateLimit-Reset`` epoch. Without either, fall
+        back to exponential backoff with jitter. Server-directed waits above
+        MAX_SERVER_DELAY are refused by :meth:`_may_retry`.
 
-        Raises:
-            AuthenticationError: If API key is invalid or expired
-            ShardRoutingError: If API encounters shard routing issues (SHARD_* error codes)
-            APIError: If the request fails for other reasons
+        Args:
+            attempt: Current retry attempt (0-indexed)
+            resp: The retryable response, or None for a network error
         """
-        url = f"{self.BASE_URL}{endpoint}"
+        if resp is not None:
+            retry_after = _retry_after_seconds(resp.headers)
+            if retry_after is not None:
+                return retry_after
+            if resp.status_code == 429:
+                reset = _header_number(resp.headers, "X-RateLimit-Reset")
+                if reset is not None:
+                    return max(0.0, reset - time.time())
+        return self._exponential_backoff_with_jitter(attempt)
 
-        resp = None
-
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                resp = requests.get(url, headers=self.headers, timeout=self.timeout)
+    def _may_retry(self, attempt: int, wait_time: float, started: float) -> bool:
+        """
+        Decide whether a failed attempt is retried, consuming retry budget.
 
-                # Check if this is a retryable error
-                if (
-                    resp.status_code in self.RETRYABLE_STATUS_CODES
-                    and attempt < self.MAX_RETRIES - 1
-                ):
-                    wait_time = self._exponential_backoff_with_jitter(attempt)
+        Without a deadline at most MAX_RETRIES attempts are made. With one,
+        attempts continue as long as the wait still ends before the deadline.
+        A wait longer than MAX_SERVER_DELAY is never slept. Either way every
+        retry spends one unit of the client-wide budget.
+        """
+        if wait_time > self.MAX_SERVER_DELAY:
+            logger.warning(
+                f"⌛ Not retrying: the server asked for a {wait_time:.0f}s wait, "
+                f"more than the {self.MAX_SERVER_DELAY}s limit."
+            )
+            return False
+        if self.deadline is None:
+            if attempt >= self.MAX_RETRIES - 1:
+                return False
+        elif time.monotonic() - started + wait_time > self.deadline:
+            logger.warning(
+                f"⌛ Not retrying: waiting {wait_time:.2f}s would pass the "
+                f"{self.deadline:g}s request deadline."
+            )
+            return False
+        with self._retry_lock:
+            if self.retries_used >= self.retry_budget:
+                if self.retries_used == self.retry_budget:
                     logger.warning(
-                        f"🔄 API returned {resp.status_code}. "
-                        f"Retrying in {wait_time:.2f}s (attempt {attempt + 1}/{self.MAX_RETRIES})..."
+                        f"🛑 Retry budget of {self.retry_budget} exhausted; "
+                        f"further failed requests are not retried."
                     )
-                    time.sleep(wait_time)
-                    continue
+                    self.retries_used += 1  # warn only once
+                return False
+            self.retries_used += 1
+        return True
 
-                # For non-retryable errors or final attempt, break and handle below
-                break
+    def _attempt_label(self, attempt: int, started: float) -> str:
+        """Describe the attempt for retry logs (e.g. ``attempt 1/3``)."""
+        if self.deadline is None:
+            return f"attempt {attempt + 1}/{self.MAX_RETRIES}"
+        remaining = max(0.0, self.deadline - (time.monotonic() - started))
+        return f"attempt {attempt + 1}, {remaining:.0f}s to deadline"
 
-            except requests.exceptions.Timeout:
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self._exponential_backoff_with_jitter(attempt)
-                    logger.warning(
-                        f"⏱️  Request timeout. Retrying in {wait_time:.2f}s "
-                        f"(attempt {attempt + 1}/{self.MAX_RETRIES})..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise APIError(f"Network timeout while accessing {url}") from None
-            except requests.exceptions.ConnectionError as e:
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self._exponential_backoff_with_jitter(attempt)
-                    logger.warning(
-                        f"🌐 Connection error. Retrying in {wait_time:.2f}s "
-                        f"(attempt {attempt + 1}/{self.MAX_RETRIES})..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise APIError(f"Network error while accessing {url}: {e}") from e
-            except requests.exceptions.RequestException as e:
-                raise APIError(f"Network error while accessing {url}: {e}") from e
+    def _parse_response(
+        self, resp: Any, url: str, with_etag: bool, ok: bool
+    ) -> Any:
+        """
+        Turn the final response into data, raising the matching APIError.
 
-        if resp is None:
-            raise APIError(f"Request to {url} did not produce a response")
+        Args:
+            resp: Final response (``requests`` or ``httpx``)
+            url: Requested URL (for error messages)
+            with_etag: Return ``(data, etag)`` and map HTTP 304 to
+                ``(_NOT_MODIFIED, None)``
+            ok: Whether the status is a success (``resp.ok`` / ``is_success``)
+
+        Raises:
+            AuthenticationError: On HTTP 401
+            ShardRoutingError: For SHARD_* error codes
+            APIError: For any other failure or a non-JSON body
+        """
+        if with_etag and resp.status_code == 304:
+            return _NOT_MODIFIED, None
 
         # Handle authentication errors specifically
         if resp.status_code == 401:
@@ -162,7 +636,7 @@ class ClickUpAPIClient:
             )
 
         # Add debugging information for other failed requests
-        if not resp.ok:
+        if not ok:
             error_msg = (
                 f"API Request failed:\n  URL: {url}\n  Status: {resp.status_code}"
             )
@@ -199,7 +673,559 @@ class ClickUpAPIClient:
 
             raise APIError(f"HTTP {resp.status_code}: {resp.text}")
 
+        body = getattr(resp, "content", None)
+        if isinstance(body, bytes):
+            with self._bytes_lock:
+                self.bytes_received += len(body)
+
         try:
-            return resp.json()
+            data = resp.json()
         except ValueError as e:
             raise APIError(f"Invalid JSON response from {url}: {e}") from e
+        if with_etag:
+            return data, resp.headers.get("ETag")
+        return data
+
+
+class ClickUpAPIClient(_ClickUpClientBase):
+    """HTTP client for ClickUp API v2 with error handling, debugging, and retry logic."""
+
+    # Keep-alive connection pool size (per host). Overridable via the
+    # CLICKUP_HTTP_POOL_SIZE environment variable; should be at least the
+    # number of threads issuing requests concurrently.
+    DEFAULT_POOL_SIZE = 10
+
+    # Bytes read per step when a response body is parsed as it streams.
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = _ClickUpClientBase.DEFAULT_TIMEOUT,
+        pool_size: int | None = None,
+        cache: DiskCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_budget: int | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """
+        Initialize the ClickUp API client.
+
+        Args:
+            api_key: ClickUp API key for authentication
+            timeout: Request timeout in seconds (default: 30)
+            pool_size: Max pooled keep-alive connections (default:
+                CLICKUP_HTTP_POOL_SIZE env var, else 10)
+            cache: Optional on-disk cache for the endpoints in CACHE_TTLS
+                (default: no caching)
+            rate_limiter: Token bucket shared by every request (default: one
+                sized from CLICKUP_RATE_LIMIT, else the 100/min base plan)
+            retry_budget: Retries allowed across all requests of this client
+                (default: CLICKUP_RETRY_BUDGET env var, else 50)
+            deadline: Seconds one get() may spend across all its attempts
+                (default: CLICKUP_REQUEST_DEADLINE env var, else none). With
+                a deadline, retries continue past MAX_RETRIES until it passes.
+        """
+        super().__init__(api_key, timeout, cache, rate_limiter, retry_budget, deadline)
+        self.pool_size = pool_size or self._configured_pool_size()
+
+        # One adapter (and its urllib3 PoolManager, which is thread-safe) is
+        # shared by every thread's Session, so keep-alive connections are
+        # reused across the whole run instead of paying a TCP+TLS handshake per
+        # request. pool_block makes surplus threads wait for a free connection
+        # rather than opening throwaway ones. Sessions themselves are kept
+        # thread-local because requests does not guarantee Session thread-safety.
+        self._adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_size, pool_block=True
+        )
+        self._local = threading.local()
+
+    def _configured_pool_size(self) -> int:
+        """Resolve the pool size from ``CLICKUP_HTTP_POOL_SIZE`` (min 1)."""
+        try:
+            configured = int(
+                os.environ.get("CLICKUP_HTTP_POOL_SIZE", self.DEFAULT_POOL_SIZE)
+            )
+        except ValueError:
+            configured = self.DEFAULT_POOL_SIZE
+        return max(1, configured)
+
+    def _get_session(self) -> requests.Session:
+        """Return this thread's Session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["Connection"] = "keep-alive"
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
+    def _log_connection_reuse(self, url: str) -> None:
+        """Debug-log pool usage so connection reuse can be confirmed in logs."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        try:
+            pool = self._adapter.poolmanager.connection_from_url(url)
+            logger.debug(
+                f"🔌 Connection pool {pool.host}: {pool.num_requests} request(s) "
+                f"over {pool.num_connections} connection(s)"
+            )
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._adapter.close()
+
+    def get(self, endpoint: str) -> Any:
+        """
+        Make a GET request to the ClickUp API with retry logic.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+
+        Returns:
+            JSON response from the API
+
+        Raises:
+            AuthenticationError: If API key is invalid or expired
+            ShardRoutingError: If API encounters shard routing issues (SHARD_* error codes)
+            APIError: If the request fails for other reasons
+        """
+        return self._get(endpoint)
+
+    def get_fresh(self, endpoint: str) -> Any:
+        """
+        Like :meth:`get`, but never answer from the response cache.
+
+        For data that must be current (e.g. the statuses a task query is
+        filtered by). A cached entry is still revalidated with its ETag, and
+        the response is stored for later :meth:`get` calls.
+        """
+        return self._get(endpoint, fresh=True)
+
+    def _get(self, endpoint: str, fresh: bool = False) -> Any:
+        """Serve ``endpoint`` from the cache where allowed, else request it."""
+        cache_ttl = self._cache_ttl(endpoint)
+        if cache_ttl is None:
+            return self._request(endpoint)
+
+        cache_key, cached, stale, headers = self._cache_probe(
+            endpoint, cache_ttl, fresh
+        )
+        if cached is not None:
+            return cached
+        data, response_etag = self._request(endpoint, headers, with_etag=True)
+        return self._cache_update(cache_key, stale, data, response_etag)
+
+    def stream(
+        self,
+        endpoint: str,
+        key: str = "tasks",
+        fields: Collection[str] | None = None,
+    ) -> JSONArrayStream:
+        """
+        GET ``endpoint`` and parse the body incrementally as it downloads.
+
+        Retries, rate limiting and error statuses are handled as in
+        :meth:`get` before the body is read; responses are never cached.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            key: Array member whose items are yielded (default ``tasks``)
+            fields: Keys each item is projected to (None keeps all)
+
+        Returns:
+            A :class:`JSONArrayStream` over the response body
+
+        Raises:
+            AuthenticationError / ShardRoutingError / APIError: As for get();
+                network errors and malformed JSON while iterating raise
+                APIError
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        resp = self._request(endpoint, stream=True)
+        return JSONArrayStream(self._iter_body(resp, url), key, fields, source=url)
+
+    def _iter_body(self, resp: Any, url: str) -> Iterator[bytes]:
+        """Yield a streamed response body, counting bytes, then release it."""
+        try:
+            for chunk in resp.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                with self._bytes_lock:
+                    self.bytes_received += len(chunk)
+                yield chunk
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Network error while reading {url}: {e}") from e
+        finally:
+            resp.close()
+
+    def _request(
+        self,
+        endpoint: str,
+        extra_headers: dict[str, str] | None = None,
+        with_etag: bool = False,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Perform the GET request with retries and error handling.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            extra_headers: Headers added to the client's defaults
+            with_etag: Return ``(data, etag)`` and map HTTP 304 to
+                ``(_NOT_MODIFIED, None)``
+            stream: Return the successful response unread (see stream())
+
+        Returns:
+            JSON response from the API (or a tuple, see ``with_etag``)
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+
+        resp = None
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            try:
+                waited = self.rate_limiter.acquire()
+                if waited:
+                    logger.debug(f"🚦 Rate limiter held {endpoint} for {waited:.2f}s")
+                resp = self._get_session().get(
+                    url,
+                    headers=headers,
+                    timeout=self.timeout,
+                    **({"stream": True} if stream else {}),
+                )
+                self.rate_limiter.observe(resp.headers)
+
+                # Check if this is a retryable error
+                if resp.status_code in self.RETRYABLE_STATUS_CODES:
+                    wait_time = self._retry_delay(attempt, resp)
+                    if self._may_retry(attempt, wait_time, started):
+                        logger.warning(
+                            f"🔄 API returned {resp.status_code}. "
+                            f"Retrying in {wait_time:.2f}s ({self._attempt_label(attempt, started)})..."
+                        )
+                        if stream:
+                            # An unread streamed body holds its pooled
+                            # connection; with pool_block the retry would
+                            # wait for it forever.
+                            resp.close()
+                        time.sleep(wait_time)
+                        attempt += 1
+                        continue
+
+                # For non-retryable errors or final attempt, break and handle below
+                break
+
+            except requests.exceptions.Timeout:
+                wait_time = self._retry_delay(attempt)
+                if self._may_retry(attempt, wait_time, started):
+                    logger.warning(
+                        f"⏱️  Request timeout. Retrying in {wait_time:.2f}s "
+                        f"({self._attempt_label(attempt, started)})..."
+                    )
+                    time.sleep(wait_time)
+                    attempt += 1
+                    continue
+                else:
+                    raise APIError(f"Network timeout while accessing {url}") from None
+            except requests.exceptions.ConnectionError as e:
+                wait_time = self._retry_delay(attempt)
+                if self._may_retry(attempt, wait_time, started):
+                    logger.warning(
+                        f"🌐 Connection error. Retrying in {wait_time:.2f}s "
+                        f"({self._attempt_label(attempt, started)})..."
+                    )
+                    time.sleep(wait_time)
+                    attempt += 1
+                    continue
+                else:
+                    raise APIError(f"Network error while accessing {url}: {e}") from e
+            except requests.exceptions.RequestException as e:
+                raise APIError(f"Network error while accessing {url}: {e}") from e
+
+        if resp is None:
+            raise APIError(f"Request to {url} did not produce a response")
+
+        self._log_connection_reuse(url)
+        if stream and resp.ok:
+            return resp
+        return self._parse_response(resp, url, with_etag, ok=resp.ok)
+
+
+class AsyncClickUpAPIClient(_ClickUpClientBase):
+    """
+    asyncio HTTP client for ClickUp API v2 (requires ``httpx``).
+
+    Same authentication, rate limiting, retry policy, response cache and
+    errors (``AuthenticationError``, ``ShardRoutingError``, ``APIError``) as
+    :class:`ClickUpAPIClient`, but :meth:`get` is a coroutine, so thousands
+    of requests can be in flight on one thread. Requests share one pooled
+    ``httpx.AsyncClient``, created on first use inside the running event
+    loop; call :meth:`aclose` (or use ``async with``) before that loop ends.
+    """
+
+    # Simultaneous connections (and so requests in flight). Overridable via
+    # CLICKUP_ASYNC_CONCURRENCY; the rate limiter still paces the total.
+    DEFAULT_MAX_CONNECTIONS = 64
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = _ClickUpClientBase.DEFAULT_TIMEOUT,
+        max_connections: int | None = None,
+        cache: DiskCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_budget: int | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """
+        Initialize the asyncio ClickUp API client.
+
+        Args:
+            api_key: ClickUp API key for authentication
+            timeout: Request timeout in seconds (default: 30)
+            max_connections: Max simultaneous connections (default:
+                CLICKUP_ASYNC_CONCURRENCY env var, else 64)
+            cache: Optional on-disk cache for the endpoints in CACHE_TTLS
+            rate_limiter: Token bucket, e.g. shared with a ClickUpAPIClient
+                so both stay under one limit
+            retry_budget: Retries allowed across all requests of this client
+            deadline: Seconds one get() may spend across all its attempts
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError(
+                "AsyncClickUpAPIClient requires httpx. Install it with: pip install httpx"
+            )
+        super().__init__(api_key, timeout, cache, rate_limiter, retry_budget, deadline)
+        self.max_connections = max_connections or self._configured_max_connections()
+        self._client: Any = None
+
+    def _configured_max_connections(self) -> int:
+        """Resolve the connection limit from ``CLICKUP_ASYNC_CONCURRENCY`` (min 1)."""
+        try:
+            configured = int(
+                os.environ.get(
+                    "CLICKUP_ASYNC_CONCURRENCY", self.DEFAULT_MAX_CONNECTIONS
+                )
+            )
+        except ValueError:
+            configured = self.DEFAULT_MAX_CONNECTIONS
+        return max(1, configured)
+
+    def _http_client(self) -> Any:
+        """Return the pooled ``httpx.AsyncClient``, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                # pool=None: queued requests wait for a free connection
+                # instead of failing with PoolTimeout under high fan-out.
+                timeout=httpx.Timeout(self.timeout, pool=None),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections; the next request opens a fresh pool."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncClickUpAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def get(self, endpoint: str) -> Any:
+        """
+        Make a GET request to the ClickUp API with retry logic.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+
+        Returns:
+            JSON response from the API
+
+        Raises:
+            AuthenticationError: If API key is invalid or expired
+            ShardRoutingError: If API encounters shard routing issues (SHARD_* error codes)
+            APIError: If the request fails for other reasons
+        """
+        return await self._get(endpoint)
+
+    async def get_fresh(self, endpoint: str) -> Any:
+        """Like :meth:`get`, but never answer from the response cache.
+
+        See :meth:`ClickUpAPIClient.get_fresh`.
+        """
+        return await self._get(endpoint, fresh=True)
+
+    async def _get(self, endpoint: str, fresh: bool = False) -> Any:
+        """Serve ``endpoint`` from the cache where allowed, else request it."""
+        cache_ttl = self._cache_ttl(endpoint)
+        if cache_ttl is None:
+            return await self._request(endpoint)
+
+        cache_key, cached, stale, headers = self._cache_probe(
+            endpoint, cache_ttl, fresh
+        )
+        if cached is not None:
+            return cached
+        data, response_etag = await self._request(endpoint, headers, with_etag=True)
+        return self._cache_update(cache_key, stale, data, response_etag)
+
+    async def _request(
+        self,
+        endpoint: str,
+        extra_headers: dict[str, str] | None = None,
+        with_etag: bool = False,
+    ) -> Any:
+        """Perform the GET request with retries (see ClickUpAPIClient._request)."""
+        url = f"{self.BASE_URL}{endpoint}"
+        headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+        client = self._http_client()
+
+        resp = None
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            try:
+                waited = await self.rate_limiter.acquire_async()
+                if waited:
+                    logger.debug(f"🚦 Rate limiter held {endpoint} for {waited:.2f}s")
+                resp = await client.get(url, headers=headers)
+                self.rate_limiter.observe(resp.headers)
+
+                if resp.status_code in self.RETRYABLE_STATUS_CODES:
+                    wait_time = self._retry_delay(attempt, resp)
+                    if self._may_retry(attempt, wait_time, started):
+                        logger.warning(
+                            f"🔄 API returned {resp.status_code}. "
+                            f"Retrying in {wait_time:.2f}s ({self._attempt_label(attempt, started)})..."
+                        )
+                        await asyncio.sleep(wait_time)
+                        attempt += 1
+                        continue
+                break
+
+            except httpx.TimeoutException:
+                wait_time = self._retry_delay(attempt)
+                if self._may_retry(attempt, wait_time, started):
+                    logger.warning(
+                        f"⏱️  Request timeout. Retrying in {wait_time:.2f}s "
+                        f"({self._attempt_label(attempt, started)})..."
+                    )
+                    await asyncio.sleep(wait_time)
+                    attempt += 1
+                    continue
+                raise APIError(f"Network timeout while accessing {url}") from None
+            except httpx.TransportError as e:
+                wait_time = self._retry_delay(attempt)
+                if self._may_retry(attempt, wait_time, started):
+                    logger.warning(
+                        f"🌐 Connection error. Retrying in {wait_time:.2f}s "
+                        f"({self._attempt_label(attempt, started)})..."
+                    )
+                    await asyncio.sleep(wait_time)
+                    attempt += 1
+                    continue
+                raise APIError(f"Network error while accessing {url}: {e}") from e
+            except httpx.HTTPError as e:
+                raise APIError(f"Network error while accessing {url}: {e}") from e
+
+        if resp is None:
+            raise APIError(f"Request to {url} did not produce a response")
+        return self._parse_response(resp, url, with_etag, ok=resp.is_success)
+
+
+def _page_endpoint(endpoint: str, page: int) -> str:
+    """Append a ``page=`` query parameter to ``endpoint``."""
+    separator = "&" if "?" in endpoint else "?"
+    return f"{endpoint}{separator}page={page}"
+
+
+def iter_task_pages(
+    client: APIClient,
+    endpoint: str,
+    prefetch: bool = True,
+    page_size: int | None = None,
+    fields: Collection[str] | None = None,
+) -> Iterator[list[dict]]:
+    """
+    Yield the ``tasks`` array of each page of a paginated ClickUp task endpoint.
+
+    Follows ``page=0, 1, …`` until a response reports ``last_page`` or returns
+    no tasks. A missing flag counts as the last page, unless ``page_size`` is
+    given: then a full page means another may follow (for endpoints such as
+    ``/team/{id}/task`` that don't always report ``last_page``). With ``prefetch`` the
+    next page is requested on a background thread as soon as the current one
+    arrives, so its network round-trip overlaps the caller's processing of the
+    page just yielded.
+
+    With ``fields``, clients that offer ``stream()`` (ClickUpAPIClient) parse
+    each page as it downloads and keep only those keys of every task, instead
+    of loading the whole page into memory first; other clients fall back to
+    ``get()`` and full tasks.
+
+    Args:
+        client: API client used for the requests
+        endpoint: Task endpoint including any query string, without ``page``
+            (e.g. ``/list/123/task?archived=false&subtasks=true``)
+        prefetch: Fetch the next page while the current one is processed
+        page_size: The endpoint's page size, used when ``last_page`` is absent
+        fields: Task keys to keep when pages are streamed (None: no streaming)
+
+    Yields:
+        Non-empty lists of raw task dicts, one per page
+
+    Raises:
+        APIError: Propagated from the client for any failed page request
+    """
+
+    stream = getattr(client, "stream", None) if fields is not None else None
+
+    def fetch(page: int) -> dict:
+        if stream is not None:
+            parsed = stream(_page_endpoint(endpoint, page), "tasks", fields)
+            # ClickUp sends last_page after the tasks array, so the page has to
+            # be read to the end before pagination can continue; streaming
+            # saves memory (projected tasks), not time to the first task.
+            tasks = list(parsed)
+            return {**parsed.extras, "tasks": tasks}
+        response = client.get(_page_endpoint(endpoint, page))
+        return response if isinstance(response, dict) else {}
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = 0
+        response = fetch(page)
+        while True:
+            tasks = response.get("tasks") or []
+            if not tasks:
+                return
+            is_last = response.get(
+                "last_page", page_size is None or len(tasks) < page_size
+            )
+            pending: Future | None = None
+            if not is_last and executor is not None:
+                pending = executor.submit(fetch, page + 1)
+
+            yield tasks
+
+            if is_last:
+                return
+            page += 1
+            response = pending.result() if pending is not None else fetch(page)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
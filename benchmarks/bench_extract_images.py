@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark: extract_images, four findall passes vs. one compiled scan
+
+Contains:
+- legacy_extract_images(): the previous four-pattern implementation
+- make_description(): a large generated HTML task description with images
+- run(): extracts images from the same descriptions with each approach and
+  reports the time per description, for ASCII and for non-ASCII text (every
+  reference the scanner returns is checked to be a full match of one of the
+  legacy patterns)
+
+Run from the repository root:
+
+    python benchmarks/bench_extract_images.py --count 200 --size 50000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+
+from mappers import extract_images  # noqa: E402
+
+LEGACY_PATTERNS = [
+    r"!\[.*?\]\(.*?\)",
+    r"<img[^>]*>",
+    r"https?://[^\s]*\.(jpg|jpeg|png|gif|bmp|webp)",
+    r"attachment[s]?[:.]?[^\s]*\.(jpg|jpeg|png|gif|bmp|webp)",
+]
+
+_WORDS = (
+    "the branch reported that the printer queue stalls after the nightly update "
+    "please check the logs and confirm whether the fix resolves it for everyone"
+).split()
+
+
+def legacy_extract_images(text: str) -> str:
+    """extract_images before the single-pass scanner (for comparison)."""
+    if not text:
+        return ""
+    images = []
+    for pat in LEGACY_PATTERNS:
+        images += re.findall(pat, text, re.IGNORECASE)
+    return "; ".join(images)
+
+
+def make_description(rng: random.Random, size: int) -> str:
+    """Return about ``size`` characters of HTML prose with image references."""
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.01:
+            part = f'<img src="https://cdn.example.com/u/{rng.randrange(50)}.png" alt="shot">'
+        elif roll < 0.02:
+            part = f"![screenshot](https://example.com/s/{rng.randrange(50)}.jpg)"
+        elif roll < 0.03:
+            part = f"https://files.example.com/a/{rng.randrange(50)}.gif"
+        elif roll < 0.035:
+            part = f"attachment:photo_{rng.randrange(50)}.jpeg"
+        elif roll < 0.06:
+            part = f'<a href="https://example.com/ticket/{rng.randrange(1000)}">ticket</a>'
+        elif roll < 0.09:
+            part = "</p><p>"
+        else:
+            part = rng.choice(_WORDS)
+        parts.append(part)
+        length += len(part) + 1
+    return "<p>" + " ".join(parts) + "</p>"
+
+
+def _time(fn: Callable[[], list[str]]) -> tuple[float, list[str]]:
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def _check(texts: list[str], results: list[str]) -> None:
+    """Every extracted reference must be a whole legacy-pattern match."""
+    for text, result in zip(texts, results):
+        legacy = {
+            m.group()
+            for pat in LEGACY_PATTERNS
+            for m in re.finditer(pat, text, re.IGNORECASE)
+        }
+        references = result.split("; ") if result else []
+        if len(references) != len(set(references)) or not set(references) <= legacy:
+            raise AssertionError("Scanner returned a reference the legacy patterns do not match")
+
+
+def run(count: int, size: int) -> None:
+    rng = random.Random(0)
+    ascii_texts = [make_description(rng, size) for _ in range(count)]
+
+    table = Table(title=f"extract_images over {count:,} descriptions of ~{size:,} chars")
+    for column in ("Text", "Implementation", "Per description", "References", "Speedup"):
+        table.add_column(column, justify="left" if column in ("Text", "Implementation") else "right")
+    for label, texts in (
+        ("ASCII", ascii_texts),
+        ("Non-ASCII", [text.replace("queue", "file d'attente é") for text in ascii_texts]),
+    ):
+        legacy_s, legacy = _time(lambda: [legacy_extract_images(t) for t in texts])
+        scan_s, scanned = _time(lambda: [extract_images(t) for t in texts])
+        _check(texts, scanned)
+        for name, seconds, results in (
+            ("Legacy (4 passes)", legacy_s, legacy),
+            ("Single-pass scanner", scan_s, scanned),
+        ):
+            references = sum(len(r.split("; ")) for r in results if r)
+            table.add_row(
+                label,
+                name,
+                f"{seconds / count * 1e3:.2f} ms",
+                f"{references:,}",
+                f"{legacy_s / seconds:.1f}x",
+            )
+    Console().print(table)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--size", type=int, default=50_000, help="Characters per description")
+    args = parser.parse_args()
+    run(args.count, args.size)
+
+
+if __name__ == "__main__":
+    main()
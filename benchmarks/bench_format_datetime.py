@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark: format_datetime, character loop vs. compiled format
+
+Contains:
+- legacy_format_datetime(): the previous per-character implementation
+- run(): formats the same datetimes with each approach and reports the time
+  per call (the compiled outputs are checked against the legacy ones)
+
+Run from the repository root:
+
+    python benchmarks/bench_format_datetime.py --count 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+
+from config import (  # noqa: E402
+    DISPLAY_FORMAT,
+    TIMESTAMP_FORMAT,
+    format_datetime,
+)
+
+
+def legacy_format_datetime(dt: datetime, format_string: str) -> str:
+    """format_datetime before formats were compiled (for comparison)."""
+    result = ""
+    i = 0
+
+    hour_12 = dt.hour % 12
+    if hour_12 == 0:
+        hour_12 = 12
+
+    while i < len(format_string):
+        if format_string[i] == "%":
+            if i + 1 < len(format_string):
+                code = format_string[i : i + 2]
+                if code == "%m":
+                    result += str(dt.month)
+                elif code == "%d":
+                    result += str(dt.day)
+                elif code == "%I":
+                    result += str(hour_12)
+                else:
+                    result += dt.strftime(code)
+                i += 2
+            else:
+                result += format_string[i]
+                i += 1
+        else:
+            result += format_string[i]
+            i += 1
+
+    return result
+
+
+def _time(fn: Callable[[], list[str]]) -> tuple[float, list[str]]:
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def run(count: int) -> None:
+    rng = random.Random(0)
+    start = datetime(2024, 1, 1)
+    dts = [start + timedelta(minutes=rng.randrange(2 * 365 * 24 * 60)) for _ in range(count)]
+
+    table = Table(title=f"format_datetime over {count:,} datetimes")
+    for column in ("Format", "Legacy loop", "Compiled", "Speedup"):
+        table.add_column(column, justify="left" if column == "Format" else "right")
+
+    for fmt in (DISPLAY_FORMAT, "%m/%d/%Y", TIMESTAMP_FORMAT):
+        legacy_s, expected = _time(lambda: [legacy_format_datetime(dt, fmt) for dt in dts])
+        compiled_s, compiled = _time(lambda: [format_datetime(dt, fmt) for dt in dts])
+        if expected != compiled:
+            raise AssertionError(f"Output differs for {fmt!r}")
+        table.add_row(
+            fmt,
+            f"{legacy_s / count * 1e6:.2f} µs",
+            f"{compiled_s / count * 1e6:.2f} µs",
+            f"{legacy_s / compiled_s:.1f}x",
+        )
+    Console().print(table)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    run(args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark: per-list crawl vs. team query (--task-query Lists / Team)
+
+Contains:
+- SimulatedClickUp: offline API client serving a generated space with a fixed
+  per-request latency, counting requests by endpoint kind
+- run(): one extraction per strategy, reporting requests and wall time
+
+Detail requests are taken out of the picture (ListPayload mode with complete
+list payloads), so the numbers isolate how tasks are *listed*. Run from the
+repository root:
+
+    python benchmarks/bench_task_query.py --lists 40 --tasks-per-list 15
+"""
+
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+
+from config import ClickUpConfig, TaskFetchMode, TaskQueryMode  # noqa: E402
+from extractor import TEAM_TASK_PAGE_SIZE, ClickUpTaskExtractor  # noqa: E402
+
+LIST_PAGE_SIZE = 100
+
+
+class SimulatedClickUp:
+    """Serve one workspace/space with ``lists`` x ``tasks_per_list`` tasks."""
+
+    def __init__(self, lists: int, tasks_per_list: int, latency: float) -> None:
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self.lists = [{"id": f"L{i}", "name": f"List {i}"} for i in range(lists)]
+        self.tasks = {
+            list_item["id"]: [
+                {
+                    "id": f"{list_item['id']}-T{n}",
+                    "name": f"Task {n} of {list_item['name']}",
+                    "archived": False,
+                    "status": {"status": "open"},
+                    "priority": {"priority": 2},
+                    "due_date": "1760000000000",
+                    "description": "Benchmark task",
+                    "custom_fields": [],
+                    "date_created": "1759838400000",
+                    "date_updated": "1759838400000",
+                    "list": {"id": list_item["id"]},
+                }
+                for n in range(tasks_per_list)
+            ]
+            for list_item in self.lists
+        }
+
+    @staticmethod
+    def _page(tasks: list[dict], page: int, size: int) -> dict:
+        chunk = tasks[page * size : (page + 1) * size]
+        return {"tasks": chunk, "last_page": (page + 1) * size >= len(tasks)}
+
+    def get(self, endpoint: str) -> Any:
+        path = urlsplit(endpoint).path
+        query = parse_qs(urlsplit(endpoint).query)
+        page = int(query.get("page", ["0"])[0])
+        kind = path.split("/")[1] + ("/task" if path.endswith("/task") else "")
+        with self._lock:
+            self.calls[kind] += 1
+        time.sleep(self.latency)
+
+        if path == "/team":
+            return {"teams": [{"id": "team1", "name": "Bench"}]}
+        if path == "/team/team1/space":
+            return {"spaces": [{"id": "space1", "name": "Space"}]}
+        if path == "/space/space1/folder":
+            return {"folders": []}
+        if path == "/space/space1/list":
+            return {"lists": self.lists}
+        if path == "/team/team1/task":
+            every = [task for tasks in self.tasks.values() for task in tasks]
+            return {"tasks": self._page(every, page, TEAM_TASK_PAGE_SIZE)["tasks"]}
+        if path.startswith("/list/") and path.endswith("/task"):
+            return self._page(self.tasks[path.split("/")[2]], page, LIST_PAGE_SIZE)
+        if path.startswith("/list/"):
+            return {"custom_fields": []}
+        raise KeyError(endpoint)
+
+
+class _BenchExtractor(ClickUpTaskExtractor):
+    def export(self, tasks) -> None:  # type: ignore[override]
+        self.exported = tasks
+
+
+def run(lists: int, tasks_per_list: int, latency: float) -> None:
+    results = []
+    for mode in (TaskQueryMode.LISTS, TaskQueryMode.TEAM):
+        api = SimulatedClickUp(lists, tasks_per_list, latency)
+        config = ClickUpConfig(
+            api_key="bench",
+            workspace_name="Bench",
+            space_name="Space",
+            task_fetch_mode=TaskFetchMode.LIST_PAYLOAD,
+            task_query=mode,
+        )
+        extractor = _BenchExtractor(config, api)
+        quiet = Console(file=io.StringIO())
+        started = time.perf_counter()
+        with patch("extractor.console", quiet):
+            extractor._fetch_and_process_tasks()
+        elapsed = time.perf_counter() - started
+        listing = api.calls["list/task"] + api.calls["team/task"]
+        results.append(
+            (mode.value, len(extractor.exported), listing, sum(api.calls.values()), elapsed)
+        )
+
+    table = Table(
+        title=f"Task listing: {lists} lists x {tasks_per_list} tasks, "
+        f"{latency * 1000:.0f} ms/request"
+    )
+    for column in ("Strategy", "Tasks", "Listing requests", "All requests", "Time"):
+        table.add_column(column, justify="right" if column != "Strategy" else "left")
+    for mode, tasks, listing, total, elapsed in results:
+        table.add_row(mode, str(tasks), str(listing), str(total), f"{elapsed:.2f}s")
+    Console().print(table)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lists", type=int, default=40)
+    parser.add_argument("--tasks-per-list", type=int, default=15)
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Seconds per simulated request"
+    )
+    args = parser.parse_args()
+    run(args.lists, args.tasks_per_list, args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,18 @@ Configuration and Data Models for ClickUp Task Extractor
 Contains:
 - ClickUpConfig dataclass for application configuration
 - TaskRecord dataclass for task export structure
-- Date/time formatting constants and utilities
+- Date/time formatting constants and utilities (compiled, cached formats)
+- Task sorting with a memoized, regex-dispatched ETA parser
 """
 
+import operator
 import os
+import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 from enum import Enum
 
 
@@ -94,6 +99,26 @@ class OutputFormat(Enum):
     MARKDOWN = "Markdown"
 
 
+class TaskFetchMode(Enum):
+    """How task fields are sourced when processing a list's tasks."""
+
+    # Always re-fetch /task/{id} for every task (original behavior).
+    DETAIL = "Detail"
+    # Use the /list/{id}/task payload directly; fetch /task/{id} only for tasks
+    # whose list payload lacks a field the export needs.
+    LIST_PAYLOAD = "ListPayload"
+
+
+class TaskQueryMode(Enum):
+    """How a space's tasks are listed before they are processed."""
+
+    # One paginated /list/{id}/task crawl per list (original behavior).
+    LISTS = "Lists"
+    # Paginated /team/{id}/task requests filtered to the space (or selected
+    # lists), grouped by list locally: far fewer requests for many small lists.
+    TEAM = "Team"
+
+
 class DateFilter(Enum):
     """Enumeration of supported date filter options."""
 
@@ -122,42 +147,112 @@ def format_datetime(dt: datetime, format_string: str) -> str:
         >>> format_datetime(dt, '%m/%d/%Y at %I:%M %p')
         '1/8/2025 at 9:30 AM'
     """
-    # Parse the format string and build result, handling %m, %d, %I specially
-    result = ""
-    i = 0
+    return "".join(
+        [
+            segment if segment.__class__ is str else segment(dt)
+            for segment in _compile_format(format_string)
+        ]
+    )
+
+
+def _month(dt: datetime) -> str:
+    return str(dt.month)
+
+
+def _day(dt: datetime) -> str:
+    return str(dt.day)
+
+
+def _hour_12(dt: datetime) -> str:
+    return str(dt.hour % 12 or 12)
+
+
+def _year(dt: datetime) -> str:
+    # Years before 1000 are padded differently across C libraries.
+    return str(dt.year) if dt.year >= 1000 else dt.strftime("%Y")
+
+
+def _hour_24(dt: datetime) -> str:
+    return f"{dt.hour:02d}"
+
+
+def _minute(dt: datetime) -> str:
+    return f"{dt.minute:02d}"
+
+
+def _second(dt: datetime) -> str:
+    return f"{dt.second:02d}"
+
+
+def _am_pm_renderer() -> Callable[[datetime], str]:
+    # The locale's AM/PM strings, looked up when a format is compiled.
+    am, pm = datetime(2000, 1, 1, 0).strftime("%p"), datetime(2000, 1, 1, 12).strftime("%p")
+    return lambda dt: pm if dt.hour >= 12 else am
+
+
+# Directives rendered without strftime: %m/%d/%I without leading zeros (the
+# point of format_datetime) and the common zero-padded ones.
+_DIRECT_DIRECTIVES: dict[str, Callable[[datetime], str]] = {
+    "%m": _month,
+    "%d": _day,
+    "%I": _hour_12,
+    "%Y": _year,
+    "%H": _hour_24,
+    "%M": _minute,
+    "%S": _second,
+}
+# Directives that may share one strftime call with neighboring text (the
+# E/O modifiers change the meaning of the following letter, so they don't).
+_MERGEABLE_DIRECTIVE_RE = re.compile(r"%[A-DF-NP-Za-z%]")
 
-    hour_12 = dt.hour % 12
-    if hour_12 == 0:
-        hour_12 = 12
 
+@lru_cache(maxsize=64)
+def _compile_format(format_string: str) -> tuple[str | Callable[[datetime], str], ...]:
+    """
+    Split a format string into segments for format_datetime.
+
+    Each segment is a literal string or a callable taking the datetime: a
+    direct renderer (``_DIRECT_DIRECTIVES``, ``%p``), or one ``strftime``
+    call covering a run of other directives and literal text. Other ``%``
+    pairs (e.g. ``%-``) are rendered by strftime on their own, exactly as the
+    character loop did.
+    """
+    segments: list[str | Callable[[datetime], str]] = []
+    run = ""  # Pending text for one strftime call
+    run_has_directive = False
+
+    def flush() -> None:
+        nonlocal run, run_has_directive
+        if run:
+            segments.append(
+                operator.methodcaller("strftime", run) if run_has_directive else run
+            )
+        run, run_has_directive = "", False
+
+    i = 0
     while i < len(format_string):
-        if format_string[i] == "%":
-            if i + 1 < len(format_string):
-                code = format_string[i : i + 2]
-                if code == "%m":
-                    # Month without leading zero
-                    result += str(dt.month)
-                    i += 2
-                elif code == "%d":
-                    # Day without leading zero
-                    result += str(dt.day)
-                    i += 2
-                elif code == "%I":
-                    # 12-hour format without leading zero
-                    result += str(hour_12)
-                    i += 2
-                else:
-                    # Other format codes - use strftime for this char
-                    result += dt.strftime(code)
-                    i += 2
+        code = format_string[i : i + 2]
+        if code in _DIRECT_DIRECTIVES or code == "%p":
+            flush()
+            segments.append(
+                _am_pm_renderer() if code == "%p" else _DIRECT_DIRECTIVES[code]
+            )
+            i += 2
+        elif len(code) == 2 and code[0] == "%":
+            if _MERGEABLE_DIRECTIVE_RE.fullmatch(code):
+                run += code
+                run_has_directive = True
             else:
-                result += format_string[i]
-                i += 1
+                flush()
+                segments.append(operator.methodcaller("strftime", code))
+            i += 2
         else:
-            result += format_string[i]
+            # Literal text (a trailing lone "%" stays literal too)
+            run += "%%" if code == "%" else format_string[i]
+            run_has_directive = run_has_directive or code == "%"
             i += 1
-
-    return result
+    flush()
+    return tuple(segments)
 
 
 def default_output_path() -> str:
@@ -226,60 +321,113 @@ def sort_tasks_by_priority_and_eta(tasks: list["TaskRecord"]) -> list["TaskRecor
         >>> sorted_tasks = sort_tasks_by_priority_and_eta(tasks)
         >>> # Result: [Urgent-Zebra (2/15), Urgent-Alpha (2/20), High-Beta (2/10)]
     """
+    return sorted(tasks, key=_priority_eta_sort_key)
 
-    def parse_eta(eta_str: str) -> tuple[int, datetime]:
-        """
-        Parse ETA string to datetime object for comparison.
-
-        Returns a tuple of (sort_priority, datetime_obj):
-        - sort_priority: 0 for valid ETA (sorts first), 1 for missing ETA (sorts last)
-        - datetime_obj: parsed datetime (always returns datetime.max for invalid/missing)
-        """
-        if not eta_str or not eta_str.strip():
-            return (1, datetime.max)  # Missing ETA sorts last
-
-        eta_normalized = eta_str.strip()
-
-        try:
-            # Try parsing with DISPLAY_FORMAT pattern (e.g., "2/15/2026 at 3:45 PM")
-            parsed_dt = datetime.strptime(eta_normalized, DISPLAY_FORMAT)
-            return (0, parsed_dt)
-        except ValueError:
-            try:
-                # Try parsing with month/day/year format without time (e.g., "2/15/2026")
-                parsed_dt = datetime.strptime(eta_normalized, "%m/%d/%Y")
-                return (0, parsed_dt)
-            except ValueError:
-                try:
-                    # Try parsing with alternate format (e.g., "2026-02-15")
-                    parsed_dt = datetime.strptime(eta_normalized, "%Y-%m-%d")
-                    return (0, parsed_dt)
-                except ValueError:
-                    try:
-                        # Normalize trailing Z for fromisoformat compatibility
-                        if eta_normalized.endswith("Z"):
-                            eta_normalized = eta_normalized[:-1] + "+00:00"
-
-                        # Try ISO format with time (may include timezone)
-                        parsed_dt = datetime.fromisoformat(eta_normalized)
-                        # Normalize to naive datetime in UTC to avoid comparison issues
-                        if parsed_dt.tzinfo is not None:
-                            parsed_dt = parsed_dt.astimezone(timezone.utc).replace(
-                                tzinfo=None
-                            )
-                        return (0, parsed_dt)
-                    except (ValueError, AttributeError):
-                        # If all parsing fails, treat as missing
-                        return (1, datetime.max)
 
-    return sorted(
-        tasks,
-        key=lambda task: (
-            -_priority_value(task.Priority),  # Negative for descending priority order
-            *parse_eta(task.ETA),  # Unpack (sort_priority, datetime) for ETA sorting
-            task.Task.lower(),  # Tertiary sort by task name for deterministic ordering
-        ),
+# ETA shapes recognized without strptime: DISPLAY_FORMAT, month/day/year and
+# year-month-day. Anything else containing a digit goes through the full
+# strptime/fromisoformat chain once (results are memoized per string).
+_ETA_DISPLAY_RE = re.compile(
+    r"(\d{1,2})/(\d{1,2})/(\d{4})\s+at\s+(\d{1,2}):(\d{2})\s+([AP]M)", re.IGNORECASE
+)
+_ETA_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_ETA_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_ETA_MISSING = (1, datetime.max)
+
+
+@lru_cache(maxsize=8192)
+def _parse_eta(eta_str: str) -> tuple[int, datetime]:
+    """
+    Parse an ETA string into a sort key component.
+
+    Returns a tuple of (sort_priority, datetime_obj):
+    - sort_priority: 0 for valid ETA (sorts first), 1 for missing ETA (sorts last)
+    - datetime_obj: parsed datetime (always returns datetime.max for invalid/missing)
+    """
+    eta_normalized = eta_str.strip()
+    if not any(char.isdigit() for char in eta_normalized):
+        return _ETA_MISSING  # Empty, "TBD", "Invalid Date", ...
+
+    try:
+        match = _ETA_DISPLAY_RE.fullmatch(eta_normalized)
+        if match:
+            month, day, year, hour, minute, meridiem = match.groups()
+            if 1 <= int(hour) <= 12:
+                hour_24 = int(hour) % 12 + (12 if meridiem.upper() == "PM" else 0)
+                return (
+                    0,
+                    datetime(int(year), int(month), int(day), hour_24, int(minute)),
+                )
+        match = _ETA_DATE_RE.fullmatch(eta_normalized) or _ETA_ISO_DATE_RE.fullmatch(
+            eta_normalized
+        )
+        if match:
+            first, second, third = map(int, match.groups())
+            if match.re is _ETA_DATE_RE:
+                return (0, datetime(third, first, second))
+            return (0, datetime(first, second, third))
+    except ValueError:
+        pass  # Out-of-range values: let the full chain decide
+
+    return _parse_eta_slow(eta_normalized)
+
+
+def _parse_eta_slow(eta_normalized: str) -> tuple[int, datetime]:
+    """Parse an ETA with the strptime/fromisoformat chain (the pre-regex parser)."""
+    try:
+        # Try parsing with DISPLAY_FORMAT pattern (e.g., "2/15/2026 at 3:45 PM")
+        return (0, datetime.strptime(eta_normalized, DISPLAY_FORMAT))
+    except ValueError:
+        pass
+    try:
+        # Try parsing with month/day/year format without time (e.g., "2/15/2026")
+        return (0, datetime.strptime(eta_normalized, "%m/%d/%Y"))
+    except ValueError:
+        pass
+    try:
+        # Try parsing with alternate format (e.g., "2026-02-15")
+        return (0, datetime.strptime(eta_normalized, "%Y-%m-%d"))
+    except ValueError:
+        pass
+    try:
+        # Normalize trailing Z for fromisoformat compatibility
+        if eta_normalized.endswith("Z"):
+            eta_normalized = eta_normalized[:-1] + "+00:00"
+
+        # Try ISO format with time (may include timezone)
+        parsed_dt = datetime.fromisoformat(eta_normalized)
+        # Normalize to naive datetime in UTC to avoid comparison issues
+        if parsed_dt.tzinfo is not None:
+            parsed_dt = parsed_dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return (0, parsed_dt)
+    except (ValueError, AttributeError):
+        # If all parsing fails, treat as missing
+        return _ETA_MISSING
+
+
+def _priority_eta_sort_key(task: "TaskRecord") -> tuple:
+    """
+    Return the sort key of ``task`` for sort_tasks_by_priority_and_eta.
+
+    The key is stored on the record with the values it was computed from, so
+    re-sorting (e.g. export after build) reuses it until Priority, ETA or
+    Task is reassigned.
+    """
+    cached = task._sort_key
+    if (
+        cached is not None
+        and cached[0] is task.Priority
+        and cached[1] is task.ETA
+        and cached[2] is task.Task
+    ):
+        return cached[3]
+    key = (
+        -_priority_value(task.Priority),  # Negative for descending priority order
+        *(_parse_eta(task.ETA) if task.ETA else _ETA_MISSING),  # ETA, missing last
+        task.Task.lower(),  # Tertiary sort by task name for deterministic ordering
     )
+    task._sort_key = (task.Priority, task.ETA, task.Task, key)
+    return key
 
 
 def _priority_value(priority: str | None) -> int:
@@ -314,6 +462,18 @@ class ClickUpConfig:
         output_format: Export format (OutputFormat enum: MARKDOWN, HTML)
         interactive_selection: Whether to enable interactive task selection
         exclude_statuses: List of task statuses to exclude from export
+        task_fetch_mode: Task field source (TaskFetchMode enum: DETAIL, LIST_PAYLOAD)
+        task_query: How tasks are listed (TaskQueryMode enum: LISTS, TEAM)
+        async_fetch: Fetch task details on the asyncio client (all requests
+            of a list in flight on one thread) instead of a thread pool
+        stream_json: Parse task-list pages as they download, keeping only the
+            task keys the extractor reads
+        incremental: Fetch only tasks changed since the last run and reuse the
+            persisted snapshot of unchanged task records
+        ai_cache_dir: Directory for the persistent AI result caches (None
+            disables caching)
+        refresh_summaries: Regenerate AI summaries and ETAs instead of reusing
+            cached ones
 
     Example:
         >>> config = ClickUpConfig(
@@ -345,9 +505,21 @@ class ClickUpConfig:
     exclude_statuses: list[str] = field(
         default_factory=lambda: ["Blocked", "Dormant", "On Hold", "Document"]
     )
+    task_fetch_mode: TaskFetchMode = TaskFetchMode.DETAIL
+    task_query: TaskQueryMode = TaskQueryMode.LISTS
+    async_fetch: bool = False
+    stream_json: bool = False
+    incremental: bool = False
+    ai_cache_dir: str | None = None
+    refresh_summaries: bool = False
 
 
-@dataclass
+def intern_value(value: Any) -> Any:
+    """Intern a string so equal values across records share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class TaskRecord:
     """
     Data structure for task export records.
@@ -356,6 +528,11 @@ class TaskRecord:
     exported to Markdown/HTML format. It matches the structure expected by the
     export functionality and provides a clean interface for task data.
 
+    Records are slotted (no per-instance ``__dict__``) and the low-cardinality
+    columns (Company, Branch, Priority, Status) are interned, so a large
+    workspace export holds one copy of each distinct value. ``_metadata`` is
+    allocated on first access; records nothing annotates carry no dict.
+
     Attributes:
         Task: Task name/title
         Company: Company/List name where the task belongs
@@ -365,7 +542,8 @@ class TaskRecord:
         ETA: Estimated completion date/time
         Notes: Task notes, description, or AI-generated summary
         Extra: Additional information like image attachments
-        _metadata: Internal metadata for AI processing (not exported)
+        _metadata: Internal metadata for AI processing (not exported, not
+            compared); stored in the ``_meta`` slot
 
     Example:
         >>> task = TaskRecord(
@@ -385,4 +563,27 @@ class TaskRecord:
     ETA: str = ""
     Notes: str = ""
     Extra: str = ""
-    _metadata: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _meta: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (Priority, ETA, Task, key) cached by sort_tasks_by_priority_and_eta.
+    _sort_key: tuple | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.Company = intern_value(self.Company)
+        self.Branch = intern_value(self.Branch)
+        self.Priority = intern_value(self.Priority)
+        self.Status = intern_value(self.Status)
+
+    @property
+    def _metadata(self) -> dict[str, Any]:
+        """Internal metadata for the AI passes and snapshots (created on demand)."""
+        if self._meta is None:
+            self._meta = {}
+        return self._meta
+
+    @_metadata.setter
+    def _metadata(self, value: dict[str, Any]) -> None:
+        self._meta = value
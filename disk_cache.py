@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Persistent Cache Module for ClickUp Task Extractor
+
+Contains:
+- DiskCache: thread-safe, JSON-backed key/value store with LRU eviction
+- default_cache_dir helper (CLICKUP_CACHE_DIR override)
+
+The store holds one JSON file per cache. Entries carry the time they were
+written so callers can apply their own freshness rules, and the least
+recently used entries are evicted once ``max_entries`` is exceeded.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory (``CLICKUP_CACHE_DIR`` or ``~/.cache/...``)."""
+    configured = os.environ.get("CLICKUP_CACHE_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".cache" / "clickup_task_extractor"
+
+
+def configured_max_entries(env_var: str, default: int = DEFAULT_MAX_ENTRIES) -> int:
+    """Resolve a cache size bound from ``env_var`` (min 1)."""
+    try:
+        configured = int(os.environ.get(env_var, default))
+    except ValueError:
+        configured = default
+    return max(1, configured)
+
+
+class DiskCache:
+    """
+    JSON file-backed cache with per-lookup freshness and LRU eviction.
+
+    Each entry is stored as ``{"value": ..., "stored_at": <epoch seconds>}``
+    plus any extra metadata passed to :meth:`put` (e.g. an ``etag``). The file
+    is loaded lazily on first access and always rewritten atomically, so a
+    crash mid-run never leaves a truncated cache behind. A corrupt or
+    unreadable file is treated as empty.
+
+    With ``refresh=True`` every :meth:`get` misses while :meth:`put` still
+    stores, so a run re-fetches everything and leaves a warm cache for the
+    next one. With ``autosave=False`` changes are only written by
+    :meth:`flush`, for callers that store many entries in one pass.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        refresh: bool = False,
+        autosave: bool = True,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file holding the cache
+            max_entries: Entries kept before least recently used are evicted
+            refresh: Ignore stored entries on read (still write new ones)
+            autosave: Persist after every change (otherwise call flush())
+        """
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.refresh = refresh
+        self.autosave = autosave
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> OrderedDict[str, dict[str, Any]]:
+        """Return the in-memory entries, reading the file on first use."""
+        if self._entries is None:
+            entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+            try:
+                with self.path.open("r", encoding="utf-8") as handle:
+                    data = json.load(handle)
+                if isinstance(data, dict):
+                    entries.update(
+                        (key, entry)
+                        for key, entry in data.items()
+                        if isinstance(entry, dict) and "value" in entry
+                    )
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cache file {self.path}: {e}")
+            self._entries = entries
+        return self._entries
+
+    def _changed(self) -> None:
+        """Record a change and persist it now if autosaving (caller holds the lock)."""
+        self._dirty = True
+        if self.autosave:
+            self._save()
+
+    def _save(self) -> None:
+        """Atomically write the entries back to disk (caller holds the lock)."""
+        self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                json.dump(self._entries, handle)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {self.path}: {e}")
+
+    def entry(self, key: str) -> dict[str, Any] | None:
+        """
+        Return the raw stored entry for ``key`` regardless of age or refresh.
+
+        Useful for conditional revalidation (e.g. sending a stored ETag).
+        """
+        with self._lock:
+            stored = self._load().get(key)
+            return dict(stored) if stored is not None else None
+
+    def get(self, key: str, max_age: float | None = None) -> Any | None:
+        """
+        Return the cached value for ``key`` if present and fresh.
+
+        Args:
+            key: Cache key
+            max_age: Maximum entry age in seconds (None = never expires)
+
+        Returns:
+            The cached value, or None on a miss, an expired entry, or in
+            refresh mode
+        """
+        with self._lock:
+            entries = self._load()
+            stored = entries.get(key)
+            fresh = (
+                stored is not None
+                and not self.refresh
+                and (
+                    max_age is None
+                    or time.time() - stored.get("stored_at", 0) <= max_age
+                )
+            )
+            if not fresh:
+                self.misses += 1
+                return None
+            entries.move_to_end(key)
+            # Recency is persisted with the next save rather than forcing one.
+            self._dirty = True
+            self.hits += 1
+            return stored["value"]
+
+    def put(self, key: str, value: Any, **metadata: Any) -> None:
+        """
+        Store ``value`` under ``key`` and persist, evicting LRU entries.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            **metadata: Extra JSON-serializable fields kept with the entry
+        """
+        with self._lock:
+            entries = self._load()
+            entries[key] = {**metadata, "value": value, "stored_at": time.time()}
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+                self.evictions += 1
+            self._changed()
+
+    def touch(self, key: str) -> None:
+        """Mark ``key`` as freshly validated without changing its value."""
+        with self._lock:
+            entries = self._load()
+            if key in entries:
+                entries[key]["stored_at"] = time.time()
+                entries.move_to_end(key)
+                self._changed()
+
+    def flush(self) -> None:
+        """Write pending changes to disk (no-op when nothing changed)."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def clear(self) -> None:
+        """Remove every entry and delete the cache file."""
+        with self._lock:
+            self._entries = OrderedDict()
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not delete cache file {self.path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
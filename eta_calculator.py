@@ -7,14 +7,28 @@ Contains:
 - AI-powered ETA calculation for tasks without due dates
 - Priority and status-based logic for ETA estimation
 - Fallback mechanisms for when AI is unavailable
+- Fused Claude summary + ETA generation (one CLI call for both)
+- ETACache memoizing AI estimates as day offsets across runs
 """
 
+import hashlib
+import json
 import os
-from datetime import datetime, timedelta
-from typing import TypeAlias
-
-from ai_summary import run_claude_cli
-from config import AISource
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Mapping, Sequence, TypeAlias
+
+from ai_summary import (
+    _CLAUDE_FUSED_PROMPT,
+    _CLAUDE_FUSED_SYSTEM_PROMPT,
+    _CLAUDE_FUSED_TASK_BLOCK,
+    CLAUDE_SUMMARY_MODEL,
+    format_field_block,
+    get_claude_summaries,
+    parse_batch_lines,
+    run_claude_cli,
+)
+from config import AISource, format_datetime
+from disk_cache import DiskCache
 
 # Rich console imports for beautiful output
 try:
@@ -79,6 +93,44 @@ _CLAUDE_ETA_SYSTEM_PROMPT = (
     "no tool use."
 )
 
+# Single-task ETA prompts; fused summary+ETA prompts live in ai_summary.
+_CLAUDE_ETA_PROMPT = """Estimate a realistic completion date (ETA) for this task.
+
+Today's date: {today}
+
+Task: {task_name}
+Priority: {priority}
+Status: {status}
+
+Context:
+{context}
+
+Guidelines: Urgent within 1-2 days; High within 3-5 days; Normal within ~1 week;
+Low within ~2 weeks. Tasks already "in progress" or "investigating" may finish
+sooner; complex issues may need more time. Respond with ONLY a date in
+MM/DD/YYYY format."""
+
+_GEMINI_ETA_PROMPT = """You are helping estimate a completion date (ETA) for a task. Based on the task details below, suggest a realistic completion date.
+
+Today's date: {today}
+
+Task: {task_name}
+Priority: {priority}
+Status: {status}
+
+Context:
+{context}
+
+Consider:
+- Urgent tasks should be completed within 1-2 days
+- High priority tasks within 3-5 days
+- Normal priority tasks within 1 week
+- Low priority tasks within 2 weeks
+- Tasks already "in progress" or "investigating" may complete sooner
+- Complex issues described may need more time
+
+Respond with ONLY a date in MM/DD/YYYY format, nothing else. Do not include any explanations or additional text."""
+
 # Priority-based default ETA offsets (in days)
 PRIORITY_ETA_DAYS = {
     "Urgent": 1,  # 1 day for urgent tasks
@@ -124,8 +176,6 @@ def _get_fallback_eta(priority: str, status: str) -> str:
     eta_date = datetime.now() + timedelta(days=final_days)
 
     # Format as MM/DD/YYYY (without leading zeros handled by format_datetime in config.py)
-    from config import format_datetime
-
     return format_datetime(eta_date, "%m/%d/%Y")
 
 
@@ -178,26 +228,13 @@ def _try_ai_eta_calculation(
         # Current date for reference
         today = datetime.now().strftime("%m/%d/%Y")
 
-        prompt = f"""You are helping estimate a completion date (ETA) for a task. Based on the task details below, suggest a realistic completion date.
-
-Today's date: {today}
-
-Task: {task_name}
-Priority: {priority}
-Status: {status}
-
-Context:
-{context}
-
-Consider:
-- Urgent tasks should be completed within 1-2 days
-- High priority tasks within 3-5 days
-- Normal priority tasks within 1 week
-- Low priority tasks within 2 weeks
-- Tasks already "in progress" or "investigating" may complete sooner
-- Complex issues described may need more time
-
-Respond with ONLY a date in MM/DD/YYYY format, nothing else. Do not include any explanations or additional text."""
+        prompt = _GEMINI_ETA_PROMPT.format(
+            today=today,
+            task_name=task_name,
+            priority=priority,
+            status=status,
+            context=context,
+        )
 
         config = types.GenerationConfig(
             temperature=0.3,
@@ -254,12 +291,22 @@ def _extract_date_token(text: str) -> str | None:
             parsed = datetime.strptime(token, "%m/%d/%y")
         except ValueError:
             continue
-        from config import format_datetime
-
         return format_datetime(parsed, "%m/%d/%Y")
     return None
 
 
+def _eta_context(description: str = "", subject: str = "", resolution: str = "") -> str:
+    """Render the optional ETA context fields for a prompt."""
+    context_parts = []
+    if subject:
+        context_parts.append(f"Subject: {subject}")
+    if description:
+        context_parts.append(f"Description: {description}")
+    if resolution:
+        context_parts.append(f"Resolution: {resolution}")
+    return "\n".join(context_parts) if context_parts else "No additional context provided"
+
+
 def get_claude_eta(
     task_name: str,
     priority: str,
@@ -278,33 +325,16 @@ def get_claude_eta(
         A date string like ``"12/25/2026"``, or None if the CLI is unavailable,
         errors, hits a usage limit, or returns an unparseable response.
     """
-    context_parts = []
-    if subject:
-        context_parts.append(f"Subject: {subject}")
-    if description:
-        context_parts.append(f"Description: {description}")
-    if resolution:
-        context_parts.append(f"Resolution: {resolution}")
-    context = (
-        "\n".join(context_parts) if context_parts else "No additional context provided"
-    )
+    context = _eta_context(description, subject, resolution)
     today = datetime.now().strftime("%m/%d/%Y")
 
-    prompt = f"""Estimate a realistic completion date (ETA) for this task.
-
-Today's date: {today}
-
-Task: {task_name}
-Priority: {priority}
-Status: {status}
-
-Context:
-{context}
-
-Guidelines: Urgent within 1-2 days; High within 3-5 days; Normal within ~1 week;
-Low within ~2 weeks. Tasks already "in progress" or "investigating" may finish
-sooner; complex issues may need more time. Respond with ONLY a date in
-MM/DD/YYYY format."""
+    prompt = _CLAUDE_ETA_PROMPT.format(
+        today=today,
+        task_name=task_name,
+        priority=priority,
+        status=status,
+        context=context,
+    )
 
     text, _ = run_claude_cli(prompt, _CLAUDE_ETA_SYSTEM_PROMPT, label="ETA")
     if not text:
@@ -316,6 +346,85 @@ MM/DD/YYYY format."""
     return eta
 
 
+def get_claude_summaries_with_etas(
+    tasks: Sequence[tuple[str, Any, Mapping[str, Any]]],
+    progress_pause_callback: Callable[[], None] | None = None,
+) -> list[tuple[str | None, str | None]]:
+    """
+    Generate summaries and ETAs for tasks with one ``claude`` CLI call.
+
+    A due-date-less task otherwise costs two CLI processes built from nearly
+    the same fields — one in the summary pass, one in the ETA pass. Here both
+    come from a single JSON-lines reply (one line per task, so several tasks
+    can share the call). Each ETA is validated with :func:`_extract_date_token`
+    and dropped when unparseable, leaving it to the regular ETA pass; tasks
+    the reply gives no summary for fall back to :func:`get_claude_summaries`.
+    When the call itself fails every task gets ``(None, None)``.
+
+    Args:
+        tasks: ``(task_name, field_entries, eta_inputs)`` triples, where
+            ``eta_inputs`` holds the keyword arguments of get_claude_eta()
+            (priority, status, description, subject, resolution).
+        progress_pause_callback: Accepted for parity with get_claude_summary().
+
+    Returns:
+        One ``(summary, eta)`` pair per task, in order; either may be None.
+    """
+    results: list[tuple[str | None, str | None]] = [(None, None)] * len(tasks)
+    blocks: list[str] = []
+    batch_index: list[int] = []  # batch task number - 1 -> index in ``tasks``
+    for index, (task_name, field_entries, eta_inputs) in enumerate(tasks):
+        field_block = format_field_block(field_entries)
+        if not field_block:
+            results[index] = ("No content available for summary.", None)
+            continue
+        batch_index.append(index)
+        blocks.append(
+            _CLAUDE_FUSED_TASK_BLOCK.format(
+                id=len(batch_index),
+                task_name=task_name,
+                field_block=field_block,
+                priority=eta_inputs.get("priority", ""),
+                status=eta_inputs.get("status", ""),
+                context=_eta_context(
+                    eta_inputs.get("description", ""),
+                    eta_inputs.get("subject", ""),
+                    eta_inputs.get("resolution", ""),
+                ),
+            )
+        )
+    if not blocks:
+        return results
+
+    prompt = _CLAUDE_FUSED_PROMPT.format(
+        today=datetime.now().strftime("%m/%d/%Y"), task_blocks="\n\n".join(blocks)
+    )
+    text, _ = run_claude_cli(prompt, _CLAUDE_FUSED_SYSTEM_PROMPT, label="summary+ETA")
+    if text is None:
+        # The call itself failed (timeout, CLI error, usage limit); retrying
+        # it as a summary batch would most likely fail the same way.
+        return results
+    parsed = parse_batch_lines(text, len(batch_index))
+
+    missing: list[int] = []
+    for number, index in enumerate(batch_index, start=1):
+        item = parsed.get(number)
+        if item is None:
+            missing.append(index)
+            continue
+        eta = _extract_date_token(str(item.get("eta") or ""))
+        results[index] = (item["summary"], eta)
+
+    if missing:
+        summaries = get_claude_summaries(
+            [(tasks[index][0], tasks[index][1]) for index in missing],
+            progress_pause_callback,
+        )
+        for index, summary in zip(missing, summaries):
+            results[index] = (summary, None)
+    return results
+
+
 def _source_value(ai_source) -> str | None:
     """Normalize an AISource enum / string / None to its string value."""
     if ai_source is None:
@@ -436,3 +545,103 @@ def calculate_eta_with_source(
 
     # Fallback calculation based on priority and status
     return _get_fallback_eta(priority, status), False
+
+
+class ETACache:
+    """
+    Memoized AI ETA estimates, persisted in a :class:`DiskCache`.
+
+    Entries are keyed on the provider, its model and the full ``eta_inputs``
+    dict (task name, priority, status and context), so a change to the status
+    or priority — or any other input — misses and triggers a fresh estimate.
+    Each estimate is stored as a day offset from the date it was generated;
+    a hit is re-anchored to today, so a "3 days out" estimate made last week
+    still reads as 3 days out instead of a date already in the past.
+    """
+
+    def __init__(self, store: DiskCache) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            store: Backing store (its refresh flag forces re-estimation)
+        """
+        self.store = store
+        self.hits = 0
+
+    @staticmethod
+    def key(eta_inputs: Mapping[str, Any], ai_source=None) -> str:
+        """
+        Return the cache key for ``eta_inputs`` estimated by ``ai_source``.
+
+        The provider's prompts are fingerprinted (for Claude the single-task
+        and the fused summary+ETA templates, which yield interchangeable
+        ETAs), so editing a prompt never serves ETAs made with the old one.
+        Both estimates ETAs with Claude, so it shares Claude's entries.
+        """
+        source = _source_value(ai_source) or AISource.CLAUDE.value
+        if source == AISource.BOTH.value:
+            source = AISource.CLAUDE.value
+        if source == AISource.GEMINI.value:
+            model = GEMINI_MODEL
+            template = _GEMINI_ETA_PROMPT
+        else:
+            model = CLAUDE_SUMMARY_MODEL
+            template = "\n".join(
+                (
+                    _CLAUDE_ETA_SYSTEM_PROMPT,
+                    _CLAUDE_ETA_PROMPT,
+                    _CLAUDE_FUSED_SYSTEM_PROMPT,
+                    _CLAUDE_FUSED_TASK_BLOCK,
+                    _CLAUDE_FUSED_PROMPT,
+                )
+            )
+        payload = json.dumps(
+            [source, model, template, dict(eta_inputs)],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return "eta:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def has(self, eta_inputs: Mapping[str, Any], ai_source=None) -> bool:
+        """Whether :meth:`lookup` would hit, without counting it as a hit."""
+        if self.store.refresh:
+            return False
+        entry = self.store.entry(self.key(eta_inputs, ai_source))
+        return entry is not None and isinstance(entry.get("value"), dict)
+
+    def lookup(
+        self, eta_inputs: Mapping[str, Any], ai_source=None, today: date | None = None
+    ) -> str | None:
+        """Return the cached ETA re-anchored to ``today`` (MM/DD/YYYY), or None."""
+        cached = self.store.get(self.key(eta_inputs, ai_source))
+        if not isinstance(cached, dict) or "offset_days" not in cached:
+            return None
+        self.hits += 1
+        anchor = today or date.today()
+        eta_day = anchor + timedelta(days=int(cached["offset_days"]))
+        return format_datetime(
+            datetime.combine(eta_day, datetime.min.time()), "%m/%d/%Y"
+        )
+
+    def store_eta(
+        self,
+        eta_inputs: Mapping[str, Any],
+        ai_source,
+        eta: str,
+        today: date | None = None,
+    ) -> None:
+        """Remember an AI-produced ``eta`` as an offset from ``today``."""
+        try:
+            eta_date = datetime.strptime(eta, "%m/%d/%Y").date()
+        except (TypeError, ValueError):
+            return
+        anchor = today or date.today()
+        self.store.put(
+            self.key(eta_inputs, ai_source),
+            {"offset_days": (eta_date - anchor).days, "generated_on": anchor.isoformat()},
+        )
+
+    def flush(self) -> None:
+        """Persist pending entries."""
+        self.store.flush()
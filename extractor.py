@@ -5,19 +5,25 @@ Main Business Logic Module for ClickUp Task Extractor
 
 Contains:
 - ClickUpTaskExtractor class for task processing and export
+- Optional asyncio task-detail fetching (AsyncClickUpAPIClient)
 - Interactive task selection functionality
 - HTML and Markdown export with styling
 """
 
+import asyncio
 import os
 import sys
 import html
 import csv
+import json
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Callable, TypeAlias
+from typing import Any, Callable, TypeAlias
 from contextlib import contextmanager
 from pathlib import Path
+from urllib.parse import quote
 
 # Rich imports for beautiful console output
 try:
@@ -47,20 +53,42 @@ from config import (
     sort_tasks_by_priority_and_eta,
     AISource,
     CLICKUP_AI_SUMMARY_FIELD_ID,
+    intern_value,
+    TaskFetchMode,
+    TaskQueryMode,
 )
 from api_client import (
     APIClient,
     APIError,
+    AsyncAPIClient,
     AuthenticationError,
     ShardRoutingError,
+    iter_task_pages,
 )
 from ai_summary import (
     claude_generation_available,
     get_ai_summary_with_status,
+    get_claude_summaries,
     get_claude_summary,
+    summary_cache_key,
 )
-from mappers import get_yes_no_input, get_choice_input, get_date_range, extract_images, LocationMapper
-from eta_calculator import calculate_eta, calculate_eta_with_source
+from mappers import (
+    get_yes_no_input,
+    get_choice_input,
+    get_date_range,
+    extract_images,
+    DropdownOptions,
+    LocationMapper,
+)
+from eta_calculator import (
+    ETACache,
+    calculate_eta,
+    calculate_eta_with_source,
+    get_claude_summaries_with_etas,
+)
+from ai_scheduler import AIWorkScheduler
+from disk_cache import DiskCache, configured_max_entries, default_cache_dir
+from task_snapshot import TaskSnapshot
 
 # Get the directory of this script for output path resolution
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -72,6 +100,31 @@ console = Console(force_terminal=None, legacy_windows=False)
 # Type aliases for clarity
 TaskList: TypeAlias = list[TaskRecord]
 
+# Task keys _process_task reads. In TaskFetchMode.LIST_PAYLOAD a list-endpoint
+# task carrying all of them is processed as-is, without a /task/{id} request.
+LIST_PAYLOAD_REQUIRED_KEYS = (
+    "name",
+    "priority",
+    "status",
+    "due_date",
+    "description",
+    "custom_fields",
+)
+
+# Task keys read from listing responses: the LIST_PAYLOAD_REQUIRED_KEYS plus
+# what filtering, team grouping and the incremental snapshot use. Streamed
+# listings (--stream-json) keep only these.
+TASK_LISTING_KEYS = (
+    "id",
+    "archived",
+    "date_created",
+    "date_updated",
+    "list",
+    *LIST_PAYLOAD_REQUIRED_KEYS,
+)
+
+# Tasks per /team/{id}/task page (fixed by ClickUp); a shorter page is the last.
+TEAM_TASK_PAGE_SIZE = 100
 
 @contextmanager
 def export_file(file_path: str, mode: str = "w", encoding: str = "utf-8"):
@@ -116,11 +169,137 @@ def get_export_fields() -> list[str]:
     ]
 
 
+def _format_kilobytes(size: int) -> str:
+    """Format a byte count for the statistics table (e.g. ``"12.5 KB"``)."""
+    return f"{size / 1024:.1f} KB"
+
+
+def _custom_field_text(field: dict | None) -> str:
+    """Render a task custom field's value as text ("" when unset)."""
+    if not field:
+        return ""
+    value = field.get("value")
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        items: list[str] = []
+        for item in value:
+            if item is None:
+                continue
+            if isinstance(item, dict):
+                if "value" in item and item["value"] not in (None, ""):
+                    items.append(str(item["value"]))
+                elif "name" in item and item["name"] not in (None, ""):
+                    items.append(str(item["name"]))
+                else:
+                    items.append(str(item))
+            else:
+                items.append(str(item))
+        return ", ".join(items)
+    if isinstance(value, dict):
+        if "value" in value and value["value"] not in (None, ""):
+            nested_value = value["value"]
+            if isinstance(nested_value, list):
+                nested_items = [str(v) for v in nested_value if v not in (None, "")]
+                return ", ".join(nested_items)
+            return str(nested_value)
+        if "text" in value and value["text"] not in (None, ""):
+            return str(value["text"])
+    return str(value)
+
+
+def _with_placeholder(raw: str | None) -> str:
+    """Return an AI context value, or "(not provided)" when it is blank."""
+    if raw is None:
+        return "(not provided)"
+    cleaned = raw.strip() if isinstance(raw, str) else str(raw)
+    return cleaned if cleaned else "(not provided)"
+
+
+# DropdownOptions.find default: the definitions have no option for a value.
+_NO_LABEL = object()
+
+
+class _CustomFieldPlan:
+    """
+    Custom-field extraction compiled once per list for :meth:`_process_task`.
+
+    Maps the names of the fields the export reads to their slots, and indexes
+    the list's dropdown definitions (Branch) by field id, so each task is
+    mapped in one pass over its ``custom_fields`` with dictionary lookups.
+    """
+
+    # Task custom fields read by _process_task.
+    FIELD_NAMES = frozenset(
+        {
+            "Branch",
+            "Subject",
+            "Description",
+            "Resolution",
+            "Name",
+            "Phone #",
+            "Computer #",
+            "Last time tracked",
+            "Vendor",
+            "Serial Number(s)",
+            "Tracking #",
+            "RMA Number",
+        }
+    )
+
+    def __init__(self, definitions: list[dict] | None) -> None:
+        """
+        Args:
+            definitions: The list's custom field definitions (``/list/{id}``)
+        """
+        self._dropdowns: dict[str, DropdownOptions] = {}
+        for definition in definitions or []:
+            if definition.get("name") == "Branch" and definition.get("id") is not None:
+                type_config = definition.get("type_config") or {}
+                self._dropdowns[str(definition["id"])] = DropdownOptions(
+                    type_config.get("options") or []
+                )
+
+    def collect(self, task_custom_fields: list[dict]) -> dict[str, dict]:
+        """Return the task's fields the export reads, by name (last one wins)."""
+        names = self.FIELD_NAMES
+        found: dict[str, dict] = {}
+        for field in task_custom_fields:
+            name = field["name"]
+            if name in names:
+                found[name] = field
+        return found
+
+    def branch_label(self, field: dict) -> str:
+        """Map a Branch field's dropdown value to its label."""
+        value = field.get("value")
+        dropdown = self._dropdowns.get(str(field.get("id")))
+        if dropdown is not None:
+            label = dropdown.find(value, _NO_LABEL)
+            if label is not _NO_LABEL:
+                return label
+        # Field or option not among the list's (possibly cached) definitions:
+        # use the options the task carries, as they are always current.
+        type_config = field.get("type_config") or {}
+        return LocationMapper.map_location(
+            value,
+            type_config,
+            type_config.get("options") or [],
+            field_id=field.get("id"),
+        )
+
+
 class ClickUpTaskExtractor:
     """Main orchestrator class for extracting and processing ClickUp tasks."""
 
     def __init__(
-        self, config: ClickUpConfig, api_client: APIClient, load_gemini_key_func=None
+        self,
+        config: ClickUpConfig,
+        api_client: APIClient,
+        load_gemini_key_func=None,
+        async_api_client: AsyncAPIClient | None = None,
     ) -> None:
         """
         Initialize the task extractor.
@@ -129,13 +308,53 @@ class ClickUpTaskExtractor:
             config: Configuration settings
             api_client: ClickUp API client instance
             load_gemini_key_func: Optional function to load Gemini API key
+            async_api_client: Optional asyncio client; when given, task
+                details are fetched on it instead of the thread pool
         """
         self.config = config
         self.api = api_client
+        self.async_api = async_api_client
         self.load_gemini_key_func = load_gemini_key_func
         self._progress_context: Progress | None = None
         self._pause_progress_callback: Callable[[], None] | None = None
         self._ai_field_notice_emitted = False
+        # Guards the one-time notice: _process_task runs on worker threads.
+        self._ai_field_notice_lock = threading.Lock()
+        # /task/{id} requests issued this run (reported in the statistics).
+        self._detail_fetch_count = 0
+        self._detail_fetch_lock = threading.Lock()
+        # /list/{id} responses (custom fields, statuses, task_count) by list id.
+        self._list_details: dict[str, dict] = {}
+        self._fresh_list_details: set[str] = set()
+        # Task listing traffic and what the server-side filters kept out of
+        # it (reported in the statistics).
+        self._listing_bytes = 0
+        self._listing_task_count = 0
+        self._server_filtered_lists = 0
+        self._server_filter_saved_tasks = 0
+        self._client_filter_drops = 0
+        # Generated summaries keyed by summary_cache_key(); None = disabled.
+        self._summary_cache = self._open_ai_cache(
+            "ai_summaries.json", refresh=config.refresh_summaries
+        )
+        # AI ETAs memoized per eta_inputs as day offsets; None = disabled.
+        eta_store = self._open_ai_cache("ai_etas.json", refresh=config.refresh_summaries)
+        self._eta_cache = ETACache(eta_store) if eta_store is not None else None
+
+    def _open_ai_cache(self, filename: str, refresh: bool) -> DiskCache | None:
+        """Open an AI result cache in ``config.ai_cache_dir`` (None if disabled).
+
+        Entries are written in bulk at the end of each AI pass (``flush()``)
+        rather than per result, and bounded by ``AI_CACHE_MAX_ENTRIES``.
+        """
+        if not self.config.ai_cache_dir:
+            return None
+        return DiskCache(
+            Path(self.config.ai_cache_dir) / filename,
+            max_entries=configured_max_entries("AI_CACHE_MAX_ENTRIES", 2048),
+            refresh=refresh,
+            autosave=False,
+        )
 
     def run(self) -> None:
         """
@@ -205,6 +424,7 @@ class ClickUpTaskExtractor:
 
     def _fetch_and_process_tasks(self) -> None:
         """Internal method to handle the main task processing workflow."""
+        ai_stream: _AIContentRun | None = None
         try:
             with Progress(
                 SpinnerColumn(),
@@ -359,23 +579,9 @@ class ClickUpTaskExtractor:
 
                 # Fetch lists
                 task = progress.add_task("📋 Fetching lists...", total=None)
-                lists = []
-                folder_resp = self.api.get(f"/space/{space['id']}/folder")
-                if not folder_resp or not isinstance(folder_resp, dict):
-                    console.print(
-                        f"[yellow]⚠️  Unexpected folder API response: {folder_resp}[/yellow]"
-                    )
-                    folders = []
-                else:
-                    folders = folder_resp.get("folders", [])
-
-                for folder in folders:
-                    folder_lists = self.api.get(f"/folder/{folder['id']}/list")["lists"]
-                    lists.extend(folder_lists)
-                space_lists = self.api.get(f"/space/{space['id']}/list?archived=false")[
-                    "lists"
-                ]
-                lists.extend(space_lists)
+                discovery_started = time.perf_counter()
+                lists = self._discover_lists(space)
+                discovery_seconds = time.perf_counter() - discovery_started
 
                 if self.config.list_name:
                     target_list_name = self.config.list_name.strip().lower()
@@ -400,15 +606,37 @@ class ClickUpTaskExtractor:
                 console.print(
                     Panel(
                         f"[bold green]📋 Found {len(lists)} lists to process[/bold green]\n"
-                        f"[dim]Workspace: {team['name']} → Space: {space['name']}[/dim]",
+                        f"[dim]Workspace: {team['name']} → Space: {space['name']}[/dim]\n"
+                        f"[dim]Discovery time: {discovery_seconds:.2f}s[/dim]",
                         title="📊 Discovery Summary",
                         style="green",
                     )
                 )
 
+                # Only load a Gemini key when the selected source is actually
+                # Gemini; Claude/Both/ClickUp need none.
+                if (
+                    self._source_needs_gemini_key()
+                    and not self.config.gemini_api_key
+                    and self.load_gemini_key_func
+                ):
+                    # Load Gemini API key if not already set
+                    self.config.gemini_api_key = self.load_gemini_key_func()
+
+                # Without interactive selection every record is exported, so
+                # each list's records are handed to the AI pass as soon as they
+                # are built: summaries and ETAs are generated while later lists
+                # are still being fetched. Interactive mode must wait for the
+                # selection (and may only enable AI afterwards).
+                if not self.config.interactive_selection:
+                    ai_stream = self._start_ai_content()
+                    if ai_stream is not None:
+                        ai_stream.stream()
+
                 # Process tasks from all lists
                 all_tasks = []
-                custom_fields_cache = {}
+                snapshot = self._open_snapshot(space) if self.config.incremental else None
+                start_date, end_date = get_date_range(self.config.date_filter)
 
                 # Create dual progress bars: overall list progress (percentage) and per-list task progress (bar)
                 overall_task = progress.add_task(
@@ -416,15 +644,59 @@ class ClickUpTaskExtractor:
                 )
                 current_list_task = None
 
+                # Team query: list every task of the space in a few bulk pages
+                # up front and hand each list its share below.
+                team_tasks: dict[str, list[dict]] | None = None
+                if self.config.task_query == TaskQueryMode.TEAM:
+                    team_query_task = progress.add_task(
+                        "📥 Querying workspace tasks...", total=None
+                    )
+                    team_tasks, team_watermark = self._query_team_tasks(
+                        team_id, space, lists, snapshot, start_date, end_date
+                    )
+                    progress.remove_task(team_query_task)
+
                 for list_index, list_item in enumerate(lists):
                     # Remove previous list task if it exists
                     if current_list_task is not None:
                         progress.remove_task(current_list_task)
 
-                    tasks_resp = self.api.get(
-                        f"/list/{list_item['id']}/task?archived={str(self.config.include_completed).lower()}&subtasks=true"
-                    )
-                    tasks = tasks_resp.get("tasks", [])
+                    if team_tasks is not None:
+                        watermark = team_watermark
+                        tasks = fetched_tasks = team_tasks[str(list_item["id"])]
+                    else:
+                        # Follow pagination so large lists aren't cut off at
+                        # ClickUp's page size.
+                        task_endpoint = f"/list/{list_item['id']}/task?archived={str(self.config.include_completed).lower()}&subtasks=true"
+                        watermark = (
+                            snapshot.watermark(list_item["id"]) if snapshot else None
+                        )
+                        server_filters: list[str] | None = []
+                        if watermark is not None:
+                            # Incremental: only tasks changed since the last run.
+                            # Closed tasks are included so tasks completed since
+                            # then reach the filters below and leave the snapshot.
+                            task_endpoint += f"&include_closed=true&date_updated_gt={watermark}"
+                        elif snapshot is None:
+                            details = self._get_list_details(
+                                list_item["id"], fresh=True
+                            )
+                            server_filters = self._server_filter_params(
+                                [details],
+                                start_date,
+                                end_date,
+                            )
+                        if server_filters is None:
+                            # Every status of the list is filtered out.
+                            tasks = fetched_tasks = []
+                        else:
+                            task_endpoint += "".join(
+                                f"&{param}" for param in server_filters
+                            )
+                            tasks = fetched_tasks = self._list_tasks(task_endpoint)
+                        self._count_server_filter_savings(
+                            [list_item], fetched_tasks, server_filters
+                        )
 
                     # Apply filtering using list comprehensions for better performance
                     if not self.config.include_completed:
@@ -447,8 +719,9 @@ class ClickUpTaskExtractor:
                             not in exclude_statuses_lower
                         ]
 
-                    start_date, end_date = get_date_range(self.config.date_filter)
-                    if start_date and end_date:
+                    # In incremental mode the date filter is applied after the
+                    # merge, so snapshot records stay valid as the window moves.
+                    if start_date and end_date and snapshot is None:
                         tasks = [
                             t
                             for t in tasks
@@ -457,9 +730,18 @@ class ClickUpTaskExtractor:
                             <= end_date
                         ]
 
-                    console.print(
-                        f"  ✅ Found [bold cyan]{len(tasks)}[/bold cyan] tasks in list '[bold]{list_item['name']}[/bold]'"
-                    )
+                    if snapshot is None:
+                        # Tasks the server-side filters should have excluded.
+                        self._client_filter_drops += len(fetched_tasks) - len(tasks)
+
+                    if watermark is not None:
+                        console.print(
+                            f"  ✅ Found [bold cyan]{len(tasks)}[/bold cyan] changed tasks in list '[bold]{list_item['name']}[/bold]'"
+                        )
+                    else:
+                        console.print(
+                            f"  ✅ Found [bold cyan]{len(tasks)}[/bold cyan] tasks in list '[bold]{list_item['name']}[/bold]'"
+                        )
 
                     # Create per-list task progress bar (resets for each list)
                     current_list_task = progress.add_task(
@@ -468,36 +750,22 @@ class ClickUpTaskExtractor:
                     )
 
                     # Custom fields
-                    if list_item["id"] not in custom_fields_cache:
-                        list_details = self.api.get(f"/list/{list_item['id']}")
-                        list_custom_fields = list_details.get("custom_fields", [])
-                        custom_fields_cache[list_item["id"]] = list_custom_fields
-                    list_custom_fields = custom_fields_cache[list_item["id"]]
-
-                    # Process tasks with progress feedback
-                    task_records = []
-                    if tasks:
-                        for task_index, task in enumerate(tasks):
-                            name = task.get("name", "Unknown Task")
-                            task_name = name[:30] + ("..." if len(name) > 30 else "")
-
-                            # Update per-list progress description with current
-                            # task. AI summaries are generated in a later
-                            # concurrent pass, so no AI indicator here.
-                            progress.update(
-                                current_list_task,
-                                description=f"📝 Processing: [bold]{list_item['name']}[/bold] - {task_name}",
-                            )
-
-                            record = self._process_task(
-                                task, list_custom_fields, list_item
-                            )
-                            if record is not None:
-                                task_records.append(record)
+                    list_custom_fields = self._get_list_details(
+                        list_item["id"]
+                    ).get("custom_fields", [])
 
-                            # Advance per-list task progress
-                            progress.advance(current_list_task)
+                    # Process tasks with progress feedback. Detail fetches run
+                    # in a bounded thread pool; records keep list order.
+                    if tasks:
+                        task_records = self._process_tasks_concurrently(
+                            tasks,
+                            list_custom_fields,
+                            list_item,
+                            progress,
+                            current_list_task,
+                        )
                     else:
+                        task_records = []
                         # Handle empty list case - complete the progress bar
                         progress.update(
                             current_list_task,
@@ -505,7 +773,39 @@ class ClickUpTaskExtractor:
                         )
                         progress.advance(current_list_task)
 
+                    if snapshot is not None:
+                        # Tasks that passed the filters but yielded no record
+                        # failed (e.g. a detail fetch error); the snapshot
+                        # keeps their old records and re-fetches them.
+                        processed_ids = {
+                            str(record._metadata.get("task_id"))
+                            for record in task_records
+                        }
+                        task_records = snapshot.merge(
+                            list_item["id"],
+                            fetched_tasks,
+                            task_records,
+                            full_sync=watermark is None,
+                            failed_ids=[
+                                str(task.get("id"))
+                                for task in tasks
+                                if str(task.get("id")) not in processed_ids
+                            ],
+                        )
+                        if start_date and end_date:
+                            task_records = [
+                                r
+                                for r in task_records
+                                if start_date
+                                <= datetime.fromtimestamp(
+                                    int(r._metadata["date_created"]) / 1000
+                                )
+                                <= end_date
+                            ]
+
                     all_tasks.extend(task_records)
+                    if ai_stream is not None:
+                        ai_stream.add(task_records)
 
                     # Advance overall progress after completing a list
                     progress.advance(overall_task)
@@ -515,6 +815,9 @@ class ClickUpTaskExtractor:
                     progress.remove_task(current_list_task)
                 progress.remove_task(overall_task)
 
+                if snapshot is not None:
+                    snapshot.save()
+
             # The live Progress display is now closed. Drop the reference so the
             # rate-limit pause callback no-ops if invoked from the concurrent
             # summary pass below (which runs outside any live display).
@@ -531,6 +834,35 @@ class ClickUpTaskExtractor:
 
             stats_table.add_row("Lists Processed", str(len(lists)))
             stats_table.add_row("Total Tasks Found", str(len(all_tasks)))
+            stats_table.add_row("Task Detail Requests", str(self._detail_fetch_count))
+            response_cache = getattr(self.api, "cache", None)
+            if response_cache is not None:
+                stats_table.add_row(
+                    "API Cache Hits",
+                    f"{response_cache.hits} of {response_cache.hits + response_cache.misses}",
+                )
+            if snapshot is not None:
+                stats_table.add_row(
+                    "Tasks Reused From Snapshot", str(snapshot.reused_count)
+                )
+            if self._listing_bytes:
+                stats_table.add_row(
+                    "Task Listing Transfer", _format_kilobytes(self._listing_bytes)
+                )
+            if self._server_filtered_lists:
+                saved_bytes = (
+                    self._server_filter_saved_tasks
+                    * self._listing_bytes
+                    // max(1, self._listing_task_count)
+                )
+                stats_table.add_row(
+                    "Server-Side Filter Savings",
+                    f"~{self._server_filter_saved_tasks} tasks"
+                    + (f", ~{_format_kilobytes(saved_bytes)}" if saved_bytes else ""),
+                )
+                stats_table.add_row(
+                    "Dropped By Client-Side Filter", str(self._client_filter_drops)
+                )
             if self.config.include_completed:
                 stats_table.add_row(
                     "Filter", "[yellow]Including completed tasks[/yellow]"
@@ -540,16 +872,6 @@ class ClickUpTaskExtractor:
 
             console.print(stats_table)
 
-            # Handle AI summary if enabled. Only load a Gemini key when the
-            # selected source is actually Gemini; Claude/Both/ClickUp need none.
-            if (
-                self._source_needs_gemini_key()
-                and not self.config.gemini_api_key
-                and self.load_gemini_key_func
-            ):
-                # Load Gemini API key if not already set
-                self.config.gemini_api_key = self.load_gemini_key_func()
-
             # Interactive selection
             if self.config.interactive_selection and all_tasks:
                 console.print(
@@ -625,13 +947,14 @@ class ClickUpTaskExtractor:
                     )
                 )
 
-            # Generate AI summaries and ETAs concurrently for the final task set.
-            # Both passes cover interactive (selected tasks) and non-interactive
-            # (all tasks) modes and no-op when AI is disabled or the source makes
-            # no relevant call. The ETA pass only touches tasks without a due date.
-            if all_tasks:
-                self._generate_summaries_concurrently(all_tasks)
-                self._generate_etas_concurrently(all_tasks)
+            # Generate AI summaries and ETAs for the final task set on one shared
+            # pool: wait for the streamed run (non-interactive), or run it now
+            # over the selected tasks. No-ops when AI is disabled or the source
+            # makes no relevant call. ETAs only touch tasks without a due date.
+            if ai_stream is not None:
+                ai_stream.finish()
+            elif all_tasks:
+                self._generate_ai_content(all_tasks)
 
             # Export
             self.export(all_tasks)
@@ -649,8 +972,430 @@ class ClickUpTaskExtractor:
 
             console.print("[dim]" + traceback.format_exc() + "[/dim]")
             raise  # Re-raise to be caught by the outer try-catch
+        finally:
+            # Stop a streamed AI run that didn't finish (error or Ctrl+C) so
+            # no further CLI processes start; a no-op after finish().
+            if ai_stream is not None:
+                ai_stream.cancel()
+
+    def _open_snapshot(self, space: dict) -> TaskSnapshot:
+        """Load the incremental snapshot for ``space``.
+
+        The signature covers every option that changes which tasks are kept
+        or how their records are built, so a run with different options
+        starts from a full fetch instead of reusing incompatible records.
+        """
+        signature = json.dumps(
+            {
+                "include_completed": self.config.include_completed,
+                "exclude_statuses": sorted(
+                    status.lower() for status in self.config.exclude_statuses
+                ),
+                "task_fetch_mode": self.config.task_fetch_mode.value,
+                "enable_ai_summary": self.config.enable_ai_summary,
+                "ai_source": self.config.ai_source.value,
+                "ai_clickup_field_id": self.config.ai_clickup_field_id,
+            },
+            sort_keys=True,
+        )
+        return TaskSnapshot(
+            default_cache_dir() / "snapshots" / f"space_{space['id']}.json",
+            signature,
+        )
+
+    def _query_team_tasks(
+        self,
+        team_id: str,
+        space: dict,
+        lists: list[dict],
+        snapshot: TaskSnapshot | None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> tuple[dict[str, list[dict]], int | None]:
+        """List the tasks of ``lists`` with paginated ``/team/{id}/task`` requests.
+
+        One query filtered to the space (or, with ``--list``, to the selected
+        list ids) replaces a ``/list/{id}/task`` crawl per list, and the tasks
+        are grouped by their ``list.id`` locally; tasks of lists outside
+        ``lists`` are dropped, as the crawl would never have fetched them.
+
+        In incremental mode the query asks for tasks updated since the
+        *oldest* list watermark (or everything when any list is due a full
+        sync). Lists with a newer watermark just re-process a few tasks that
+        hadn't changed for them. Otherwise the status and date filters are
+        sent with the query (see :meth:`_server_filter_params`), using the
+        statuses of every list.
+
+        Returns:
+            ``(tasks by list id in list order, watermark used)``; the watermark
+            is None when the result is a full sync of every list
+        """
+        since = None
+        if snapshot is not None and lists:
+            watermarks = [snapshot.watermark(list_item["id"]) for list_item in lists]
+            if all(mark is not None for mark in watermarks):
+                since = min(watermarks)
+
+        server_filters: list[str] | None = []
+        if snapshot is None:
+            server_filters = self._server_filter_params(
+                [
+                    self._get_list_details(list_item["id"], fresh=True)
+                    for list_item in lists
+                ],
+                start_date,
+                end_date,
+            )
+
+        grouped: dict[str, list[dict]] = {
+            str(list_item["id"]): [] for list_item in lists
+        }
+        if server_filters is None:
+            # Every status of every list is filtered out.
+            self._count_server_filter_savings(lists, [], server_filters)
+            return grouped, since
+
+        include_closed = self.config.include_completed or since is not None
+        params = [
+            "subtasks=true",
+            f"include_closed={str(include_closed).lower()}",
+        ]
+        if self.config.list_name:
+            params.extend(f"list_ids[]={list_item['id']}" for list_item in lists)
+        else:
+            params.append(f"space_ids[]={space['id']}")
+        if since is not None:
+            params.append(f"date_updated_gt={since}")
+        params.extend(
+            param for param in server_filters if not param.startswith("include_closed=")
+        )
+
+        tasks = self._list_tasks(
+            f"/team/{team_id}/task?{'&'.join(params)}", page_size=TEAM_TASK_PAGE_SIZE
+        )
+        for task in tasks:
+            list_id = str((task.get("list") or {}).get("id", ""))
+            if list_id in grouped:
+                grouped[list_id].append(task)
+        self._count_server_filter_savings(
+            lists, [task for group in grouped.values() for task in group], server_filters
+        )
+        return grouped, since
+
+    def _get_list_details(self, list_id: str, fresh: bool = False) -> dict:
+        """Return the ``/list/{id}`` response, fetched once per run.
+
+        ``/list/{id}`` is served from the response cache for up to an hour;
+        with ``fresh`` it is fetched bypassing the cache (when the client
+        supports it), as for the status whitelist of the server-side filters,
+        where a status added since would silently drop its tasks.
+        """
+        if fresh and list_id not in self._fresh_list_details:
+            get_fresh = getattr(self.api, "get_fresh", self.api.get)
+            self._list_details[list_id] = get_fresh(f"/list/{list_id}")
+            self._fresh_list_details.add(list_id)
+        elif list_id not in self._list_details:
+            self._list_details[list_id] = self.api.get(f"/list/{list_id}")
+        return self._list_details[list_id]
+
+    def _list_tasks(self, endpoint: str, page_size: int | None = None) -> list[dict]:
+        """Fetch every page of a task listing, counting tasks and bytes received.
+
+        The pages are only collected here, so there is no processing for a
+        next-page prefetch to overlap with; they are fetched serially.
+        """
+        bytes_before = getattr(self.api, "bytes_received", 0)
+        fields = TASK_LISTING_KEYS if self.config.stream_json else None
+        tasks = [
+            task
+            for page_tasks in iter_task_pages(
+                self.api, endpoint, prefetch=False, page_size=page_size, fields=fields
+            )
+            for task in page_tasks
+        ]
+        self._listing_bytes += getattr(self.api, "bytes_received", 0) - bytes_before
+        self._listing_task_count += len(tasks)
+        return tasks
+
+    def _server_filter_params(
+        self,
+        list_details: list[dict],
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> list[str] | None:
+        """Build task-query parameters that apply the filters on ClickUp's side.
+
+        ClickUp can only *include* statuses (``statuses[]``), so the allowed
+        names are derived from the statuses configured on the lists
+        (``/list/{id}``): everything except ``exclude_statuses`` and, unless
+        completed tasks are wanted, the ``closed``-type statuses. The status
+        filter is only sent when every list reports its statuses and it
+        actually narrows the query. ``include_closed=true`` is sent with
+        ``--include-completed`` (ClickUp omits closed tasks otherwise), and
+        the date range becomes ``date_created_gt``/``date_created_lt``. The
+        client-side filters still run on the result as a safety net.
+
+        Returns:
+            Query parameters (possibly empty), or None when the filters
+            exclude every status, i.e. nothing needs to be fetched
+        """
+        params: list[str] = []
+        if self.config.include_completed:
+            params.append("include_closed=true")
+
+        excluded = {status.lower() for status in self.config.exclude_statuses}
+        allowed: dict[str, None] = {}
+        narrowed = False
+        reported = bool(list_details)
+        for details in list_details:
+            statuses = details.get("statuses") or []
+            reported = reported and bool(statuses)
+            for status in statuses:
+                name = str(status.get("status", ""))
+                if name.lower() in excluded or (
+                    not self.config.include_completed
+                    and status.get("type") == "closed"
+                ):
+                    narrowed = True
+                else:
+                    allowed[name] = None
+        if reported and narrowed:
+            if not allowed:
+                return None
+            params.extend(f"statuses[]={quote(name)}" for name in allowed)
+
+        if start_date and end_date:
+            # Exclusive bounds around the inclusive client-side range.
+            params.append(f"date_created_gt={int(start_date.timestamp() * 1000) - 1}")
+            params.append(f"date_created_lt={int(end_date.timestamp() * 1000) + 1}")
+        return params
+
+    def _count_server_filter_savings(
+        self,
+        lists: list[dict],
+        fetched_tasks: list[dict],
+        server_filters: list[str] | None,
+    ) -> None:
+        """Estimate the tasks the server-side filters kept out of a listing.
+
+        Only filters that narrow the query count (``include_closed=true``
+        widens it). The estimate compares each list's ``task_count`` from
+        ``/list/{id}`` with the tasks actually received.
+        """
+        if server_filters is not None and not any(
+            not param.startswith("include_closed=") for param in server_filters
+        ):
+            return
+        self._server_filtered_lists += len(lists)
+        expected = 0
+        for list_item in lists:
+            task_count = self._get_list_details(list_item["id"]).get("task_count")
+            if str(task_count).isdigit():
+                expected += int(task_count)
+        self._server_filter_saved_tasks += max(0, expected - len(fetched_tasks))
+
+    def _discover_lists(self, space: dict) -> list[dict]:
+        """Return every list in ``space``: folder lists first, then folderless.
+
+        The per-folder ``/folder/{id}/list`` requests and the space-level
+        ``/space/{id}/list`` request are independent, so they run concurrently
+        in a bounded pool (sized like the detail fetch). Results are merged in
+        folder order followed by the space's own lists, so the order matches a
+        serial crawl regardless of which request finishes first.
+        """
+        folder_resp = self.api.get(f"/space/{space['id']}/folder")
+        if not folder_resp or not isinstance(folder_resp, dict):
+            console.print(
+                f"[yellow]⚠️  Unexpected folder API response: {folder_resp}[/yellow]"
+            )
+            folders = []
+        else:
+            folders = folder_resp.get("folders", [])
+
+        endpoints = [f"/folder/{folder['id']}/list" for folder in folders]
+        endpoints.append(f"/space/{space['id']}/list?archived=false")
+
+        results: list[list[dict]] = [[] for _ in endpoints]
+        with ThreadPoolExecutor(
+            max_workers=self._fetch_concurrency(len(endpoints))
+        ) as executor:
+            try:
+                future_to_index = {
+                    executor.submit(self.api.get, endpoint): index
+                    for index, endpoint in enumerate(endpoints)
+                }
+                for future in as_completed(future_to_index):
+                    results[future_to_index[future]] = future.result()["lists"]
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        return [list_item for group in results for list_item in group]
+
+    def _fetch_concurrency(self, task_count: int) -> int:
+        """Resolve the worker count for the concurrent task-detail fetch.
+
+        Configurable via ``CLICKUP_FETCH_CONCURRENCY`` (default 8); clamped to
+        ``[1, task_count]``. Keep it at or below the API client's connection
+        pool size (``CLICKUP_HTTP_POOL_SIZE``) so workers reuse connections.
+        """
+        default = 8
+        try:
+            configured = int(os.environ.get("CLICKUP_FETCH_CONCURRENCY", default))
+        except ValueError:
+            configured = default
+        if configured < 1:
+            configured = 1
+        return max(1, min(configured, task_count))
+
+    def _process_tasks_concurrently(
+        self,
+        tasks: list[dict],
+        list_custom_fields: list[dict],
+        list_item: dict,
+        progress: Progress,
+        progress_task,
+    ) -> TaskList:
+        """Run :meth:`_process_task` for a list's tasks in a bounded thread pool.
+
+        Each call blocks on a ``/task/{id}`` request, so a ThreadPoolExecutor
+        overlaps the network waits. Records are returned in the original task
+        order (skipped tasks dropped); the per-list progress bar is advanced
+        from this thread as each task completes.
+        """
+        if self.async_api is not None:
+            return self._process_tasks_async(
+                tasks, list_custom_fields, list_item, progress, progress_task
+            )
+
+        total = len(tasks)
+        workers = self._fetch_concurrency(total)
+        results: list[TaskRecord | None] = [None] * total
+        field_plan = _CustomFieldPlan(list_custom_fields)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                future_to_index = {
+                    executor.submit(
+                        self._process_task,
+                        task,
+                        list_custom_fields,
+                        list_item,
+                        field_plan=field_plan,
+                    ): index
+                    for index, task in enumerate(tasks)
+                }
+                for future in as_completed(future_to_index):
+                    index = future_to_index[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as exc:  # _process_task already guards; be safe
+                        console.print(
+                            f"    [red]❌ Error processing task {tasks[index].get('id')}: {exc}[/red]"
+                        )
+                        results[index] = None
 
-    def _process_task(self, task, list_custom_fields, list_item) -> TaskRecord | None:
+                    name = tasks[index].get("name", "Unknown Task")
+                    task_name = name[:30] + ("..." if len(name) > 30 else "")
+                    progress.update(
+                        progress_task,
+                        description=f"📝 Processing: [bold]{list_item['name']}[/bold] - {task_name}",
+                    )
+                    progress.advance(progress_task)
+            except BaseException:
+                # Ctrl+C etc.: don't keep fetching the rest of the queue.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        return [record for record in results if record is not None]
+
+    def _process_tasks_async(
+        self,
+        tasks: list[dict],
+        list_custom_fields: list[dict],
+        list_item: dict,
+        progress: Progress,
+        progress_task,
+    ) -> TaskList:
+        """Fetch a list's task details on the asyncio client, then build records.
+
+        Every ``/task/{id}`` request the list needs is in flight on one event
+        loop (bounded by the client's connection limit and paced by its rate
+        limiter) instead of one blocked thread per request. Records are then
+        built from the fetched details in task order, skipping tasks whose
+        fetch failed.
+        """
+        details = asyncio.run(
+            self._fetch_task_details_async(tasks, list_item, progress, progress_task)
+        )
+        records: TaskList = []
+        field_plan = _CustomFieldPlan(list_custom_fields)
+        for task, task_detail in zip(tasks, details):
+            if task_detail is None:
+                continue
+            record = self._process_task(
+                task,
+                list_custom_fields,
+                list_item,
+                task_detail=task_detail,
+                field_plan=field_plan,
+            )
+            if record is not None:
+                records.append(record)
+        return records
+
+    async def _fetch_task_details_async(
+        self,
+        tasks: list[dict],
+        list_item: dict,
+        progress: Progress,
+        progress_task,
+    ) -> list[dict | None]:
+        """Resolve every task's detail concurrently (None where a fetch failed)."""
+        limit = getattr(self.async_api, "max_connections", None) or 64
+        semaphore = asyncio.Semaphore(limit)
+
+        async def resolve(task: dict) -> dict | None:
+            if not self._needs_task_detail(task):
+                return task
+            self._count_detail_fetch()
+            try:
+                async with semaphore:
+                    task_detail = await self.async_api.get(f"/task/{task['id']}")
+            except Exception as e:
+                console.print(f"    [red]❌ Error fetching task {task}: {e}[/red]")
+                return None
+            return self._checked_task_detail(task, task_detail)
+
+        async def tracked(task: dict) -> dict | None:
+            try:
+                return await resolve(task)
+            finally:
+                name = task.get("name", "Unknown Task")
+                task_name = name[:30] + ("..." if len(name) > 30 else "")
+                progress.update(
+                    progress_task,
+                    description=f"📝 Processing: [bold]{list_item['name']}[/bold] - {task_name}",
+                )
+                progress.advance(progress_task)
+
+        try:
+            return await asyncio.gather(*(tracked(task) for task in tasks))
+        finally:
+            # The pooled connections belong to this event loop, which
+            # asyncio.run() closes when the list is done.
+            aclose = getattr(self.async_api, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _process_task(
+        self,
+        task,
+        list_custom_fields,
+        list_item,
+        task_detail: dict | None = None,
+        field_plan: _CustomFieldPlan | None = None,
+    ) -> TaskRecord | None:
         """
         Process a single task into a TaskRecord.
 
@@ -658,21 +1403,18 @@ class ClickUpTaskExtractor:
             task: Raw task data from ClickUp API
             list_custom_fields: Custom fields definition for the list
             list_item: The list object containing name and other metadata
+            task_detail: Already-resolved task data (e.g. fetched by the
+                asyncio path); fetched via _resolve_task_detail when None
+            field_plan: The list's compiled custom-field plan; compiled from
+                list_custom_fields when None
 
         Returns:
             TaskRecord instance or None if task should be skipped
         """
         try:
-            # Fetch detailed task information (like original code)
-            try:
-                task_detail = self.api.get(f"/task/{task['id']}")
-                if not task_detail or not isinstance(task_detail, dict):
-                    console.print(
-                        f"    [yellow]⚠️ Unexpected task detail for task {task.get('id')}: {task_detail}[/yellow]"
-                    )
-                    return None
-            except Exception as e:
-                console.print(f"    [red]❌ Error fetching task {task}: {e}[/red]")
+            if task_detail is None:
+                task_detail = self._resolve_task_detail(task)
+            if task_detail is None:
                 return None
 
             task_name = task_detail.get("name", "Unnamed Task")
@@ -689,8 +1431,10 @@ class ClickUpTaskExtractor:
             else:
                 priority = "Normal"
 
-            # Get task status
-            status = task_detail.get("status", {}).get("status", "Unknown")
+            # Get task status (interned like the record columns, so the ETA
+            # inputs below share the same objects)
+            priority = intern_value(priority)
+            status = intern_value(task_detail.get("status", {}).get("status", "Unknown"))
 
             # Get due date or calculate ETA
             due_date = task_detail.get("due_date")
@@ -719,66 +1463,29 @@ class ClickUpTaskExtractor:
             resolution = ""
             notes_parts: list[str] = []
 
-            # Process custom fields from detailed task data
+            # Process custom fields from detailed task data in one pass
             task_custom_fields = task_detail.get("custom_fields", [])
-            cf = {f["name"]: f for f in task_custom_fields}
+            if field_plan is None:
+                field_plan = _CustomFieldPlan(list_custom_fields)
+            cf = field_plan.collect(task_custom_fields)
 
             # Handle Branch field (like original)
             branch_field = cf.get("Branch")
             if branch_field:
-                val = branch_field.get("value")
-                type_config = branch_field.get("type_config") or {}
-                options = type_config.get("options") or []
-                branch_value = LocationMapper.map_location(val, type_config, options)
-
-            def extract_field_value(field: dict | None) -> str:
-                if not field:
-                    return ""
-                value = field.get("value")
-                if value is None:
-                    return ""
-                if isinstance(value, str):
-                    return value
-                if isinstance(value, list):
-                    items: list[str] = []
-                    for item in value:
-                        if item is None:
-                            continue
-                        if isinstance(item, dict):
-                            if "value" in item and item["value"] not in (None, ""):
-                                items.append(str(item["value"]))
-                            elif "name" in item and item["name"] not in (None, ""):
-                                items.append(str(item["name"]))
-                            else:
-                                items.append(str(item))
-                        else:
-                            items.append(str(item))
-                    return ", ".join(items)
-                if isinstance(value, dict):
-                    if "value" in value and value["value"] not in (None, ""):
-                        nested_value = value["value"]
-                        if isinstance(nested_value, list):
-                            nested_items = [
-                                str(v) for v in nested_value if v not in (None, "")
-                            ]
-                            return ", ".join(nested_items)
-                        return str(nested_value)
-                    if "text" in value and value["text"] not in (None, ""):
-                        return str(value["text"])
-                return str(value)
+                branch_value = field_plan.branch_label(branch_field)
 
             # Build base values for key custom fields
-            subject_value = extract_field_value(cf.get("Subject"))
+            subject_value = _custom_field_text(cf.get("Subject"))
             if subject_value:
                 subject = subject_value
                 notes_parts.append(f"Subject: {subject}")
 
-            description_value = extract_field_value(cf.get("Description"))
+            description_value = _custom_field_text(cf.get("Description"))
             if description_value:
                 custom_description = description_value
                 notes_parts.append(f"Description: {custom_description}")
 
-            resolution_value = extract_field_value(cf.get("Resolution"))
+            resolution_value = _custom_field_text(cf.get("Resolution"))
             if resolution_value:
                 resolution = resolution_value
                 notes_parts.append(f"Resolution: {resolution}")
@@ -786,36 +1493,37 @@ class ClickUpTaskExtractor:
             if not custom_description and default_description:
                 notes_parts.append(f"Task Description: {default_description}")
 
-            # Prepare AI field collection with placeholders
-            def with_placeholder(raw: str | None) -> str:
-                if raw is None:
-                    return "(not provided)"
-                cleaned = raw.strip() if isinstance(raw, str) else str(raw)
-                return cleaned if cleaned else "(not provided)"
-
-            ai_field_items: list[tuple[str, str]] = []
-
-            def add_ai_field(label: str, raw_value: str | None) -> None:
-                ai_field_items.append((label, with_placeholder(raw_value)))
-
-            custom_name = extract_field_value(cf.get("Name"))
-            add_ai_field("Name", custom_name)
-            add_ai_field("Branch", branch_value)
-            add_ai_field("Phone #", extract_field_value(cf.get("Phone #")))
-            add_ai_field("Computer #", extract_field_value(cf.get("Computer #")))
-            add_ai_field("Subject", subject_value)
-            add_ai_field("Description", custom_description)
-            add_ai_field("Resolution", resolution_value)
-            add_ai_field(
-                "Last time tracked", extract_field_value(cf.get("Last time tracked"))
-            )
-            add_ai_field("Vendor", extract_field_value(cf.get("Vendor")))
-            add_ai_field(
-                "Serial Number(s)", extract_field_value(cf.get("Serial Number(s)"))
-            )
-            add_ai_field("Tracking #", extract_field_value(cf.get("Tracking #")))
-            add_ai_field("RMA Number", extract_field_value(cf.get("RMA Number")))
-            add_ai_field("Task Description", default_description)
+            # AI field collection with placeholders
+            ai_field_items: list[tuple[str, str]] = [
+                ("Name", _with_placeholder(_custom_field_text(cf.get("Name")))),
+                ("Branch", _with_placeholder(branch_value)),
+                ("Phone #", _with_placeholder(_custom_field_text(cf.get("Phone #")))),
+                (
+                    "Computer #",
+                    _with_placeholder(_custom_field_text(cf.get("Computer #"))),
+                ),
+                ("Subject", _with_placeholder(subject_value)),
+                ("Description", _with_placeholder(custom_description)),
+                ("Resolution", _with_placeholder(resolution_value)),
+                (
+                    "Last time tracked",
+                    _with_placeholder(_custom_field_text(cf.get("Last time tracked"))),
+                ),
+                ("Vendor", _with_placeholder(_custom_field_text(cf.get("Vendor")))),
+                (
+                    "Serial Number(s)",
+                    _with_placeholder(_custom_field_text(cf.get("Serial Number(s)"))),
+                ),
+                (
+                    "Tracking #",
+                    _with_placeholder(_custom_field_text(cf.get("Tracking #"))),
+                ),
+                (
+                    "RMA Number",
+                    _with_placeholder(_custom_field_text(cf.get("RMA Number"))),
+                ),
+                ("Task Description", _with_placeholder(default_description)),
+            ]
 
             base_notes = "\n".join(notes_parts)
             clickup_ai_summary = self._get_clickup_ai_summary(task_custom_fields)
@@ -823,7 +1531,7 @@ class ClickUpTaskExtractor:
             # Resolve the non-generative notes synchronously (ClickUp Summary
             # field or base notes). Generative summaries (Claude/Gemini) are
             # deferred to a single concurrent pass after all tasks are processed
-            # (see _generate_summaries_concurrently) so they don't serialize the
+            # (see _generate_ai_content) so they don't serialize the
             # per-task fetch loop. The AI inputs are stashed in _metadata below.
             notes, _ = self._apply_ai_source(
                 task_detail.get("name", ""),
@@ -841,8 +1549,8 @@ class ClickUpTaskExtractor:
 
             # Calculate ETA if not already set from due_date. Compute only the
             # deterministic (priority/status) ETA here as a baseline; an AI ETA
-            # (Claude/Gemini) is applied later in the concurrent ETA pass
-            # (_generate_etas_concurrently) so slow AI calls don't serialize this
+            # (Claude/Gemini) is applied later in the concurrent AI pass
+            # (_generate_ai_content) so slow AI calls don't serialize this
             # per-task fetch loop. eta_inputs is stashed for that pass.
             eta_inputs = None
             if eta is None:
@@ -868,8 +1576,13 @@ class ClickUpTaskExtractor:
                 Extra=extra,
             )
 
-            # Store metadata for the deferred AI passes (summary + ETA).
-            task_record._metadata = {
+            # Store metadata for the deferred AI passes (summary + ETA) and
+            # the incremental snapshot (task id / creation date). Unset values
+            # are left out; every reader uses .get().
+            metadata = {
+                "task_id": task.get("id"),
+                "date_created": task_detail.get("date_created")
+                or task.get("date_created"),
                 "task_name": task_name,
                 "ai_fields": tuple(ai_field_items),
                 "base_notes": base_notes,
@@ -877,6 +1590,9 @@ class ClickUpTaskExtractor:
                 # Present only for tasks without a due date (AI-ETA candidates).
                 "eta_inputs": eta_inputs,
             }
+            task_record._metadata = {
+                key: value for key, value in metadata.items() if value is not None
+            }
 
             return task_record
 
@@ -887,6 +1603,45 @@ class ClickUpTaskExtractor:
             traceback.print_exc()
             return None
 
+    def _resolve_task_detail(self, task: dict) -> dict | None:
+        """Return the task data to process, fetching ``/task/{id}`` if needed.
+
+        In ``TaskFetchMode.LIST_PAYLOAD`` the list-endpoint task is used as-is
+        when it carries every key in ``LIST_PAYLOAD_REQUIRED_KEYS``; otherwise
+        (and always in ``TaskFetchMode.DETAIL``) the detailed task is fetched.
+        Returns None (after printing why) when the fetch fails.
+        """
+        if not self._needs_task_detail(task):
+            return task
+
+        self._count_detail_fetch()
+        try:
+            task_detail = self.api.get(f"/task/{task['id']}")
+        except Exception as e:
+            console.print(f"    [red]❌ Error fetching task {task}: {e}[/red]")
+            return None
+        return self._checked_task_detail(task, task_detail)
+
+    def _needs_task_detail(self, task: dict) -> bool:
+        """Whether ``task`` must be re-fetched from ``/task/{id}`` (see TaskFetchMode)."""
+        return not (
+            self.config.task_fetch_mode == TaskFetchMode.LIST_PAYLOAD
+            and all(key in task for key in LIST_PAYLOAD_REQUIRED_KEYS)
+        )
+
+    def _count_detail_fetch(self) -> None:
+        with self._detail_fetch_lock:
+            self._detail_fetch_count += 1
+
+    def _checked_task_detail(self, task: dict, task_detail: Any) -> dict | None:
+        """Return a fetched task detail, or None (after warning) if it's unusable."""
+        if not task_detail or not isinstance(task_detail, dict):
+            console.print(
+                f"    [yellow]⚠️ Unexpected task detail for task {task.get('id')}: {task_detail}[/yellow]"
+            )
+            return None
+        return task_detail
+
     def _get_clickup_ai_summary(
         self, task_custom_fields: list[dict] | None
     ) -> str | None:
@@ -936,12 +1691,12 @@ class ClickUpTaskExtractor:
         misleading noise (issue #161), so the notice is suppressed.
         """
 
-        if self._ai_field_notice_emitted:
-            return
         if self.config.ai_source not in (AISource.CLICKUP, AISource.BOTH):
             return
-
-        self._ai_field_notice_emitted = True
+        with self._ai_field_notice_lock:
+            if self._ai_field_notice_emitted:
+                return
+            self._ai_field_notice_emitted = True
         console.print(
             Panel(
                 f"[yellow]⚠️  {message}[/yellow]\n"
@@ -973,11 +1728,18 @@ class ClickUpTaskExtractor:
         Returns ``(notes, generated)`` — ``generated`` is False when the CLI
         was unavailable/errored and the base notes were used instead.
         """
+        cache_key = summary_cache_key("claude", task_name, ai_field_items)
+        cached = self._summary_cache.get(cache_key) if self._summary_cache else None
+        if cached is not None:
+            return cached, True
+
         ai_notes = get_claude_summary(
             task_name,
             ai_field_items,
             progress_pause_callback=self._pause_progress_callback,
         )
+        if ai_notes and self._summary_cache is not None:
+            self._summary_cache.put(cache_key, ai_notes)
         return (ai_notes or base_notes, bool(ai_notes))
 
     def _generate_gemini_notes(
@@ -994,12 +1756,19 @@ class ClickUpTaskExtractor:
         comes from get_ai_summary_with_status() — a hard failure must not be
         counted as a generated summary (issue #160).
         """
+        cache_key = summary_cache_key("gemini", task_name, ai_field_items)
+        cached = self._summary_cache.get(cache_key) if self._summary_cache else None
+        if cached is not None:
+            return cached, True
+
         ai_notes, generated = get_ai_summary_with_status(
             task_name,
             ai_field_items,
             gemini_key,
             progress_pause_callback=self._pause_progress_callback,
         )
+        if generated and ai_notes and self._summary_cache is not None:
+            self._summary_cache.put(cache_key, ai_notes)
         return (ai_notes or base_notes, generated)
 
     def _apply_ai_source(
@@ -1058,12 +1827,13 @@ class ClickUpTaskExtractor:
             return self._generate_claude_notes(task_name, ai_field_items, base_notes)
         return base_notes, False
 
-    def _summary_concurrency(self, task_count: int) -> int:
+    def _summary_concurrency(self, task_count: int | None = None) -> int:
         """Resolve the worker count for the concurrent summary pass.
 
         Configurable via ``AI_SUMMARY_CONCURRENCY`` (default 4); clamped to
-        ``[1, task_count]`` so idle workers are never spawned. Kept conservative
-        by default to respect the Claude Max subscription / Gemini rate limits.
+        ``[1, task_count]`` so idle workers are never spawned (``None`` when
+        the job count isn't known yet). Kept conservative by default to
+        respect the Claude Max subscription / Gemini rate limits.
         """
         default = 4
         try:
@@ -1072,13 +1842,30 @@ class ClickUpTaskExtractor:
             configured = default
         if configured < 1:
             configured = 1
+        if task_count is None:
+            return configured
         return max(1, min(configured, task_count))
 
-    def _summarize_one(self, task: TaskRecord) -> tuple[str, bool]:
-        """Generate AI notes for a single task from its stashed metadata.
+    def _summary_batch_size(self) -> int:
+        """Resolve how many Claude summaries share one CLI call.
 
-        Returns ``(notes, generated)`` from :meth:`_apply_ai_source`.
+        Configurable via ``CLAUDE_SUMMARY_BATCH_SIZE`` (default 5, min 1; 1
+        sends every task in its own call). Only the Claude and Both sources
+        batch — Gemini summaries stay one request per task.
         """
+        if self.config.ai_source not in (AISource.CLAUDE, AISource.BOTH):
+            return 1
+        default = 5
+        try:
+            configured = int(os.environ.get("CLAUDE_SUMMARY_BATCH_SIZE", default))
+        except ValueError:
+            configured = default
+        return max(1, configured)
+
+    def _summary_inputs(
+        self, task: TaskRecord
+    ) -> tuple[str, list[tuple[str, str]], str, str | None]:
+        """Return ``(task_name, ai_fields, base_notes, clickup_ai_summary)`` for a task."""
         metadata = getattr(task, "_metadata", {}) or {}
         task_name = metadata.get("task_name", task.Task)
         raw_fields = metadata.get("ai_fields") or []
@@ -1091,7 +1878,14 @@ class ClickUpTaskExtractor:
             ai_fields = list(raw_fields)
         if not ai_fields:
             ai_fields = [("Notes", task.Notes or "(not provided)")]
+        return task_name, ai_fields, base_notes, clickup_ai_summary
+
+    def _summarize_one(self, task: TaskRecord) -> tuple[str, bool]:
+        """Generate AI notes for a single task from its stashed metadata.
 
+        Returns ``(notes, generated)`` from :meth:`_apply_ai_source`.
+        """
+        task_name, ai_fields, base_notes, clickup_ai_summary = self._summary_inputs(task)
         return self._apply_ai_source(
             task_name,
             ai_fields,
@@ -1100,82 +1894,195 @@ class ClickUpTaskExtractor:
             allow_generative=True,
         )
 
+    def _fusable_eta_inputs(self, task: TaskRecord) -> dict | None:
+        """Return ``eta_inputs`` when the task's AI ETA can ride on its summary call.
+
+        True for due-date-less tasks whose ETA is not already memoized; the
+        ETA pass skips tasks whose ETA was filled this way.
+        """
+        inputs = (getattr(task, "_metadata", {}) or {}).get("eta_inputs")
+        if not inputs:
+            return None
+        if self._eta_cache is not None and self._eta_cache.has(
+            inputs, self.config.ai_source
+        ):
+            return None
+        return inputs
+
+    def _summarize_batch(self, batch: list[TaskRecord]) -> list[tuple[str, bool]]:
+        """Generate AI notes for several tasks, sharing Claude CLI calls.
+
+        Tasks that resolve without Claude (Gemini source, cached summary, or a
+        ClickUp Summary field under the Both source) are settled first. Tasks
+        that also need an AI ETA get summary and ETA from one fused call
+        (:func:`get_claude_summaries_with_etas`) and have ``ETA`` set here;
+        the rest go to :func:`get_claude_summaries` together, which falls back
+        to per-task calls for anything the batch reply did not cover.
+
+        Returns one ``(notes, generated)`` pair per task, in order.
+        """
+        claude_source = self.config.ai_source in (AISource.CLAUDE, AISource.BOTH)
+        results: list[tuple[str, bool] | None] = [None] * len(batch)
+        plain: list[tuple[int, str, list[tuple[str, str]], str, str]] = []
+        fused: list[tuple[int, str, list[tuple[str, str]], str, str, dict]] = []
+        for index, task in enumerate(batch):
+            task_name, ai_fields, base_notes, clickup_ai_summary = self._summary_inputs(task)
+            if not claude_source or (
+                self.config.ai_source == AISource.BOTH
+                and (clickup_ai_summary or "").strip()
+            ):
+                results[index] = self._summarize_one(task)
+                continue
+            cache_key = summary_cache_key("claude", task_name, ai_fields)
+            cached = self._summary_cache.get(cache_key) if self._summary_cache else None
+            if cached is not None:
+                results[index] = (cached, True)
+                continue
+            eta_inputs = self._fusable_eta_inputs(task)
+            if eta_inputs:
+                fused.append(
+                    (index, task_name, ai_fields, base_notes, cache_key, eta_inputs)
+                )
+            else:
+                plain.append((index, task_name, ai_fields, base_notes, cache_key))
+
+        # (index, base_notes, cache_key, summary or None) per generated task
+        generated: list[tuple[int, str, str, str | None]] = []
+        if len(plain) == 1:
+            index, task_name, ai_fields, base_notes, cache_key = plain[0]
+            summary = get_claude_summary(
+                task_name,
+                ai_fields,
+                progress_pause_callback=self._pause_progress_callback,
+            )
+            generated.append((index, base_notes, cache_key, summary))
+        elif plain:
+            summaries = get_claude_summaries(
+                [(task_name, ai_fields) for _, task_name, ai_fields, _, _ in plain],
+                progress_pause_callback=self._pause_progress_callback,
+            )
+            for (index, _, _, base_notes, cache_key), summary in zip(plain, summaries):
+                generated.append((index, base_notes, cache_key, summary))
+
+        if fused:
+            pairs = get_claude_summaries_with_etas(
+                [(name, fields, inputs) for _, name, fields, _, _, inputs in fused],
+                progress_pause_callback=self._pause_progress_callback,
+            )
+            for job, (summary, eta) in zip(fused, pairs):
+                index, _, _, base_notes, cache_key, eta_inputs = job
+                generated.append((index, base_notes, cache_key, summary))
+                if summary is None and eta is None:
+                    # The CLI failed for this task; a separate ETA call would
+                    # most likely fail too, so the ETA pass keeps the baseline.
+                    batch[index]._metadata["ai_eta_failed"] = True
+                elif eta:
+                    task = batch[index]
+                    task.ETA = eta
+                    task._metadata["ai_eta"] = eta
+                    if self._eta_cache is not None:
+                        self._eta_cache.store_eta(eta_inputs, self.config.ai_source, eta)
+
+        for index, base_notes, cache_key, ai_notes in generated:
+            if ai_notes and self._summary_cache is not None:
+                self._summary_cache.put(cache_key, ai_notes)
+            results[index] = (ai_notes or base_notes, bool(ai_notes))
+        return results
+
     def _generate_summaries_concurrently(self, tasks: TaskList) -> None:
-        """Generate AI summaries for ``tasks`` using a bounded thread pool.
-
-        Subprocess (Claude CLI) and HTTP (Gemini) calls release the GIL, so a
-        ThreadPoolExecutor parallelizes them effectively. Results are written
-        back in original order; progress is reported from the main thread via
-        ``as_completed`` (workers never touch the Rich console directly here).
-        No-ops when AI is disabled or the source is ClickUp-only (no external
-        call). Provider skip flags (``_claude_available`` / ``_api_available``)
-        cause queued calls to short-circuit once a usage/rate limit is hit.
+        """Generate AI summaries for ``tasks`` (see :meth:`_generate_ai_content`)."""
+        self._generate_ai_content(tasks, etas=False)
+
+    def _generate_etas_concurrently(self, tasks: TaskList) -> None:
+        """Upgrade due-date-less tasks' ETAs (see :meth:`_generate_ai_content`)."""
+        self._generate_ai_content(tasks, summaries=False)
+
+    def _start_ai_content(
+        self, *, summaries: bool = True, etas: bool = True
+    ) -> "_AIContentRun | None":
+        """Begin an AI run records can be added to, or None when there is no AI work.
+
+        No-ops when AI is disabled or the source is ClickUp-only — that source
+        was already resolved synchronously in _process_task, and ClickUp has
+        no ETA field.
         """
-        if not self.config.enable_ai_summary or not tasks:
-            return
-        # ClickUp-only source was already resolved synchronously in _process_task.
+        if not self.config.enable_ai_summary:
+            return None
         if self.config.ai_source == AISource.CLICKUP:
+            return None
+        return _AIContentRun(self, summaries=summaries, etas=etas)
+
+    def _generate_ai_content(
+        self, tasks: TaskList, *, summaries: bool = True, etas: bool = True
+    ) -> None:
+        """Generate AI summaries and ETAs for ``tasks`` on one shared pool.
+
+        Summary batches and ETA jobs are queued into a single
+        :class:`AIWorkScheduler`, so both kinds run interleaved under the
+        ``AI_SUMMARY_CONCURRENCY`` limit instead of the ETA pass waiting for
+        the slowest summary call (see :class:`_AIContentRun`). No-ops when AI
+        is disabled or the source is ClickUp-only (no external call).
+
+        Args:
+            tasks: Records to generate content for
+            summaries: Generate AI summaries (Notes)
+            etas: Upgrade baseline ETAs of tasks without a due date
+        """
+        if not tasks:
             return
-        # A Claude-only run can't generate anything once the CLI is unavailable
-        # (not logged in / usage-limited); Notes already hold the fallback from
-        # _process_task. (Both still runs — it consumes the ClickUp field.)
-        if self.config.ai_source == AISource.CLAUDE and not claude_generation_available():
-            console.print(
-                "[yellow]⊘ Skipping AI summaries - the Claude CLI is unavailable "
-                "(not logged in or usage-limited); using base task notes.[/yellow]"
-            )
+        ai_run = self._start_ai_content(summaries=summaries, etas=etas)
+        if ai_run is None:
             return
+        ai_run.add(tasks)
+        ai_run.finish()
 
-        total = len(tasks)
-        workers = self._summary_concurrency(total)
+    def _print_ai_plan(
+        self, summary_count: int | None, eta_count: int | None, workers: int
+    ) -> None:
+        """Announce the AI work about to run (None counts: records still arriving)."""
+        if summary_count is None:
+            what = "🧠 Generating AI content as tasks are fetched"
+        elif summary_count and eta_count:
+            what = (
+                f"🧠 Generating AI summaries for {summary_count} task(s) and ETAs "
+                f"for {eta_count} task(s) without a due date"
+            )
+        elif summary_count:
+            what = f"🧠 Generating AI summaries for {summary_count} task(s)"
+        else:
+            what = f"📅 Estimating ETAs for {eta_count} task(s) without a due date"
+        batch_size = self._summary_batch_size()
+        batch_detail = (
+            f", {batch_size} per call"
+            if summary_count != 0 and batch_size > 1
+            else ""
+        )
         console.print(
             Panel(
-                f"[bold green]🧠 Generating AI summaries for {total} task(s) "
-                f"using [cyan]{self.config.ai_source.value}[/cyan] "
-                f"({workers} concurrent)...[/bold green]",
+                f"[bold green]{what} using [cyan]{self.config.ai_source.value}[/cyan] "
+                f"({workers} concurrent{batch_detail})...[/bold green]",
                 title="AI Processing",
                 style="green",
             )
         )
 
-        results: list[tuple[str, bool] | None] = [None] * total
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            try:
-                future_to_index = {
-                    executor.submit(self._summarize_one, task): index
-                    for index, task in enumerate(tasks)
-                }
-                completed = 0
-                for future in as_completed(future_to_index):
-                    index = future_to_index[future]
-                    try:
-                        results[index] = future.result()
-                    except Exception as exc:  # keep going; leave existing Notes
-                        console.print(
-                            f"  [yellow]⚠️ Summary failed for '{tasks[index].Task}': "
-                            f"{str(exc)[:80]}[/yellow]"
-                        )
-                        results[index] = None
-                    completed += 1
-                    console.print(
-                        f"  [dim]{completed}/{total} summaries processed[/dim]"
-                    )
-            except BaseException:
-                # Ctrl+C etc.: without cancel_futures the with-block's shutdown
-                # would still run every queued future, spawning fresh `claude`
-                # subprocesses after the user interrupted (issue #168).
-                executor.shutdown(wait=False, cancel_futures=True)
-                raise
-
-        # Write results back in original order. _apply_ai_source always returns
-        # notes (base notes on failure), so None only occurs on the unexpected
-        # exception above — leave those tasks' existing Notes untouched.
+    def _apply_summary_results(
+        self,
+        tasks: TaskList,
+        results: list[tuple[str, bool] | None],
+        cache_hits_before: int,
+    ) -> None:
+        """Write generated notes back in order and report what happened."""
+        # _apply_ai_source always returns notes (base notes on failure), so
+        # None only occurs for a failed or cancelled job — leave those tasks'
+        # existing Notes untouched.
         for index, task in enumerate(tasks):
             if results[index] is not None:
                 task.Notes = results[index][0]
 
         # Report what actually happened — "processed" is not "generated"
         # (issue #160: a fully-failed run used to end with a green success).
+        total = len(tasks)
         generated = sum(1 for r in results if r is not None and r[1])
         fell_back = sum(1 for r in results if r is not None and not r[1])
         if generated == 0:
@@ -1184,110 +2091,49 @@ class ClickUpTaskExtractor:
                 "fell back to base notes.[/yellow]"
             )
         else:
+            cached = (
+                self._summary_cache.hits - cache_hits_before
+                if self._summary_cache
+                else 0
+            )
+            cache_detail = f" ({cached} from cache)" if cached else ""
             detail = f", {fell_back} fell back to base notes" if fell_back else ""
             console.print(
                 f"✅ [bold green]AI summaries complete: {generated} of {total} "
-                f"generated{detail}.[/bold green]"
-            )
-
-    def _compute_eta_one(self, task: TaskRecord) -> tuple[str, bool] | None:
-        """Compute an AI ETA for a single task from its stashed eta_inputs.
-
-        Returns ``(eta, used_ai)`` from :func:`calculate_eta_with_source`, or
-        None when the task has no eta_inputs (it already had a due date).
-        """
-        inputs = (getattr(task, "_metadata", {}) or {}).get("eta_inputs") or {}
-        if not inputs:
-            return None
-        return calculate_eta_with_source(
-            **inputs,
-            enable_ai=True,
-            ai_source=self.config.ai_source,
-            gemini_api_key=self.config.gemini_api_key,
-        )
-
-    def _generate_etas_concurrently(self, tasks: TaskList) -> None:
-        """Upgrade due-date-less tasks' ETAs with an AI estimate, concurrently.
-
-        Only tasks without a due date carry ``eta_inputs`` (set in
-        ``_process_task``); those already have a deterministic baseline ETA, which
-        this pass overwrites with an AI estimate (Claude/Gemini per source).
-        Runs in a bounded thread pool like the summary pass. No-ops when AI is
-        disabled, the source is ClickUp-only (no ETA field), or no task needs one.
-        """
-        if not self.config.enable_ai_summary or not tasks:
-            return
-        if self.config.ai_source == AISource.CLICKUP:
-            return
-        # AI ETAs come from the Claude CLI for both the Claude and Both sources;
-        # when it's unavailable the deterministic baselines are already in place.
-        if (
-            self.config.ai_source in (AISource.CLAUDE, AISource.BOTH)
-            and not claude_generation_available()
-        ):
-            console.print(
-                "[yellow]⊘ Skipping AI ETA estimation - the Claude CLI is "
-                "unavailable (not logged in or usage-limited); keeping "
-                "deterministic baseline ETAs.[/yellow]"
+                f"generated{cache_detail}{detail}.[/bold green]"
             )
-            return
-
-        candidates = [
-            task
-            for task in tasks
-            if (getattr(task, "_metadata", {}) or {}).get("eta_inputs")
-        ]
-        if not candidates:
-            return
-
-        total = len(candidates)
-        workers = self._summary_concurrency(total)
-        console.print(
-            Panel(
-                f"[bold green]📅 Estimating ETAs for {total} task(s) without a due "
-                f"date using [cyan]{self.config.ai_source.value}[/cyan] "
-                f"({workers} concurrent)...[/bold green]",
-                title="AI Processing",
-                style="green",
-            )
-        )
-
-        results: list[tuple[str, bool] | None] = [None] * total
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            try:
-                future_to_index = {
-                    executor.submit(self._compute_eta_one, task): index
-                    for index, task in enumerate(candidates)
-                }
-                completed = 0
-                for future in as_completed(future_to_index):
-                    index = future_to_index[future]
-                    try:
-                        results[index] = future.result()
-                    except Exception as exc:  # keep the deterministic baseline ETA
-                        console.print(
-                            f"  [yellow]⚠️ ETA failed for '{candidates[index].Task}': "
-                            f"{str(exc)[:80]}[/yellow]"
-                        )
-                        results[index] = None
-                    completed += 1
-                    console.print(f"  [dim]{completed}/{total} ETAs processed[/dim]")
-            except BaseException:
-                # Ctrl+C etc.: cancel queued futures so no new `claude`
-                # subprocesses launch after the interrupt (issue #168).
-                executor.shutdown(wait=False, cancel_futures=True)
-                raise
 
+    def _apply_eta_results(
+        self,
+        pending: list[TaskRecord],
+        results: list[tuple[str, bool] | None],
+        from_cache: int,
+        from_summary: int,
+    ) -> None:
+        """Write AI ETAs back and report AI-vs-fallback counts (issue #160)."""
         # calculate_eta_with_source always returns a date (deterministic
-        # fallback on AI failure); None only on the unexpected exception above —
+        # fallback on AI failure); None only for a failed or cancelled job —
         # keep the baseline ETA in that case.
-        for index, task in enumerate(candidates):
+        for index, task in enumerate(pending):
             if results[index] is not None and results[index][0]:
                 task.ETA = results[index][0]
 
-        # Report real AI-vs-fallback counts (issue #160).
-        ai_count = sum(1 for r in results if r is not None and r[1])
+        fused = sum(
+            1
+            for index, task in enumerate(pending)
+            if results[index] is not None and task._metadata.get("ai_eta")
+        )
+        reuse_notes = []
+        if from_cache:
+            reuse_notes.append(f"{from_cache} from cache")
+        if from_summary + fused:
+            reuse_notes.append(f"{from_summary + fused} with their summary")
+        reuse_detail = f" ({', '.join(reuse_notes)})" if reuse_notes else ""
+
+        reused = from_cache + from_summary
+        ai_count = sum(1 for r in results if r is not None and r[1]) + reused
         fallback_count = sum(1 for r in results if r is not None and not r[1])
+        total = len(pending) + reused
         if ai_count == 0:
             console.print(
                 f"⚠️ [yellow]ETA estimation: 0 of {total} AI-estimated - "
@@ -1301,9 +2147,28 @@ class ClickUpTaskExtractor:
             )
             console.print(
                 f"✅ [bold green]ETA estimation complete: {ai_count} of {total} "
-                f"AI-estimated{detail}.[/bold green]"
+                f"AI-estimated{reuse_detail}{detail}.[/bold green]"
             )
 
+    def _compute_eta_one(self, task: TaskRecord) -> tuple[str, bool] | None:
+        """Compute an AI ETA for a single task from its stashed eta_inputs.
+
+        Returns ``(eta, used_ai)`` from :func:`calculate_eta_with_source`, or
+        None when the task has no eta_inputs (it already had a due date).
+        """
+        inputs = (getattr(task, "_metadata", {}) or {}).get("eta_inputs") or {}
+        if not inputs:
+            return None
+        eta, used_ai = calculate_eta_with_source(
+            **inputs,
+            enable_ai=True,
+            ai_source=self.config.ai_source,
+            gemini_api_key=self.config.gemini_api_key,
+        )
+        if used_ai and self._eta_cache is not None:
+            self._eta_cache.store_eta(inputs, self.config.ai_source, eta)
+        return eta, used_ai
+
     def interactive_include(self, tasks: TaskList) -> TaskList:
         """
         Allow user to interactively select which tasks to export.
@@ -1595,3 +2460,281 @@ h1{color:#2c5aa0;}
             sections.append("")
 
         return header + "\n".join(sections).rstrip() + "\n"
+
+
+class _AIContentRun:
+    """
+    One AI generation run over records that may arrive incrementally.
+
+    Records passed to :meth:`add` are planned at once: cached ETAs are
+    applied, and summary batches and ETA jobs are queued on a shared
+    :class:`AIWorkScheduler`. After :meth:`stream` the scheduler starts on a
+    background thread with the first records, so a producer can keep adding
+    records (e.g. while later lists are still being fetched) and AI
+    generation overlaps the network phase. :meth:`finish` waits for every
+    job, writes the results back and prints the per-kind reports; without
+    stream() it runs the scheduler on the calling thread.
+
+    With a Claude source a task's ETA job is only queued once its summary
+    batch has finished, because that batch may already have produced the ETA
+    in the same call (see :meth:`ClickUpTaskExtractor._summarize_batch`).
+    """
+
+    def __init__(
+        self, extractor: ClickUpTaskExtractor, summaries: bool, etas: bool
+    ) -> None:
+        self.extractor = extractor
+        self.source = extractor.config.ai_source
+        self.summaries = summaries
+        # A Claude-only run can't generate anything once the CLI is unavailable
+        # (not logged in / usage-limited); Notes already hold the fallback from
+        # _process_task. (Both still runs — it consumes the ClickUp field.)
+        if (
+            summaries
+            and self.source == AISource.CLAUDE
+            and not claude_generation_available()
+        ):
+            console.print(
+                "[yellow]⊘ Skipping AI summaries - the Claude CLI is unavailable "
+                "(not logged in or usage-limited); using base task notes.[/yellow]"
+            )
+            self.summaries = False
+        self.etas = etas
+        self.defer_etas = self.summaries and self.source in (
+            AISource.CLAUDE,
+            AISource.BOTH,
+        )
+        self.batch_size = extractor._summary_batch_size()
+
+        self.tasks: TaskList = []
+        self.summary_results: list[tuple[str, bool] | None] = []
+        self.summary_buffer: list[int] = []
+        self.batch_count = 0
+        self.eta_candidates = 0
+        self.eta_skipped = False
+        self.eta_pending: TaskList = []
+        self.eta_results: list[tuple[str, bool] | None] = []
+        self.eta_slots: dict[int, int] = {}  # id(task) -> index in eta_pending
+        self.eta_from_cache = 0
+        self.eta_from_summary = 0
+
+        summary_cache = extractor._summary_cache
+        self.cache_hits_before = summary_cache.hits if summary_cache else 0
+        self.scheduler = AIWorkScheduler(
+            1, {"summary": "summaries", "eta": "ETAs"}, console.print
+        )
+        self._streaming = False
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+
+    def stream(self) -> None:
+        """Start running jobs in the background as soon as records are added."""
+        self._streaming = True
+
+    def add(self, records: TaskList) -> None:
+        """Plan AI work for ``records`` and queue every full summary batch."""
+        if self._streaming and records and self._thread is None:
+            self._start()
+        start = len(self.tasks)
+        self.tasks.extend(records)
+        self.summary_results.extend([None] * len(records))
+        # ETA slots must exist before a batch that may settle them is queued.
+        if self.etas:
+            self._plan_etas(records)
+        if self.summaries:
+            self.summary_buffer.extend(range(start, len(self.tasks)))
+            while len(self.summary_buffer) >= self.batch_size:
+                self._submit_batch(self.summary_buffer[: self.batch_size])
+                del self.summary_buffer[: self.batch_size]
+
+    def _plan_etas(self, records: TaskList) -> None:
+        """Select the records that still need an AI ETA and queue or reserve them.
+
+        Only tasks without a due date carry ``eta_inputs`` (set in
+        ``_process_task``) and already hold a deterministic baseline ETA.
+        Tasks whose ETA came with their summary (fused call) are done, and
+        unchanged tasks reuse their memoized estimate (no model call), so
+        only the remaining new or changed tasks need a job.
+        """
+        extractor = self.extractor
+        for task in records:
+            metadata = getattr(task, "_metadata", {}) or {}
+            if not metadata.get("eta_inputs"):
+                continue
+            self.eta_candidates += 1
+            if metadata.get("ai_eta"):
+                self.eta_from_summary += 1
+                continue
+            cached_eta = (
+                extractor._eta_cache.lookup(metadata["eta_inputs"], self.source)
+                if extractor._eta_cache is not None
+                else None
+            )
+            if cached_eta:
+                task.ETA = cached_eta
+                self.eta_from_cache += 1
+                continue
+            if self.eta_skipped:
+                continue
+            # AI ETAs come from the Claude CLI for both the Claude and Both
+            # sources; when it's unavailable the deterministic baselines stay.
+            if (
+                self.source in (AISource.CLAUDE, AISource.BOTH)
+                and not claude_generation_available()
+            ):
+                console.print(
+                    "[yellow]⊘ Skipping AI ETA estimation - the Claude CLI is "
+                    "unavailable (not logged in or usage-limited); keeping "
+                    "deterministic baseline ETAs.[/yellow]"
+                )
+                self.eta_skipped = True
+                continue
+            slot = len(self.eta_pending)
+            self.eta_pending.append(task)
+            self.eta_results.append(None)
+            self.eta_slots[id(task)] = slot
+            self.scheduler.expect("eta", 1)
+            if not self.defer_etas:
+                self._submit_eta(slot)
+
+    def _submit_eta(self, slot: int) -> None:
+        """Queue the AI ETA job for ``eta_pending[slot]``."""
+        task = self.eta_pending[slot]
+
+        def store(result: tuple[str, bool] | None) -> None:
+            self.eta_results[slot] = result
+
+        def warn(exc: Exception) -> None:  # keep the baseline ETA
+            console.print(
+                f"  [yellow]⚠️ ETA failed for '{task.Task}': "
+                f"{str(exc)[:80]}[/yellow]"
+            )
+
+        self.scheduler.submit(
+            "eta",
+            self.extractor._compute_eta_one,
+            task,
+            expected=True,
+            on_result=store,
+            on_error=warn,
+        )
+
+    def _submit_batch(self, batch: list[int]) -> None:
+        """Queue a summary job for the tasks at ``batch`` indexes."""
+        self.batch_count += 1
+
+        def settle_etas() -> None:
+            # ETAs that rode on the batch's summary call are done, as are
+            # those whose fused call failed (baseline kept); the rest are
+            # queued now.
+            for index in batch:
+                task = self.tasks[index]
+                failed = task._metadata.pop("ai_eta_failed", False)
+                slot = self.eta_slots.get(id(task))
+                if slot is None:
+                    continue
+                if task._metadata.get("ai_eta"):
+                    self.eta_results[slot] = (task.ETA, True)
+                    self.scheduler.mark_done("eta")
+                elif failed:
+                    self.eta_results[slot] = (task.ETA, False)
+                    self.scheduler.mark_done("eta")
+                else:
+                    self._submit_eta(slot)
+
+        def store(results: list[tuple[str, bool]]) -> None:
+            for index, result in zip(batch, results):
+                self.summary_results[index] = result
+            if self.defer_etas:
+                settle_etas()
+
+        def warn(exc: Exception) -> None:  # keep going; leave existing Notes
+            names = ", ".join(f"'{self.tasks[index].Task}'" for index in batch)
+            console.print(
+                f"  [yellow]⚠️ Summary failed for {names}: {str(exc)[:80]}[/yellow]"
+            )
+            if self.defer_etas:
+                settle_etas()
+
+        self.scheduler.submit(
+            "summary",
+            self.extractor._summarize_batch,
+            [self.tasks[index] for index in batch],
+            units=len(batch),
+            on_result=store,
+            on_error=warn,
+        )
+
+    def _start(self) -> None:
+        """Run the scheduler on a background thread while records are added."""
+        workers = self.extractor._summary_concurrency()
+        self.scheduler.max_workers = workers
+        self.extractor._print_ai_plan(
+            None if self.summaries else 0, None if self.etas else 0, workers
+        )
+        self.scheduler.keep_open()
+        self._thread = threading.Thread(
+            target=self._run_in_background, name="ai-content", daemon=True
+        )
+        self._thread.start()
+
+    def _run_in_background(self) -> None:
+        try:
+            self.scheduler.run()
+        except BaseException as exc:  # re-raised on the caller's thread by finish()
+            self._error = exc
+
+    def cancel(self) -> None:
+        """Stop a background run: cancel queued jobs and wait for running ones."""
+        if self._thread is not None:
+            self.scheduler.cancel()
+            self._thread.join()
+            self._thread = None
+
+    def finish(self) -> None:
+        """Queue the last partial batch, wait for all jobs and report."""
+        if self.summary_buffer:
+            self._submit_batch(self.summary_buffer)
+            self.summary_buffer = []
+        extractor = self.extractor
+        try:
+            if self._thread is not None:
+                self.scheduler.close()
+                try:
+                    self._thread.join()
+                except BaseException:
+                    self.cancel()
+                    raise
+                self._thread = None
+                if self._error is not None:
+                    raise self._error
+            elif self.batch_count or self.eta_pending:
+                workers = extractor._summary_concurrency(
+                    self.batch_count + len(self.eta_pending)
+                )
+                self.scheduler.max_workers = workers
+                extractor._print_ai_plan(
+                    len(self.tasks) if self.batch_count else 0,
+                    len(self.eta_pending),
+                    workers,
+                )
+                self.scheduler.run()
+        finally:
+            # Keep whatever was generated, even from an interrupted run
+            # (including ETAs that came with a fused summary call).
+            if extractor._summary_cache is not None:
+                extractor._summary_cache.flush()
+            if extractor._eta_cache is not None:
+                extractor._eta_cache.flush()
+
+        if self.batch_count:
+            extractor._apply_summary_results(
+                self.tasks, self.summary_results, self.cache_hits_before
+            )
+        if self.eta_candidates and not (self.eta_skipped and not self.eta_pending):
+            extractor._apply_eta_results(
+                self.eta_pending,
+                self.eta_results,
+                self.eta_from_cache,
+                self.eta_from_summary,
+            )
@@ -170,10 +170,16 @@ from ai_summary import (  # noqa: E402
     claude_cli_available,
     mark_claude_unavailable,
 )
-from api_client import APIError, AuthenticationError, ClickUpAPIClient  # noqa: E402
+from api_client import (  # noqa: E402
+    APIError,
+    AuthenticationError,
+    ClickUpAPIClient,
+    iter_task_pages,
+)
 from auth import load_secret_with_fallback, resolve_secret_with_desktop_sdk  # noqa: E402
 from config import TaskRecord, format_datetime, sort_tasks_by_priority_and_eta  # noqa: E402
-from eta_calculator import calculate_eta, calculate_eta_with_source  # noqa: E402
+from disk_cache import DiskCache, configured_max_entries, default_cache_dir  # noqa: E402
+from eta_calculator import ETACache, calculate_eta, calculate_eta_with_source  # noqa: E402
 from logger_config import get_logger, setup_logging  # noqa: E402
 from mappers import LocationMapper  # noqa: E402
 
@@ -357,7 +363,9 @@ def load_sheets_client():
 
 def fetch_open_tasks(client: ClickUpAPIClient, list_id: str) -> list[dict]:
     """
-    Fetch all open tasks from a ClickUp list, following pagination.
+    Fetch all open tasks from a ClickUp list, following pagination
+    (api_client.iter_task_pages; pages are fetched serially, as there is no
+    per-page work for a prefetch to overlap with).
 
     The list endpoint excludes closed tasks by default; a defensive filter on
     status type is applied as well.
@@ -370,20 +378,12 @@ def fetch_open_tasks(client: ClickUpAPIClient, list_id: str) -> list[dict]:
         List of raw task dicts
     """
     tasks: list[dict] = []
-    page = 0
-    while True:
-        response = client.get(
-            f"/list/{list_id}/task?archived=false&subtasks=true&page={page}"
-        )
-        page_tasks = response.get("tasks", [])
-        if not page_tasks:
-            break
+    for page_tasks in iter_task_pages(
+        client, f"/list/{list_id}/task?archived=false&subtasks=true", prefetch=False
+    ):
         tasks.extend(
             t for t in page_tasks if t.get("status", {}).get("type") != "closed"
         )
-        if response.get("last_page", True):
-            break
-        page += 1
     return tasks
 
 
@@ -436,7 +436,10 @@ def task_to_record(task: dict, company: str) -> TaskRecord:
         type_config = branch_field.get("type_config", {})
         options = type_config.get("options", [])
         branch = LocationMapper.map_location(
-            branch_field["value"], type_config, options
+            branch_field["value"],
+            type_config,
+            options,
+            field_id=branch_field.get("id"),
         )
 
     # Tasks without a (valid) due date get a deterministic priority/status
@@ -484,7 +487,7 @@ def _eta_concurrency(task_count: int) -> int:
     return max(1, min(configured, task_count))
 
 
-def apply_ai_etas(records: list[TaskRecord]) -> None:
+def apply_ai_etas(records: list[TaskRecord], eta_cache: ETACache | None = None) -> None:
     """
     Upgrade the baseline ETAs of due-date-less records with Claude estimates.
 
@@ -494,12 +497,30 @@ def apply_ai_etas(records: list[TaskRecord]) -> None:
     Estimates run in a bounded thread pool via the local ``claude`` CLI —
     the repo-default AI source (OAuth/Max subscription, no API key).
 
+    With ``eta_cache``, candidates whose inputs are unchanged since an earlier
+    run reuse the memoized estimate and new Claude estimates are stored, so
+    repeat runs only call the model for new or changed tasks.
+
     Pre-flight mirrors main.py (issue #159): when the CLI is missing or
     confidently logged out, the pass is skipped up front so no doomed
     subprocess calls are queued. Both checks run only when there is at least
-    one candidate, so due-date-complete runs never shell out.
+    one uncached candidate, so due-date-complete runs never shell out.
     """
     candidates = [r for r in records if r._metadata.get("eta_inputs")]
+    if eta_cache is not None:
+        pending = []
+        for record in candidates:
+            cached_eta = eta_cache.lookup(record._metadata["eta_inputs"])
+            if cached_eta:
+                record.ETA = cached_eta
+            else:
+                pending.append(record)
+        if len(pending) < len(candidates):
+            console.print(
+                f"[green]✓ Reused {len(candidates) - len(pending)} cached ETA "
+                f"estimate(s).[/green]"
+            )
+        candidates = pending
     if not candidates:
         return
 
@@ -527,9 +548,12 @@ def apply_ai_etas(records: list[TaskRecord]) -> None:
     )
 
     def estimate_one(record: TaskRecord) -> tuple[str, bool]:
-        return calculate_eta_with_source(
+        eta, used_ai = calculate_eta_with_source(
             **record._metadata["eta_inputs"], enable_ai=True
         )
+        if used_ai and eta_cache is not None:
+            eta_cache.store_eta(record._metadata["eta_inputs"], None, eta)
+        return eta, used_ai
 
     generated = 0
     with ThreadPoolExecutor(max_workers=workers) as executor:
@@ -553,6 +577,9 @@ def apply_ai_etas(records: list[TaskRecord]) -> None:
             # subprocesses after the user interrupted.
             executor.shutdown(wait=False, cancel_futures=True)
             raise
+        finally:
+            if eta_cache is not None:
+                eta_cache.flush()
 
     fallback = total - generated
     detail = f", {fallback} deterministic fallback(s)" if fallback else ""
@@ -563,7 +590,10 @@ def apply_ai_etas(records: list[TaskRecord]) -> None:
 
 
 def build_records(
-    raw_tasks: list[dict], company: str, ai_eta: bool
+    raw_tasks: list[dict],
+    company: str,
+    ai_eta: bool,
+    eta_cache: ETACache | None = None,
 ) -> list[TaskRecord]:
     """Map raw tasks to sorted records, applying AI ETAs when enabled.
 
@@ -572,7 +602,7 @@ def build_records(
     """
     records = [task_to_record(t, company) for t in raw_tasks]
     if ai_eta:
-        apply_ai_etas(records)
+        apply_ai_etas(records, eta_cache)
     return sort_tasks_by_priority_and_eta(records)
 
 
@@ -669,6 +699,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         "keep the deterministic priority/status ETAs "
         "(default: AI enabled unless KFJ_AI_ETA=0)",
     )
+    parser.add_argument(
+        "--no-eta-cache",
+        action="store_true",
+        help="Re-estimate every AI ETA instead of reusing cached estimates for "
+        "tasks whose priority, status and details are unchanged",
+    )
     parser.add_argument(
         "--date",
         default=None,
@@ -728,7 +764,18 @@ def main() -> int:
         console.print(f"[red]ClickUp API error: {e}[/red]")
         return 1
 
-    records = build_records(raw_tasks, company, ai_eta=not args.no_ai_eta)
+    eta_cache = None
+    if not args.no_eta_cache:
+        eta_cache = ETACache(
+            DiskCache(
+                default_cache_dir() / "ai_etas.json",
+                max_entries=configured_max_entries("AI_CACHE_MAX_ENTRIES", 2048),
+                autosave=False,
+            )
+        )
+    records = build_records(
+        raw_tasks, company, ai_eta=not args.no_ai_eta, eta_cache=eta_cache
+    )
     rows = [record_to_row(r) for r in records]
     logger.info(f"Fetched {len(rows)} open task(s) from list '{company}'")
 
@@ -36,11 +36,14 @@ from ai_summary import (
     mark_claude_unavailable,
 )
 from auth import load_secret_with_fallback
+from disk_cache import DiskCache, configured_max_entries, default_cache_dir
 from config import (
     ClickUpConfig,
     TIMESTAMP_FORMAT,
     DateFilter,
     OutputFormat,
+    TaskFetchMode,
+    TaskQueryMode,
     AISource,
     format_datetime,
     CLICKUP_AI_SUMMARY_FIELD_ID,
@@ -383,6 +386,70 @@ def main():
     parser.add_argument(
         "--interactive", action="store_true", help="Enable interactive task selection"
     )
+    parser.add_argument(
+        "--task-fetch-mode",
+        type=str,
+        choices=["Detail", "ListPayload"],
+        default="Detail",
+        help=(
+            "Where task fields come from: Detail (default; one /task/{id} request "
+            "per task) or ListPayload (use the list response directly and only "
+            "fetch detail for tasks missing a needed field)"
+        ),
+    )
+    parser.add_argument(
+        "--task-query",
+        type=str,
+        choices=["Lists", "Team"],
+        default="Lists",
+        help=(
+            "How tasks are listed: Lists (default; one paginated request per "
+            "list) or Team (bulk /team/{id}/task pages for the whole space, "
+            "grouped by list locally - fewer requests for many lists)"
+        ),
+    )
+    parser.add_argument(
+        "--async-fetch",
+        action="store_true",
+        help=(
+            "Fetch task details with the asyncio client (requires httpx): every "
+            "/task/{id} request of a list in flight at once on one thread, "
+            "bounded by CLICKUP_ASYNC_CONCURRENCY"
+        ),
+    )
+    parser.add_argument(
+        "--stream-json",
+        action="store_true",
+        help=(
+            "Parse task-list pages incrementally as they download and keep only "
+            "the task fields the export reads (lower peak memory on big lists)"
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Fetch only tasks updated since the previous --incremental run and "
+            "reuse its saved records for unchanged tasks (periodic full re-sync, "
+            "see CLICKUP_INCREMENTAL_FULL_SYNC_HOURS)"
+        ),
+    )
+    parser.add_argument(
+        "--refresh-summaries",
+        action="store_true",
+        help="Regenerate AI summaries and ETA estimates instead of reusing cached ones for unchanged tasks",
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk caches (workspace/space/folder/list responses and AI summaries/ETAs)",
+    )
+    cache_group.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached workspace/space/folder/list responses for this run and re-cache fresh ones",
+    )
     args = parser.parse_args()
 
     # The 1Password secret reference for the API key is configured via the
@@ -644,6 +711,16 @@ def main():
                 args.output_format, OutputFormat.MARKDOWN
             )
 
+    try:
+        task_fetch_mode = TaskFetchMode(args.task_fetch_mode)
+    except ValueError:
+        task_fetch_mode = TaskFetchMode.DETAIL
+
+    try:
+        task_query = TaskQueryMode(args.task_query)
+    except ValueError:
+        task_query = TaskQueryMode.LISTS
+
     ai_source = AISource.CLAUDE
     if args.ai_source:
         try:
@@ -703,6 +780,13 @@ def main():
         ai_clickup_field_id=ai_clickup_field_id,
         output_format=output_format,
         interactive_selection=interactive_mode,
+        task_fetch_mode=task_fetch_mode,
+        task_query=task_query,
+        async_fetch=args.async_fetch,
+        stream_json=args.stream_json,
+        incremental=args.incremental,
+        ai_cache_dir=None if args.no_cache else str(default_cache_dir()),
+        refresh_summaries=args.refresh_summaries,
     )
 
     # Display beautiful configuration summary
@@ -718,6 +802,21 @@ def main():
         config_table.add_row("List", config.list_name)
     config_table.add_row("Output Format", config.output_format.value)
     config_table.add_row("Date Filter", config.date_filter.value)
+    config_table.add_row("Task Fetch Mode", config.task_fetch_mode.value)
+    config_table.add_row("Task Query", config.task_query.value)
+    config_table.add_row(
+        "Async Fetch", "[OK] Yes" if config.async_fetch else "[NO] No"
+    )
+    config_table.add_row(
+        "Stream JSON", "[OK] Yes" if config.stream_json else "[NO] No"
+    )
+    config_table.add_row(
+        "Incremental", "[OK] Yes" if config.incremental else "[NO] No"
+    )
+    config_table.add_row(
+        "API Cache",
+        "Off" if args.no_cache else "Refresh" if args.refresh_cache else "On",
+    )
     config_table.add_row(
         "Include Completed", "[OK] Yes" if config.include_completed else "[NO] No"
     )
@@ -741,8 +840,40 @@ def main():
             return True
         return False
 
-    client = _ClickUpAPIClient(api_key)
-    extractor = _ClickUpTaskExtractor(config, client, load_gemini_key_and_update_config)
+    # Hierarchy responses (workspaces, spaces, folders, lists) are cached on
+    # disk so warm runs skip the discovery round-trips; tasks never are.
+    response_cache = None
+    if not args.no_cache:
+        response_cache = DiskCache(
+            default_cache_dir() / "api_responses.json",
+            max_entries=configured_max_entries("CLICKUP_CACHE_MAX_ENTRIES"),
+            refresh=args.refresh_cache,
+        )
+
+    client = _ClickUpAPIClient(api_key, cache=response_cache)
+
+    # The asyncio client shares the sync client's rate limiter so both stay
+    # under one ClickUp limit; without httpx the thread pool is used instead.
+    async_client = None
+    if config.async_fetch:
+        from api_client import HTTPX_AVAILABLE, AsyncClickUpAPIClient
+
+        if HTTPX_AVAILABLE:
+            async_client = AsyncClickUpAPIClient(
+                api_key, cache=response_cache, rate_limiter=client.rate_limiter
+            )
+        else:
+            console.print(
+                "[yellow]⚠️  --async-fetch needs httpx (pip install httpx); "
+                "fetching task details with the thread pool instead.[/yellow]"
+            )
+
+    extractor = _ClickUpTaskExtractor(
+        config,
+        client,
+        load_gemini_key_and_update_config,
+        async_api_client=async_client,
+    )
     extractor.run()
 
 
@@ -5,10 +5,13 @@ Data Mapping and Utilities Module for ClickUp Task Extractor
 
 Contains:
 - LocationMapper class for custom field value mapping
+- DropdownOptions index of a dropdown field's options (LocationMapper rules)
 - Utility functions for user input, date ranges, and image extraction
 """
 
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import TypeAlias
 
@@ -126,10 +129,38 @@ def get_date_range(filter_name: DateFilter | str) -> DateRange:
     return None, None
 
 
+_IMAGE_EXTENSIONS = r"(?:jpg|jpeg|png|gif|bmp|webp)"
+
+# Every image reference form in one alternation, so a text is scanned once.
+# Forms that contain a URL come first: a Markdown image or <img> tag is
+# reported whole rather than again as the bare URL inside it.
+_IMAGE_REFERENCE_FORMS = (
+    r"!\[.*?\]\(.*?\)"  # Markdown image
+    r"|<img[^>]*>"  # HTML <img> tag
+    rf"|https?://\S*\.{_IMAGE_EXTENSIONS}"  # direct image URL
+    rf"|attachments?[:.]?\S*\.{_IMAGE_EXTENSIONS}"  # attachment file name
+)
+# Matched case-sensitively against lowercased text: case-insensitive
+# matching makes the regex engine test every position the slow way.
+_LOWER_IMAGE_REFERENCE_RE = re.compile(_IMAGE_REFERENCE_FORMS)
+# The only non-ASCII letters re.IGNORECASE equates with the forms' letters
+# (i, s); lower() leaves them alone (or lengthens "İ"), so text containing
+# one goes through the case-insensitive pattern, whose lookahead skips
+# positions no form can start at.
+_CASE_FOLD_SPECIALS = "\u0130\u0131\u017f"
+_IMAGE_REFERENCE_RE = re.compile(
+    rf"(?=[!<hHaA])(?:{_IMAGE_REFERENCE_FORMS})", re.IGNORECASE
+)
+
+
 def extract_images(text: str) -> str:
     """
     Extract image references from text using various patterns.
 
+    Markdown images, ``<img>`` tags, direct image URLs and attachment file
+    names are found in a single pass over the text, in document order. Each
+    reference is returned in full and only once.
+
     Args:
         text: Text content to extract images from
 
@@ -138,50 +169,142 @@ def extract_images(text: str) -> str:
     """
     if not text:
         return ""
-    patterns = [
-        r"!\[.*?\]\(.*?\)",
-        r"<img[^>]*>",
-        r"https?://[^\s]*\.(jpg|jpeg|png|gif|bmp|webp)",
-        r"attachment[s]?[:.]?[^\s]*\.(jpg|jpeg|png|gif|bmp|webp)",
-    ]
-    images = []
-    for pat in patterns:
-        images += re.findall(pat, text, re.IGNORECASE)
-    return "; ".join(images)
+    if text.isascii() or not any(c in text for c in _CASE_FOLD_SPECIALS):
+        # lower() keeps every offset here, so spans map back to the text.
+        references = (
+            text[match.start() : match.end()]
+            for match in _LOWER_IMAGE_REFERENCE_RE.finditer(text.lower())
+        )
+    else:
+        references = _IMAGE_REFERENCE_RE.findall(text)
+    return "; ".join(dict.fromkeys(references))
+
+
+# DropdownOptions lookup sentinels: no option matched / the option has no name.
+_NO_MATCH = object()
+_NO_NAME = object()
+
+
+class DropdownOptions:
+    """
+    A dropdown field's options indexed for repeated value → label lookups.
+
+    Resolves a value by option id first (ClickUp stores dropdown values as
+    option ids), then by ``orderindex``, then by option name, falling back to
+    the raw value as text, with dictionary lookups instead of scans over the
+    options. Build one per field definition and reuse it for every task, or
+    let :meth:`LocationMapper.map_location` cache them.
+    """
+
+    def __init__(self, options: list[dict] | None) -> None:
+        self.empty = not options
+        self._by_id: dict[str, object] = {}
+        self._by_orderindex: dict[int, object] = {}
+        self._by_name: dict[str, object] = {}
+        for opt in options or []:
+            # First match wins, as in the scans.
+            name = opt["name"] if "name" in opt else _NO_NAME
+            self._by_id.setdefault(str(opt.get("id")), name)
+            self._by_name.setdefault(str(opt.get("name")), name)
+        try:
+            for opt in options or []:
+                if "orderindex" in opt:
+                    self._by_orderindex.setdefault(
+                        int(opt["orderindex"]), opt["name"] if "name" in opt else _NO_NAME
+                    )
+        except Exception:
+            pass  # The scan stops at the first unusable orderindex too
+
+    def _lookup(self, val) -> object:
+        """Return the label for ``val``, or ``_NO_MATCH`` when no named option matches."""
+        if self.empty:
+            return _NO_MATCH
+        text = str(val)
+        name = self._by_id.get(text, _NO_MATCH)
+        if name is _NO_MATCH:
+            try:
+                name = self._by_orderindex.get(int(val), _NO_MATCH)
+            except Exception:
+                pass
+        if name is _NO_MATCH:
+            name = self._by_name.get(text, _NO_MATCH)
+        return _NO_MATCH if name is _NO_NAME else name
+
+    def find(self, val, default=None):
+        """Return the label for ``val``, or ``default`` when no named option matches."""
+        name = self._lookup(val)
+        return default if name is _NO_MATCH else name
+
+    def label(self, val) -> str:
+        """Return the label for ``val`` (``str(val)`` when nothing matches)."""
+        name = self._lookup(val)
+        return str(val) if name is _NO_MATCH else name
 
 
 class LocationMapper:
     """Mapper for ClickUp custom field values to human-readable labels."""
 
+    # Option indexes kept by map_location (least recently used evicted).
+    INDEX_CACHE_SIZE = 128
+
+    # (field id, (id, orderindex, name) of every option) -> index
+    _indexes: "OrderedDict[tuple, DropdownOptions]" = OrderedDict()
+    _indexes_lock = threading.Lock()
+
     @staticmethod
-    def map_location(val, type_, options) -> str:
+    def map_location(val, type_, options, field_id: str | None = None) -> str:
         """
         Map ClickUp custom field value to human-readable label.
 
+        Matches the option id first, then ``orderindex``, then the option
+        name (see :class:`DropdownOptions`). The options are indexed once and
+        the index is reused while later calls pass options with the same
+        ids, orderindexes and names, so mapping the same field for every task
+        costs one small tuple and a few dictionary lookups.
+
         Args:
             val: The raw value from ClickUp
             type_: The field type
             options: List of available options for the field
+            field_id: Custom field id, keeping indexes of different fields
+                apart (optional)
 
         Returns:
             Human-readable label for the value
         """
         if not options:
             return str(val)
-        # Always match by id (ClickUp stores dropdown value as option id)
-        for opt in options:
-            if str(opt.get("id")) == str(val):
-                return opt.get("name", str(val))
-        # Try to match by orderindex if value is int or str number
+        return LocationMapper._index(options, field_id).label(val)
+
+    @staticmethod
+    def _index(options: list[dict], field_id: str | None) -> DropdownOptions:
+        """Return the cached index for ``options``, building it on a miss."""
+        # Only the keys DropdownOptions reads can change a label, so they
+        # fingerprint the options; missing keys stay distinct from None.
+        key = (
+            field_id,
+            tuple(
+                (
+                    opt.get("id"),
+                    opt.get("orderindex", _NO_NAME),
+                    opt.get("name", _NO_NAME),
+                )
+                for opt in options
+            ),
+        )
+        cache = LocationMapper._indexes
         try:
-            val_int = int(val)
-            for opt in options:
-                if "orderindex" in opt and int(opt["orderindex"]) == val_int:
-                    return opt.get("name", str(val))
-        except Exception:
-            pass
-        # Try to match by name if value is a string and matches an option name
-        for opt in options:
-            if str(opt.get("name")) == str(val):
-                return opt.get("name", str(val))
-        return str(val)
+            with LocationMapper._indexes_lock:
+                index = cache.get(key)
+                if index is not None:
+                    cache.move_to_end(key)
+                    return index
+        except TypeError:
+            return DropdownOptions(options)  # unhashable option values: no caching
+        index = DropdownOptions(options)
+        with LocationMapper._indexes_lock:
+            cache[key] = index
+            cache.move_to_end(key)
+            while len(cache) > LocationMapper.INDEX_CACHE_SIZE:
+                cache.popitem(last=False)
+        return index
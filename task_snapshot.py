@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Incremental Extraction Snapshot Module for ClickUp Task Extractor
+
+Contains:
+- TaskSnapshot: per-list ``date_updated`` high-water marks plus the processed
+  TaskRecords from previous runs, persisted as JSON
+- Helpers to (de)serialize TaskRecords including their AI metadata
+
+With a snapshot, each list is fetched with ``date_updated_gt=<watermark>`` so
+only tasks changed since the previous run are downloaded and processed; the
+unchanged records are restored from disk. Tasks deleted or archived in
+ClickUp do not show up in such a delta, so every list is periodically fully
+re-synced (``full_sync_max_age``).
+"""
+
+import json
+import os
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Collection
+
+from config import TaskRecord
+from eta_calculator import calculate_eta
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+DEFAULT_FULL_SYNC_HOURS = 168
+
+
+def configured_full_sync_seconds() -> float:
+    """Resolve the full re-sync interval from ``CLICKUP_INCREMENTAL_FULL_SYNC_HOURS``."""
+    try:
+        hours = float(
+            os.environ.get("CLICKUP_INCREMENTAL_FULL_SYNC_HOURS", DEFAULT_FULL_SYNC_HOURS)
+        )
+    except ValueError:
+        hours = DEFAULT_FULL_SYNC_HOURS
+    return max(0.0, hours) * 3600
+
+
+def record_to_dict(record: TaskRecord) -> dict[str, Any]:
+    """Serialize a TaskRecord (export fields and ``_metadata``) to plain JSON data."""
+    return {
+        "fields": {
+            f.name: getattr(record, f.name) for f in fields(record) if f.init
+        },
+        "metadata": record._metadata,
+    }
+
+
+def record_from_dict(data: dict[str, Any]) -> TaskRecord:
+    """
+    Rebuild a TaskRecord serialized by :func:`record_to_dict`.
+
+    A due-date-less task's ETA is relative to the day it was computed, so it
+    is recomputed from ``eta_inputs`` (the deterministic baseline) instead of
+    restored; the AI ETA pass, if enabled, upgrades it as for a fresh record.
+    """
+    record = TaskRecord(**data["fields"])
+    metadata = dict(data.get("metadata") or {})
+    # JSON has no tuples; the AI passes expect ai_fields as (label, value) pairs.
+    if metadata.get("ai_fields") is not None:
+        metadata["ai_fields"] = tuple(tuple(item) for item in metadata["ai_fields"])
+    if metadata.get("eta_inputs"):
+        metadata.pop("ai_eta", None)
+        record.ETA = calculate_eta(**metadata["eta_inputs"], enable_ai=False)
+    record._metadata = metadata
+    return record
+
+
+class TaskSnapshot:
+    """
+    Persisted incremental-extraction state for one ClickUp space.
+
+    The file maps each list id to its ``date_updated`` watermark, the time of
+    its last full sync and its processed records in export order. A
+    ``signature`` describing the options that shape the records (e.g. the
+    completed/status filters) is stored alongside; a snapshot written with a
+    different signature is discarded so records are never reused across
+    incompatible runs.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        signature: str,
+        full_sync_max_age: float | None = None,
+    ) -> None:
+        """
+        Load the snapshot at ``path`` (missing, corrupt or mismatched → empty).
+
+        Args:
+            path: JSON file holding the snapshot
+            signature: Identifies the record-shaping options of this run
+            full_sync_max_age: Seconds after which a list is fully re-fetched
+                (default: CLICKUP_INCREMENTAL_FULL_SYNC_HOURS, else 7 days)
+        """
+        self.path = Path(path)
+        self.signature = signature
+        self.full_sync_max_age = (
+            configured_full_sync_seconds()
+            if full_sync_max_age is None
+            else full_sync_max_age
+        )
+        self.reused_count = 0
+        self._lists: dict[str, dict[str, Any]] = {}
+
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if (
+                isinstance(data, dict)
+                and data.get("version") == SNAPSHOT_VERSION
+                and data.get("signature") == signature
+                and isinstance(data.get("lists"), dict)
+            ):
+                self._lists = data["lists"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable snapshot {self.path}: {e}")
+
+    def watermark(self, list_id: str) -> int | None:
+        """
+        Return the ``date_updated`` watermark to fetch changes after.
+
+        Returns:
+            Milliseconds since the epoch, or None when the list needs a full
+            fetch (no snapshot yet, or its last full sync is too old)
+        """
+        state = self._lists.get(str(list_id))
+        if not state or "watermark" not in state:
+            return None
+        if time.time() - state.get("full_synced_at", 0) > self.full_sync_max_age:
+            return None
+        return int(state["watermark"])
+
+    def merge(
+        self,
+        list_id: str,
+        fetched_tasks: list[dict],
+        records: list[TaskRecord],
+        full_sync: bool,
+        failed_ids: Collection[str] = (),
+    ) -> list[TaskRecord]:
+        """
+        Combine freshly processed records with the unchanged stored ones.
+
+        Args:
+            list_id: ClickUp list id
+            fetched_tasks: Every raw task returned by this run's request,
+                before filtering (used for ids and the new watermark)
+            records: Records processed from the fetched tasks that passed the
+                filters (identified by ``_metadata["task_id"]``)
+            full_sync: Whether ``fetched_tasks`` is the complete list
+            failed_ids: Ids of fetched tasks that passed the filters but could
+                not be processed (e.g. a failed detail fetch). Their stored
+                records are kept and the watermark stays below them, so the
+                next run fetches them again.
+
+        Returns:
+            The list's records: stored records keep their position (replaced
+            when changed, dropped when changed and now filtered out) and new
+            tasks are appended in fetch order
+        """
+        key = str(list_id)
+        state = self._lists.get(key) or {}
+        failed_ids = {str(task_id) for task_id in failed_ids}
+        fetched_ids = {str(task.get("id")) for task in fetched_tasks}
+        fresh = {str(record._metadata.get("task_id")): record for record in records}
+
+        merged: list[TaskRecord] = []
+        kept: list[TaskRecord] = []
+        for stored in state.get("tasks", []):
+            task_id = str(stored.get("metadata", {}).get("task_id"))
+            if task_id in failed_ids or not (full_sync or task_id in fetched_ids):
+                restored = record_from_dict(stored)
+                # A full sync lists tasks in fetch order; keep these after them.
+                (kept if full_sync else merged).append(restored)
+                self.reused_count += 1
+            elif task_id in fresh and not full_sync:
+                merged.append(fresh.pop(task_id))
+        merged.extend(fresh.values())
+        merged.extend(kept)
+
+        watermark = state.get("watermark", 0) if not full_sync else 0
+        retry_below: int | None = None
+        for task in fetched_tasks:
+            try:
+                updated = int(task.get("date_updated") or 0)
+            except (TypeError, ValueError):
+                continue
+            watermark = max(watermark, updated)
+            if str(task.get("id")) in failed_ids:
+                retry_below = updated if retry_below is None else min(retry_below, updated)
+        if retry_below is not None:
+            # Changes are fetched with date_updated_gt=watermark; tasks above
+            # it that did process are simply processed again.
+            watermark = min(watermark, retry_below - 1)
+
+        self._lists[key] = {
+            "watermark": watermark,
+            "full_synced_at": (
+                time.time() if full_sync else state.get("full_synced_at", time.time())
+            ),
+            "tasks": [record_to_dict(record) for record in merged],
+        }
+        return merged
+
+    def save(self) -> None:
+        """Atomically write the snapshot to disk."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                json.dump(
+                    {
+                        "version": SNAPSHOT_VERSION,
+                        "signature": self.signature,
+                        "lists": self._lists,
+                    },
+                    handle,
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write snapshot {self.path}: {e}")
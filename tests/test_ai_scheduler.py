@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the shared AI work scheduler (ai_scheduler.AIWorkScheduler).
+"""
+
+import threading
+import time
+import unittest
+
+from ai_scheduler import AIWorkScheduler
+
+
+class AIWorkSchedulerTests(unittest.TestCase):
+    def _scheduler(self, workers: int = 2) -> tuple[AIWorkScheduler, list[str]]:
+        lines: list[str] = []
+        scheduler = AIWorkScheduler(
+            workers, {"summary": "summaries", "eta": "ETAs"}, lines.append
+        )
+        return scheduler, lines
+
+    def test_kinds_share_the_pool_and_run_interleaved(self) -> None:
+        scheduler, _ = self._scheduler(workers=2)
+        summary_started = threading.Event()
+        eta_started = threading.Event()
+
+        def summary() -> str:
+            summary_started.set()
+            # Only finishes if the ETA job runs alongside it.
+            self.assertTrue(eta_started.wait(2))
+            return "s"
+
+        def eta() -> str:
+            eta_started.set()
+            self.assertTrue(summary_started.wait(2))
+            return "e"
+
+        results: list[str] = []
+        scheduler.submit("summary", summary, on_result=results.append)
+        scheduler.submit("eta", eta, on_result=results.append)
+        scheduler.run()
+
+        self.assertCountEqual(results, ["s", "e"])
+
+    def test_combined_progress_counts_units_per_kind(self) -> None:
+        scheduler, lines = self._scheduler(workers=1)
+        scheduler.expect("eta", 2)
+        scheduler.submit("summary", lambda: None, units=3)
+        scheduler.submit("eta", lambda: None, expected=True)
+        scheduler.mark_done("eta")
+        scheduler.run()
+
+        self.assertEqual(
+            scheduler.counters,
+            {"summary": {"done": 3, "total": 3}, "eta": {"done": 2, "total": 2}},
+        )
+        self.assertEqual(lines[-1], "  [dim]3/3 summaries, 2/2 ETAs processed[/dim]")
+
+    def test_callbacks_can_submit_follow_up_jobs(self) -> None:
+        scheduler, _ = self._scheduler()
+        order: list[str] = []
+
+        def after_summary(result: str) -> None:
+            order.append(result)
+            scheduler.submit("eta", lambda: "eta", on_result=order.append)
+
+        scheduler.submit("summary", lambda: "summary", on_result=after_summary)
+        scheduler.run()
+
+        self.assertEqual(order, ["summary", "eta"])
+        self.assertEqual(scheduler.counters["eta"], {"done": 1, "total": 1})
+
+    def test_errors_go_to_on_error_or_propagate(self) -> None:
+        scheduler, _ = self._scheduler()
+        errors: list[Exception] = []
+
+        def boom() -> None:
+            raise ValueError("nope")
+
+        scheduler.submit("summary", boom, on_error=errors.append)
+        scheduler.run()
+        self.assertEqual([str(e) for e in errors], ["nope"])
+
+        scheduler, _ = self._scheduler()
+        scheduler.submit("summary", boom)
+        with self.assertRaises(ValueError):
+            scheduler.run()
+
+    def test_interrupt_cancels_queued_jobs(self) -> None:
+        scheduler, _ = self._scheduler(workers=1)
+        calls: list[int] = []
+
+        def job(n: int) -> None:
+            calls.append(n)
+            if n == 0:
+                raise KeyboardInterrupt
+            time.sleep(0.2)
+
+        for n in range(6):
+            scheduler.submit("eta", job, n)
+        with self.assertRaises(KeyboardInterrupt):
+            scheduler.run()
+
+        self.assertLessEqual(len(calls), 2)
+
+    def test_kept_open_run_accepts_jobs_from_another_thread(self) -> None:
+        scheduler, _ = self._scheduler()
+        results: list[int] = []
+        scheduler.keep_open()
+        runner = threading.Thread(target=scheduler.run)
+        runner.start()
+
+        scheduler.submit("summary", lambda: 1, on_result=results.append)
+        time.sleep(0.05)
+        self.assertTrue(runner.is_alive())  # still waiting for more work
+        scheduler.submit("summary", lambda: 2, on_result=results.append)
+        scheduler.close()
+        runner.join(2)
+
+        self.assertFalse(runner.is_alive())
+        self.assertCountEqual(results, [1, 2])
+
+    def test_cancel_stops_a_kept_open_run(self) -> None:
+        scheduler, _ = self._scheduler(workers=1)
+        calls: list[int] = []
+
+        def job(n: int) -> None:
+            calls.append(n)
+            time.sleep(0.1)
+
+        scheduler.keep_open()
+        runner = threading.Thread(target=scheduler.run)
+        runner.start()
+        for n in range(5):
+            scheduler.submit("eta", job, n)
+        time.sleep(0.05)
+        scheduler.cancel()
+        runner.join(2)
+
+        self.assertFalse(runner.is_alive())
+        self.assertLessEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
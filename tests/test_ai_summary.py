@@ -1,9 +1,10 @@
 import re
 import unittest
+import unittest.mock
 
 import ai_summary
 import eta_calculator
-from ai_summary import _normalize_field_entries, get_ai_summary
+from ai_summary import _normalize_field_entries, get_ai_summary, summary_cache_key
 
 
 # Published Google Gemini model ids follow this shape, e.g.
@@ -45,6 +46,35 @@ class NormalizeFieldEntriesTests(unittest.TestCase):
         self.assertEqual(normalized, [("Subject", "Reset router"), ("Resolution", "Power cycle complete")])
 
 
+class SummaryCacheKeyTests(unittest.TestCase):
+    def test_key_is_stable_across_entry_shapes(self) -> None:
+        as_tuple = summary_cache_key("claude", "Task", (("Name", "A"), ("Status", "Open")))
+        as_mapping = summary_cache_key("claude", "Task", {"Name": "A", "Status": "Open"})
+        self.assertEqual(as_tuple, as_mapping)
+        self.assertTrue(as_tuple.startswith("summary:"))
+
+    def test_key_changes_with_inputs_source_and_template(self) -> None:
+        base = summary_cache_key("claude", "Task", [("Name", "A")])
+        self.assertNotEqual(base, summary_cache_key("claude", "Task", [("Name", "B")]))
+        self.assertNotEqual(base, summary_cache_key("gemini", "Task", [("Name", "A")]))
+        with unittest.mock.patch.object(
+            ai_summary, "_CLAUDE_SUMMARY_PROMPT", "Other {task_name} {field_block}"
+        ):
+            self.assertNotEqual(base, summary_cache_key("claude", "Task", [("Name", "A")]))
+
+    def test_key_changes_with_the_fused_summary_eta_templates(self) -> None:
+        base = summary_cache_key("claude", "Task", [("Name", "A")])
+        for name in (
+            "_CLAUDE_FUSED_SYSTEM_PROMPT",
+            "_CLAUDE_FUSED_TASK_BLOCK",
+            "_CLAUDE_FUSED_PROMPT",
+        ):
+            with self.subTest(template=name), unittest.mock.patch.object(
+                ai_summary, name, "Edited"
+            ):
+                self.assertNotEqual(base, summary_cache_key("claude", "Task", [("Name", "A")]))
+
+
 class GetAISummaryFallbackTests(unittest.TestCase):
     def test_empty_field_entries_returns_message(self) -> None:
         summary = get_ai_summary("Sample Task", [], gemini_api_key="")
@@ -12,13 +12,33 @@ Tests cover:
 - Invalid JSON responses
 - Various HTTP error status codes
 - Retry logic with exponential backoff
+- Token-bucket rate limiting driven by ClickUp's rate-limit headers
+- Header-driven retry waits, the retry budget and the request deadline
+- AsyncClickUpAPIClient (httpx) error and retry parity with the sync client
 """
 
+import asyncio
+import json
+import tempfile
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, call
+import httpx
 import requests
 
-from api_client import ClickUpAPIClient, APIError, AuthenticationError, ShardRoutingError
+from api_client import (
+    AsyncClickUpAPIClient,
+    ClickUpAPIClient,
+    APIError,
+    AuthenticationError,
+    JSONArrayStream,
+    RateLimiter,
+    ShardRoutingError,
+    configured_rate_limit,
+    iter_task_pages,
+)
+from disk_cache import DiskCache
 
 
 class TestClickUpAPIClient(unittest.TestCase):
@@ -34,7 +54,7 @@ class TestClickUpAPIClient(unittest.TestCase):
         self.assertEqual(self.client.headers['Authorization'], self.api_key)
         self.assertEqual(self.client.headers['Content-Type'], 'application/json')
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_successful_get_request(self, mock_get):
         """Test successful GET request returns JSON data."""
         mock_response = Mock()
@@ -52,7 +72,22 @@ class TestClickUpAPIClient(unittest.TestCase):
             timeout=30
         )
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
+    def test_received_bytes_are_counted(self, mock_get):
+        """Test response body sizes add up in bytes_received."""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.content = b'{"tasks": []}'
+        mock_response.json.return_value = {'tasks': []}
+        mock_get.return_value = mock_response
+
+        self.client.get('/list/1/task')
+        self.client.get('/list/2/task')
+
+        self.assertEqual(self.client.bytes_received, 2 * len(b'{"tasks": []}'))
+
+    @patch('api_client.requests.Session.get')
     def test_authentication_error_401(self, mock_get):
         """Test 401 status raises AuthenticationError."""
         mock_response = Mock()
@@ -66,7 +101,7 @@ class TestClickUpAPIClient(unittest.TestCase):
 
         self.assertIn('API authentication failed', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_network_error(self, mock_get):
         """Test network errors raise APIError."""
         mock_get.side_effect = requests.exceptions.ConnectionError('Connection refused')
@@ -77,7 +112,7 @@ class TestClickUpAPIClient(unittest.TestCase):
         self.assertIn('Network error', str(context.exception))
         self.assertIn('Connection refused', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_timeout_error(self, mock_get):
         """Test timeout raises APIError."""
         mock_get.side_effect = requests.exceptions.Timeout('Request timed out')
@@ -88,7 +123,7 @@ class TestClickUpAPIClient(unittest.TestCase):
         self.assertIn('Network timeout', str(context.exception))
         self.assertIn('accessing', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_invalid_json_response(self, mock_get):
         """Test invalid JSON response raises APIError."""
         mock_response = Mock()
@@ -102,7 +137,7 @@ class TestClickUpAPIClient(unittest.TestCase):
 
         self.assertIn('Invalid JSON response', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('builtins.print')
     def test_http_400_error(self, mock_print, mock_get):
         """Test 400 Bad Request raises APIError."""
@@ -118,7 +153,7 @@ class TestClickUpAPIClient(unittest.TestCase):
 
         self.assertIn('HTTP 400', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('builtins.print')
     def test_http_404_error(self, mock_print, mock_get):
         """Test 404 Not Found raises APIError."""
@@ -134,7 +169,7 @@ class TestClickUpAPIClient(unittest.TestCase):
 
         self.assertIn('HTTP 404', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('builtins.print')
     def test_http_429_rate_limit(self, mock_print, mock_get):
         """Test 429 Rate Limit raises APIError."""
@@ -150,7 +185,7 @@ class TestClickUpAPIClient(unittest.TestCase):
 
         self.assertIn('HTTP 429', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('builtins.print')
     def test_http_500_server_error(self, mock_print, mock_get):
         """Test 500 Internal Server Error raises APIError."""
@@ -166,7 +201,7 @@ class TestClickUpAPIClient(unittest.TestCase):
 
         self.assertIn('HTTP 500', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('builtins.print')
     def test_error_message_includes_url_and_status(self, mock_print, mock_get):
         """Test error messages include URL and status code."""
@@ -187,7 +222,7 @@ class TestClickUpAPIClient(unittest.TestCase):
         self.assertIn('403', printed_message)
         self.assertIn('/secure/endpoint', printed_message)
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_request_exception_handling(self, mock_get):
         """Test various request exceptions are handled properly."""
         exceptions = [
@@ -202,7 +237,7 @@ class TestClickUpAPIClient(unittest.TestCase):
                 with self.assertRaises(APIError):
                     self.client.get('/test/endpoint')
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_base_url_construction(self, mock_get):
         """Test that base URL is correctly constructed."""
         mock_response = Mock()
@@ -217,7 +252,7 @@ class TestClickUpAPIClient(unittest.TestCase):
         actual_url = mock_get.call_args[0][0]
         self.assertEqual(actual_url, expected_url)
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_timeout_is_set(self, mock_get):
         """Test that timeout is set on requests."""
         mock_response = Mock()
@@ -231,7 +266,7 @@ class TestClickUpAPIClient(unittest.TestCase):
         # Verify timeout parameter was passed
         self.assertEqual(mock_get.call_args[1]['timeout'], 30)
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_custom_timeout_is_used(self, mock_get):
         """Test that a custom timeout value is forwarded to requests."""
         mock_response = Mock()
@@ -245,7 +280,7 @@ class TestClickUpAPIClient(unittest.TestCase):
 
         self.assertEqual(mock_get.call_args[1]['timeout'], 60)
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('builtins.print')
     def test_shard_routing_error_shard_006(self, mock_print, mock_get):
         """Test 404 with SHARD_006 raises ShardRoutingError."""
@@ -265,7 +300,7 @@ class TestClickUpAPIClient(unittest.TestCase):
         self.assertIn('workspace', error_message)
         self.assertIn('api key', error_message)
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('builtins.print')
     def test_shard_routing_error_generic_shard(self, mock_print, mock_get):
         """Test any SHARD_* error code raises ShardRoutingError."""
@@ -281,7 +316,7 @@ class TestClickUpAPIClient(unittest.TestCase):
 
         self.assertIn('SHARD_999', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('builtins.print')
     def test_non_shard_404_raises_api_error(self, mock_print, mock_get):
         """Test 404 without SHARD error code raises generic APIError."""
@@ -309,7 +344,7 @@ class TestRetryLogic(unittest.TestCase):
         self.client = ClickUpAPIClient(self.api_key)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_retry_on_502_then_success(self, mock_get, mock_sleep):
         """Test successful retry after 502 Bad Gateway error."""
         # First call returns 502, second call succeeds
@@ -338,7 +373,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertLessEqual(mock_sleep.call_args[0][0], 1.15)  # Allow small margin for test stability
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_retry_on_503_then_success(self, mock_get, mock_sleep):
         """Test successful retry after 503 Service Unavailable error."""
         mock_response_503 = Mock()
@@ -360,7 +395,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 1)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_retry_on_504_then_success(self, mock_get, mock_sleep):
         """Test successful retry after 504 Gateway Timeout error."""
         mock_response_504 = Mock()
@@ -382,7 +417,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 1)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_retry_on_429_then_success(self, mock_get, mock_sleep):
         """Test successful retry after 429 Rate Limit error."""
         mock_response_429 = Mock()
@@ -404,7 +439,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 1)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_max_retries_exhausted(self, mock_get, mock_sleep):
         """Test that max retries are enforced (3 attempts total)."""
         # All three attempts return 502
@@ -425,7 +460,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 2)
         self.assertIn('HTTP 502', str(context.exception))
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_no_retry_on_401(self, mock_get):
         """Test that 401 errors are not retried."""
         mock_response = Mock()
@@ -441,7 +476,7 @@ class TestRetryLogic(unittest.TestCase):
         # Verify only 1 request was made (no retries)
         self.assertEqual(mock_get.call_count, 1)
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_no_retry_on_404(self, mock_get):
         """Test that 404 errors are not retried."""
         mock_response = Mock()
@@ -458,7 +493,7 @@ class TestRetryLogic(unittest.TestCase):
         # Verify only 1 request was made (no retries)
         self.assertEqual(mock_get.call_count, 1)
 
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_no_retry_on_400(self, mock_get):
         """Test that 400 errors are not retried."""
         mock_response = Mock()
@@ -476,7 +511,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertEqual(mock_get.call_count, 1)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_exponential_backoff_timing(self, mock_get, mock_sleep):
         """Test exponential backoff calculations with jitter."""
         # Mock three 502 responses
@@ -505,7 +540,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertLessEqual(second_backoff, 2.25)  # Allow small margin for test stability
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_max_backoff_limit(self, mock_get, mock_sleep):
         """Test that backoff is capped at MAX_BACKOFF."""
         # Simulate a scenario where backoff would exceed MAX_BACKOFF
@@ -528,7 +563,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertLessEqual(backoff_10, 33)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_timeout_retry_behavior(self, mock_get, mock_sleep):
         """Test that timeouts are retried with exponential backoff."""
         # First two calls timeout, third succeeds
@@ -552,7 +587,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 2)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_timeout_max_retries(self, mock_get, mock_sleep):
         """Test that timeouts are retried up to max attempts then raise."""
         mock_get.side_effect = requests.exceptions.Timeout('Request timed out')
@@ -567,7 +602,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertIn('Network timeout', str(context.exception))
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_connection_error_retry_behavior(self, mock_get, mock_sleep):
         """Test that connection errors are retried with exponential backoff."""
         # First call fails, second succeeds
@@ -590,7 +625,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 1)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     def test_connection_error_max_retries(self, mock_get, mock_sleep):
         """Test that connection errors are retried up to max attempts then raise."""
         mock_get.side_effect = requests.exceptions.ConnectionError('Connection refused')
@@ -606,7 +641,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertIn('Connection refused', str(context.exception))
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('api_client.logger')
     def test_retry_logging(self, mock_logger, mock_get, mock_sleep):
         """Test that retry attempts are logged correctly."""
@@ -634,7 +669,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertIn('attempt 1/3', log_message)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('api_client.logger')
     def test_timeout_retry_logging(self, mock_logger, mock_get, mock_sleep):
         """Test that timeout retries are logged correctly."""
@@ -658,7 +693,7 @@ class TestRetryLogic(unittest.TestCase):
         self.assertIn('attempt 1/3', log_message)
 
     @patch('api_client.time.sleep')
-    @patch('api_client.requests.get')
+    @patch('api_client.requests.Session.get')
     @patch('api_client.logger')
     def test_connection_error_retry_logging(self, mock_logger, mock_get, mock_sleep):
         """Test that connection error retries are logged correctly."""
@@ -682,6 +717,644 @@ class TestRetryLogic(unittest.TestCase):
         self.assertIn('attempt 1/3', log_message)
 
 
+class TestConnectionPooling(unittest.TestCase):
+    """Tests for the pooled keep-alive sessions."""
+
+    def test_session_reused_within_thread(self):
+        """Repeated calls on one thread share a single Session."""
+        client = ClickUpAPIClient('key')
+        self.assertIs(client._get_session(), client._get_session())
+
+    def test_sessions_are_thread_local_but_share_adapter(self):
+        """Each thread gets its own Session mounted on the shared adapter."""
+        import threading
+
+        client = ClickUpAPIClient('key')
+        main_session = client._get_session()
+        other = {}
+
+        thread = threading.Thread(
+            target=lambda: other.setdefault('session', client._get_session())
+        )
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(main_session, other['session'])
+        self.assertIs(main_session.get_adapter(ClickUpAPIClient.BASE_URL), client._adapter)
+        self.assertIs(other['session'].get_adapter(ClickUpAPIClient.BASE_URL), client._adapter)
+
+    def test_pool_size_argument_and_env(self):
+        """Pool size comes from the argument, then CLICKUP_HTTP_POOL_SIZE, then the default."""
+        self.assertEqual(ClickUpAPIClient('key', pool_size=3).pool_size, 3)
+        with patch.dict('os.environ', {'CLICKUP_HTTP_POOL_SIZE': '16'}):
+            self.assertEqual(ClickUpAPIClient('key').pool_size, 16)
+        with patch.dict('os.environ', {'CLICKUP_HTTP_POOL_SIZE': 'bogus'}):
+            self.assertEqual(
+                ClickUpAPIClient('key').pool_size, ClickUpAPIClient.DEFAULT_POOL_SIZE
+            )
+
+    @patch('api_client.requests.Session.get')
+    @patch('api_client.logger')
+    def test_connection_reuse_is_debug_logged(self, mock_logger, mock_get):
+        """Pool usage is reported at DEBUG after each request."""
+        mock_logger.isEnabledFor.return_value = True
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        mock_get.return_value = mock_response
+
+        ClickUpAPIClient('key').get('/team')
+
+        log_message = mock_logger.debug.call_args[0][0]
+        self.assertIn('Connection pool', log_message)
+        self.assertIn('api.clickup.com', log_message)
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the on-disk cache of hierarchy endpoints."""
+
+    def setUp(self):
+        import tempfile
+        from disk_cache import DiskCache
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_path = Path(self.tmp_dir.name) / 'api.json'
+        self.make_cache = lambda **kw: DiskCache(self.cache_path, **kw)
+
+    def _response(self, status_code=200, payload=None, etag=None):
+        response = Mock()
+        response.ok = status_code < 400
+        response.status_code = status_code
+        response.json.return_value = payload
+        response.headers = {'ETag': etag} if etag else {}
+        return response
+
+    @patch('api_client.requests.Session.get')
+    def test_hierarchy_endpoint_served_from_cache_across_clients(self, mock_get):
+        """A warm cache answers hierarchy requests without touching the network."""
+        mock_get.return_value = self._response(payload={'teams': [{'id': '1'}]})
+
+        ClickUpAPIClient('key', cache=self.make_cache()).get('/team')
+        result = ClickUpAPIClient('key', cache=self.make_cache()).get('/team')
+
+        self.assertEqual(result, {'teams': [{'id': '1'}]})
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('api_client.requests.Session.get')
+    def test_task_endpoints_are_never_cached(self, mock_get):
+        """Task data is always fetched live."""
+        mock_get.return_value = self._response(payload={'id': 't1'})
+        client = ClickUpAPIClient('key', cache=self.make_cache())
+
+        client.get('/task/t1')
+        client.get('/task/t1')
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(len(client.cache), 0)
+
+    @patch('api_client.requests.Session.get')
+    def test_cache_is_scoped_to_api_key(self, mock_get):
+        """Different API keys never share cached responses."""
+        mock_get.return_value = self._response(payload={'teams': []})
+
+        ClickUpAPIClient('key-a', cache=self.make_cache()).get('/team')
+        ClickUpAPIClient('key-b', cache=self.make_cache()).get('/team')
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertNotIn('key-a', self.cache_path.read_text())
+
+    @patch('api_client.requests.Session.get')
+    def test_expired_entry_revalidates_with_etag(self, mock_get):
+        """An expired entry sends the stored ETag and reuses the body on 304."""
+        mock_get.return_value = self._response(payload={'spaces': ['s']}, etag='"v1"')
+        client = ClickUpAPIClient('key', cache=self.make_cache())
+        client.get('/team/1/space')
+
+        mock_get.return_value = self._response(status_code=304)
+        with patch('disk_cache.time.time', return_value=time.time() + 2 * 86400):
+            result = client.get('/team/1/space')
+
+        self.assertEqual(result, {'spaces': ['s']})
+        sent_headers = mock_get.call_args.kwargs['headers']
+        self.assertEqual(sent_headers['If-None-Match'], '"v1"')
+        self.assertIn('Authorization', sent_headers)
+
+    @patch('api_client.requests.Session.get')
+    def test_refresh_does_a_full_fetch_without_etag(self, mock_get):
+        """Refresh mode ignores the stored entry, ETag included, and replaces it."""
+        mock_get.return_value = self._response(payload={'spaces': ['s']}, etag='"v1"')
+        ClickUpAPIClient('key', cache=self.make_cache()).get('/team/1/space')
+
+        mock_get.return_value = self._response(payload={'spaces': ['fixed']}, etag='"v2"')
+        client = ClickUpAPIClient('key', cache=self.make_cache(refresh=True))
+        result = client.get('/team/1/space')
+
+        self.assertEqual(result, {'spaces': ['fixed']})
+        self.assertNotIn('If-None-Match', mock_get.call_args.kwargs['headers'])
+        self.assertEqual(
+            ClickUpAPIClient('key', cache=self.make_cache()).get('/team/1/space'),
+            {'spaces': ['fixed']},
+        )
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('api_client.requests.Session.get')
+    def test_expired_entry_is_refetched(self, mock_get):
+        """Entries older than the endpoint TTL are fetched again."""
+        mock_get.return_value = self._response(payload={'lists': [1]})
+        client = ClickUpAPIClient('key', cache=self.make_cache())
+        client.get('/folder/9/list')
+
+        mock_get.return_value = self._response(payload={'lists': [2]})
+        with patch('disk_cache.time.time', return_value=time.time() + 2 * 3600):
+            result = client.get('/folder/9/list')
+
+        self.assertEqual(result, {'lists': [2]})
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('api_client.requests.Session.get')
+    def test_get_fresh_bypasses_a_live_entry_and_stores_the_response(self, mock_get):
+        """get_fresh() asks ClickUp even within the TTL, revalidating with the ETag."""
+        mock_get.return_value = self._response(payload={'statuses': ['open']}, etag='"v1"')
+        client = ClickUpAPIClient('key', cache=self.make_cache())
+        client.get('/list/7')
+
+        mock_get.return_value = self._response(payload={'statuses': ['open', 'qa']}, etag='"v2"')
+        result = client.get_fresh('/list/7')
+
+        self.assertEqual(result, {'statuses': ['open', 'qa']})
+        self.assertEqual(mock_get.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+        self.assertEqual(client.get('/list/7'), {'statuses': ['open', 'qa']})
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class FakeClock:
+    """Monotonic/wall clock whose sleep() advances time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for the RateLimiter token bucket."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ("monotonic", "time", "sleep"):
+            patcher = patch(f"api_client.time.{name}", getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_full_bucket_then_paced_at_the_plan_rate(self):
+        limiter = RateLimiter(rate_per_minute=60)
+        for _ in range(60):
+            self.assertEqual(limiter.acquire(), 0.0)
+        self.assertAlmostEqual(limiter.acquire(), 1.0)  # 1 token per second
+        self.assertAlmostEqual(limiter.waited, 1.0)
+
+    def test_remaining_header_caps_tokens_with_safety_margin(self):
+        limiter = RateLimiter(rate_per_minute=600)
+        limiter.observe({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1060"})
+        self.assertEqual(limiter.acquire(), 0.0)
+        self.assertEqual(limiter.acquire(), 0.0)
+        self.assertGreater(limiter.acquire(), 0.0)  # third request is paced
+
+    def test_exhausted_window_blocks_until_reset(self):
+        limiter = RateLimiter(rate_per_minute=100)
+        limiter.observe({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "1030"})
+        self.assertAlmostEqual(limiter.acquire(), 30.0)
+        self.assertEqual(self.clock.now, 1030.0)
+
+    def test_skewed_reset_blocks_for_at_most_one_window(self):
+        limiter = RateLimiter(rate_per_minute=100)
+        limiter.observe({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "90000"})
+        self.assertAlmostEqual(limiter.acquire(), RateLimiter.MAX_RESET_WAIT)
+
+    def test_missing_or_malformed_headers_are_ignored(self):
+        limiter = RateLimiter(rate_per_minute=60)
+        limiter.observe({})
+        limiter.observe({"X-RateLimit-Remaining": "soon"})
+        limiter.observe(Mock())
+        self.assertEqual(limiter.acquire(), 0.0)
+
+    def test_rate_limit_from_env_accepts_tiers_and_numbers(self):
+        cases = {
+            "": 100,
+            "business_plus": 1000,
+            "Enterprise": 10000,
+            "250": 250,
+            "0": 1,
+            "fast": 100,
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value), patch.dict(
+                "os.environ", {"CLICKUP_RATE_LIMIT": value}
+            ):
+                self.assertEqual(configured_rate_limit(), expected)
+
+    @patch("api_client.requests.Session.get")
+    def test_client_paces_requests_through_the_limiter(self, mock_get):
+        response = Mock(ok=True, status_code=200)
+        response.json.return_value = {}
+        response.headers = {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "1010"}
+        mock_get.return_value = response
+        client = ClickUpAPIClient("key", rate_limiter=RateLimiter(100))
+
+        client.get("/a")
+        client.get("/b")  # the server reported an exhausted window
+
+        self.assertEqual(self.clock.sleeps, [10.0])
+
+
+class TestServerDirectedRetries(unittest.TestCase):
+    """Tests for Retry-After/reset-aware waits, retry budget and deadline."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ("monotonic", "time", "sleep"):
+            patcher = patch(f"api_client.time.{name}", getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        session_patcher = patch("api_client.requests.Session.get")
+        self.mock_get = session_patcher.start()
+        self.addCleanup(session_patcher.stop)
+
+    @staticmethod
+    def _response(status: int, headers: dict | None = None) -> Mock:
+        response = Mock(ok=status < 400, status_code=status, text="body")
+        response.headers = headers or {}
+        response.json.return_value = {"status": status}
+        return response
+
+    def _client(self, **kwargs) -> ClickUpAPIClient:
+        return ClickUpAPIClient("key", rate_limiter=RateLimiter(10000), **kwargs)
+
+    def test_retry_after_seconds_is_used_instead_of_backoff(self):
+        self.mock_get.side_effect = [
+            self._response(503, {"Retry-After": "7"}),
+            self._response(200),
+        ]
+        self.assertEqual(self._client().get("/x"), {"status": 200})
+        self.assertEqual(self.clock.sleeps, [7.0])
+
+    def test_retry_after_http_date(self):
+        self.mock_get.side_effect = [
+            # FakeClock's wall time is 1000s after the epoch.
+            self._response(503, {"Retry-After": "Thu, 01 Jan 1970 00:16:52 GMT"}),
+            self._response(200),
+        ]
+        self._client().get("/x")
+        self.assertEqual(self.clock.sleeps, [12.0])
+
+    def test_rate_limit_reset_drives_429_wait(self):
+        self.mock_get.side_effect = [
+            self._response(429, {"X-RateLimit-Reset": "1004"}),
+            self._response(200),
+        ]
+        self._client().get("/x")
+        self.assertEqual(self.clock.sleeps, [4.0])
+
+    def test_deadline_allows_more_than_max_retries(self):
+        self.mock_get.side_effect = [
+            self._response(503, {"Retry-After": "1"}) for _ in range(5)
+        ] + [self._response(200)]
+        self.assertEqual(self._client(deadline=30).get("/x"), {"status": 200})
+        self.assertEqual(self.mock_get.call_count, 6)
+
+    def test_wait_past_the_deadline_gives_up_immediately(self):
+        self.mock_get.return_value = self._response(503, {"Retry-After": "60"})
+        with self.assertRaises(APIError):
+            self._client(deadline=30).get("/x")
+        self.assertEqual(self.mock_get.call_count, 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_excessive_server_delay_fails_instead_of_sleeping(self):
+        for headers in (
+            {"Retry-After": "86400"},
+            {"X-RateLimit-Reset": str(1000 + 3600)},  # skewed reset time
+        ):
+            with self.subTest(headers=headers):
+                self.clock.sleeps.clear()
+                self.mock_get.reset_mock()
+                self.mock_get.side_effect = None
+                self.mock_get.return_value = self._response(429, headers)
+                with self.assertRaises(APIError):
+                    self._client().get("/x")
+                self.assertEqual(self.mock_get.call_count, 1)
+                self.assertEqual(self.clock.sleeps, [])
+
+    def test_retry_budget_is_shared_across_requests(self):
+        self.mock_get.return_value = self._response(503, {"Retry-After": "0"})
+        client = self._client(retry_budget=3)
+        with self.assertRaises(APIError):
+            client.get("/a")  # 2 retries
+        with self.assertRaises(APIError):
+            client.get("/b")  # 1 retry left
+        with self.assertRaises(APIError):
+            client.get("/c")  # budget spent: no retry
+        self.assertEqual(self.mock_get.call_count, 3 + 2 + 1)
+
+    def test_budget_and_deadline_from_env(self):
+        with patch.dict(
+            "os.environ",
+            {"CLICKUP_RETRY_BUDGET": "5", "CLICKUP_REQUEST_DEADLINE": "12.5"},
+        ):
+            client = ClickUpAPIClient("key")
+        self.assertEqual((client.retry_budget, client.deadline), (5, 12.5))
+        with patch.dict(
+            "os.environ",
+            {"CLICKUP_RETRY_BUDGET": "x", "CLICKUP_REQUEST_DEADLINE": "0"},
+        ):
+            client = ClickUpAPIClient("key")
+        self.assertEqual(
+            (client.retry_budget, client.deadline),
+            (ClickUpAPIClient.DEFAULT_RETRY_BUDGET, None),
+        )
+
+
+class TestAsyncClickUpAPIClient(unittest.TestCase):
+    """Tests for the asyncio client, using an in-process httpx transport."""
+
+    def _get(self, responses: list[httpx.Response], endpoint: str = "/x", **kwargs):
+        """Run client.get(endpoint) against ``responses``; return (result, requests)."""
+        requests_seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            return responses[len(requests_seen) - 1]
+
+        async def run():
+            client = AsyncClickUpAPIClient(
+                "key", rate_limiter=RateLimiter(10000), **kwargs
+            )
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                return await client.get(endpoint)
+
+        return asyncio.run(run()), requests_seen
+
+    def test_successful_get_sends_auth_header(self):
+        result, seen = self._get([httpx.Response(200, json={"teams": []})], "/team")
+        self.assertEqual(result, {"teams": []})
+        self.assertEqual(str(seen[0].url), "https://api.clickup.com/api/v2/team")
+        self.assertEqual(seen[0].headers["Authorization"], "key")
+
+    def test_401_raises_authentication_error(self):
+        with self.assertRaises(AuthenticationError):
+            self._get([httpx.Response(401, text="Unauthorized")])
+
+    @patch("builtins.print")
+    def test_shard_error_raises_shard_routing_error(self, mock_print):
+        response = httpx.Response(404, json={"err": "Shard", "ECODE": "SHARD_006"})
+        with self.assertRaises(ShardRoutingError):
+            self._get([response])
+
+    @patch("api_client.logger")
+    def test_retry_after_is_honoured(self, mock_logger):
+        result, seen = self._get(
+            [
+                httpx.Response(503, headers={"Retry-After": "0.01"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+        self.assertEqual(result, {"ok": True})
+        self.assertEqual(len(seen), 2)
+        self.assertIn("Retrying in 0.01s", mock_logger.warning.call_args[0][0])
+
+    def test_hierarchy_responses_use_the_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DiskCache(Path(tmp) / "api.json")
+            first, seen = self._get(
+                [httpx.Response(200, json={"teams": [1]})], "/team", cache=cache
+            )
+            second, seen_again = self._get([], "/team", cache=cache)
+        self.assertEqual((first, second), ({"teams": [1]}, {"teams": [1]}))
+        self.assertEqual((len(seen), len(seen_again)), (1, 0))
+
+
+class TestIterTaskPages(unittest.TestCase):
+    """Tests for the shared paginated task iterator."""
+
+    ENDPOINT = '/list/L1/task?archived=false&subtasks=true'
+
+    class PagedClient:
+        def __init__(self, pages):
+            self.pages = pages
+            self.calls = []
+
+        def get(self, endpoint):
+            self.calls.append(endpoint)
+            return self.pages[endpoint]
+
+    def _page(self, n):
+        return f'{self.ENDPOINT}&page={n}'
+
+    def test_follows_pages_until_last_page(self):
+        """All pages are yielded in order until last_page is True."""
+        client = self.PagedClient({
+            self._page(0): {'tasks': [{'id': 'a'}], 'last_page': False},
+            self._page(1): {'tasks': [{'id': 'b'}], 'last_page': False},
+            self._page(2): {'tasks': [{'id': 'c'}], 'last_page': True},
+        })
+
+        pages = list(iter_task_pages(client, self.ENDPOINT))
+
+        self.assertEqual(pages, [[{'id': 'a'}], [{'id': 'b'}], [{'id': 'c'}]])
+        self.assertEqual(client.calls, [self._page(0), self._page(1), self._page(2)])
+
+    def test_missing_last_page_flag_stops_after_first_page(self):
+        """Responses without last_page are treated as the final page."""
+        client = self.PagedClient({self._page(0): {'tasks': [{'id': 'a'}]}})
+
+        self.assertEqual(list(iter_task_pages(client, self.ENDPOINT)), [[{'id': 'a'}]])
+        self.assertEqual(client.calls, [self._page(0)])
+
+    def test_page_size_continues_past_full_pages_without_flag(self):
+        """With page_size, a full page without last_page means more may follow."""
+        client = self.PagedClient({
+            self._page(0): {'tasks': [{'id': 'a'}, {'id': 'b'}]},
+            self._page(1): {'tasks': [{'id': 'c'}]},
+        })
+
+        pages = list(iter_task_pages(client, self.ENDPOINT, page_size=2))
+
+        self.assertEqual(pages, [[{'id': 'a'}, {'id': 'b'}], [{'id': 'c'}]])
+        self.assertEqual(client.calls, [self._page(0), self._page(1)])
+
+    def test_empty_page_terminates(self):
+        """An empty tasks array ends iteration even if last_page is False."""
+        client = self.PagedClient({self._page(0): {'tasks': [], 'last_page': False}})
+
+        self.assertEqual(list(iter_task_pages(client, self.ENDPOINT)), [])
+
+    def test_next_page_is_prefetched_while_current_is_consumed(self):
+        """Page 1 is requested before the consumer finishes with page 0."""
+        import threading
+
+        requested = threading.Event()
+
+        class SignallingClient(self.PagedClient):
+            def get(inner_self, endpoint):
+                if endpoint.endswith('page=1'):
+                    requested.set()
+                return super().get(endpoint)
+
+        client = SignallingClient({
+            self._page(0): {'tasks': [{'id': 'a'}], 'last_page': False},
+            self._page(1): {'tasks': [{'id': 'b'}], 'last_page': True},
+        })
+
+        pages = iter_task_pages(client, self.ENDPOINT)
+        self.assertEqual(next(pages), [{'id': 'a'}])
+        # Still holding page 0: the background fetch of page 1 is under way.
+        self.assertTrue(requested.wait(timeout=2))
+        self.assertEqual(list(pages), [[{'id': 'b'}]])
+
+    def test_prefetch_disabled_fetches_serially(self):
+        """prefetch=False still follows pagination."""
+        client = self.PagedClient({
+            self._page(0): {'tasks': [{'id': 'a'}], 'last_page': False},
+            self._page(1): {'tasks': [{'id': 'b'}], 'last_page': True},
+        })
+
+        pages = list(iter_task_pages(client, self.ENDPOINT, prefetch=False))
+
+        self.assertEqual(pages, [[{'id': 'a'}], [{'id': 'b'}]])
+
+
+    def test_fields_stream_pages_through_clients_that_support_it(self):
+        """With fields, pages come from stream() and keep only those keys."""
+        class StreamingClient(self.PagedClient):
+            def stream(inner_self, endpoint, key, fields):
+                body = json.dumps(inner_self.get(endpoint)).encode()
+                return JSONArrayStream([body], key, fields)
+
+        client = StreamingClient({
+            self._page(0): {'tasks': [{'id': 'a', 'big': 'x'}], 'last_page': False},
+            self._page(1): {'tasks': [{'id': 'b', 'big': 'y'}], 'last_page': True},
+        })
+
+        pages = list(iter_task_pages(client, self.ENDPOINT, fields=('id',)))
+
+        self.assertEqual(pages, [[{'id': 'a'}], [{'id': 'b'}]])
+
+
+class TestJSONArrayStream(unittest.TestCase):
+    """Tests for the incremental task-page parser."""
+
+    BODY = (
+        '{"meta": {"n": [1, 2]}, "tasks": [{"id": "1", "name": "\u00e9t\u00e9", '
+        '"custom_fields": [{"v": "x"}]}, {"id": 2}], "last_page": true, "count": 12345}'
+    ).encode('utf-8')
+
+    def _chunks(self, size):
+        return [self.BODY[i:i + size] for i in range(0, len(self.BODY), size)]
+
+    def test_items_and_extras_match_json_loads_for_any_chunking(self):
+        expected = json.loads(self.BODY)
+        for size in (1, 3, 16, len(self.BODY)):
+            with self.subTest(size=size):
+                stream = JSONArrayStream(self._chunks(size))
+                self.assertEqual(list(stream), expected['tasks'])
+                self.assertEqual(
+                    stream.extras, {'meta': {'n': [1, 2]}, 'last_page': True, 'count': 12345}
+                )
+
+    def test_items_are_projected_to_fields(self):
+        stream = JSONArrayStream(self._chunks(5), fields=('id', 'name'))
+        self.assertEqual(list(stream), [{'id': '1', 'name': 'été'}, {'id': 2}])
+
+    def test_items_are_yielded_before_the_body_is_complete(self):
+        consumed = []
+
+        def chunks():
+            for chunk in self._chunks(8):
+                consumed.append(chunk)
+                yield chunk
+
+        first = next(iter(JSONArrayStream(chunks())))
+        self.assertEqual(first['id'], '1')
+        self.assertLess(sum(map(len, consumed)), len(self.BODY))
+
+    def test_truncated_or_malformed_body_raises_api_error(self):
+        for body in (self.BODY[:-10], b'[1, 2]', b'{"tasks": [1 2]}'):
+            with self.subTest(body=body):
+                with self.assertRaises(APIError):
+                    list(JSONArrayStream([body]))
+
+    @patch('api_client.requests.Session.get')
+    def test_client_stream_reads_the_body_in_chunks(self, mock_get):
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = iter(self._chunks(10))
+        mock_get.return_value = mock_response
+        client = ClickUpAPIClient('key', rate_limiter=RateLimiter(10000))
+
+        stream = client.stream('/list/1/task?page=0', fields=('id',))
+
+        self.assertEqual(list(stream), [{'id': '1'}, {'id': 2}])
+        self.assertTrue(stream.extras['last_page'])
+        self.assertTrue(mock_get.call_args.kwargs['stream'])
+        self.assertEqual(client.bytes_received, len(self.BODY))
+        mock_response.close.assert_called_once()
+
+    def test_streamed_retry_returns_the_connection_to_the_pool(self):
+        """A retried streamed request must not hold the only pooled connection."""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        statuses = [429, 200]
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                status = statuses.pop(0) if statuses else 200
+                body = b'{"tasks": [{"id": "1"}]}' if status == 200 else b'{}'
+                self.send_response(status)
+                if status == 429:
+                    self.send_header('Retry-After', '0')
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        client = ClickUpAPIClient('key', pool_size=1, rate_limiter=RateLimiter(10000))
+        client.BASE_URL = f'http://127.0.0.1:{server.server_port}'
+        self.addCleanup(client.close)
+        result = {}
+        worker = threading.Thread(
+            target=lambda: result.setdefault('tasks', list(client.stream('/list/1/task')))
+        )
+        worker.daemon = True
+        worker.start()
+        worker.join(5)
+
+        self.assertFalse(worker.is_alive(), 'streamed retry hung waiting for the pool')
+        self.assertEqual(result['tasks'], [{'id': '1'}])
+
+
 class TestAPIErrorExceptions(unittest.TestCase):
     """Tests for custom exception classes."""
 
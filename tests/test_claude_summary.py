@@ -5,7 +5,8 @@ Unit tests for the Claude CLI summary path in ai_summary.py.
 
 These mock subprocess.run / shutil.which so no real `claude` CLI call is made.
 They cover the happy path, the CLI-missing path, error/timeout handling, and the
-usage-limit "skip the rest of the run" behavior.
+usage-limit "skip the rest of the run" behavior, and the batched multi-task
+prompt with its per-task fallback.
 """
 
 import subprocess
@@ -317,5 +318,80 @@ class ClaudeAuthProbeTests(unittest.TestCase):
         mock_run.assert_not_called()
 
 
+class ClaudeBatchSummaryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        ai_summary._reset_claude_state()
+        which = patch("ai_summary.shutil.which", return_value="/usr/bin/claude")
+        which.start()
+        self.addCleanup(which.stop)
+        self.addCleanup(ai_summary._reset_claude_state)
+
+    TASKS = [
+        ("Fix printer", [("Status", "in progress")]),
+        ("Renew cert", [("Status", "to do")]),
+    ]
+
+    def test_json_lines_reply_maps_summaries_to_tasks(self) -> None:
+        reply = (
+            "```\n"
+            '{"id": 2, "summary": "I need to renew the cert"}\n'
+            '{"id": 1, "summary": "I rebooted the printer."}\n'
+            "```"
+        )
+        with patch(
+            "ai_summary.subprocess.run", return_value=_completed(stdout=reply)
+        ) as mock_run:
+            results = ai_summary.get_claude_summaries(self.TASKS)
+
+        self.assertEqual(
+            results, ["I rebooted the printer.", "I need to renew the cert."]
+        )
+        mock_run.assert_called_once()
+        prompt = mock_run.call_args.kwargs["input"]
+        self.assertIn("### Task 1\nTask: Fix printer", prompt)
+        self.assertIn("### Task 2\nTask: Renew cert", prompt)
+
+    def test_unparsed_tasks_fall_back_to_single_calls(self) -> None:
+        replies = [
+            _completed(stdout='{"id": 1, "summary": "Done."}\nnot json for task 2'),
+            _completed(stdout="I will renew the cert"),
+        ]
+        with patch("ai_summary.subprocess.run", side_effect=replies) as mock_run:
+            results = ai_summary.get_claude_summaries(self.TASKS)
+
+        self.assertEqual(results, ["Done.", "I will renew the cert."])
+        self.assertEqual(mock_run.call_count, 2)
+        self.assertIn("Task: Renew cert", mock_run.call_args.kwargs["input"])
+
+    def test_failed_batch_call_is_not_retried_per_task(self) -> None:
+        with patch(
+            "ai_summary.subprocess.run",
+            side_effect=subprocess.TimeoutExpired(cmd="claude", timeout=1),
+        ) as mock_run:
+            results = ai_summary.get_claude_summaries(self.TASKS)
+
+        self.assertEqual(results, [None, None])
+        mock_run.assert_called_once()
+
+    def test_usage_limit_stops_fallback_calls(self) -> None:
+        with patch(
+            "ai_summary.subprocess.run",
+            return_value=_completed(returncode=1, stderr="usage limit reached"),
+        ) as mock_run:
+            results = ai_summary.get_claude_summaries(self.TASKS)
+
+        self.assertEqual(results, [None, None])
+        mock_run.assert_called_once()
+
+    def test_parse_batch_lines_ignores_invalid_lines(self) -> None:
+        parsed = ai_summary.parse_batch_lines(
+            '{"id": 1, "summary": "ok", "eta": "1/2/2027"},\n'
+            '{"id": 9, "summary": "out of range"}\n'
+            '{"id": "2", "summary": "bad id"}\n{"id": 2, "summary": ""}\n[1, 2]',
+            2,
+        )
+        self.assertEqual(parsed, {1: {"id": 1, "summary": "ok.", "eta": "1/2/2027"}})
+
+
 if __name__ == "__main__":
     unittest.main()
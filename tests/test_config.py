@@ -5,6 +5,7 @@ from datetime import datetime
 from config import (
     DISPLAY_FORMAT,
     TIMESTAMP_FORMAT,
+    TaskRecord,
     default_output_path,
     format_datetime,
 )
@@ -31,6 +32,22 @@ class FormatDateTimeTests(unittest.TestCase):
         # Should be 10/7/2025 at 9:30 AM (MM/DD/YYYY format)
         self.assertEqual(formatted, "10/7/2025 at 9:30 AM")
 
+    def test_midnight_and_noon_use_twelve(self) -> None:
+        self.assertEqual(
+            [
+                format_datetime(dt, "%I:%M %p")
+                for dt in (datetime(2025, 1, 8, 0, 5), datetime(2025, 1, 8, 12, 30))
+            ],
+            ["12:05 AM", "12:30 PM"],
+        )
+
+    def test_other_directives_and_literal_percents_match_strftime(self) -> None:
+        sample_dt = datetime(2025, 3, 4, 17, 6, 9)
+        self.assertEqual(
+            format_datetime(sample_dt, "%Y-%m-%d %H:%M:%S %a %b %j 100%% %"),
+            f"2025-3-4 17:06:09 {sample_dt.strftime('%a %b %j')} 100% %",
+        )
+
 
 class DefaultOutputPathTests(unittest.TestCase):
     def test_default_output_path_uses_output_directory(self) -> None:
@@ -42,5 +59,38 @@ class DefaultOutputPathTests(unittest.TestCase):
         self.assertIn("output", directory)
 
 
+class TaskRecordTests(unittest.TestCase):
+    def _record(self, status: str) -> TaskRecord:
+        # Build the values at runtime so they aren't shared constants already.
+        return TaskRecord(
+            Task="Fix printer",
+            Company="".join(["Sup", "port"]),
+            Branch="HQ",
+            Priority="High",
+            Status="".join(status),
+        )
+
+    def test_records_are_slotted_with_lazy_metadata(self) -> None:
+        record = self._record("Open")
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertIsNone(record._meta)
+
+        record._metadata["task_id"] = "t1"
+        self.assertEqual(record._metadata, {"task_id": "t1"})
+        record._metadata = {"task_id": "t2"}
+        self.assertEqual(record._meta, {"task_id": "t2"})
+
+    def test_repeated_column_values_share_one_object(self) -> None:
+        first, second = self._record(["Op", "en"]), self._record(["O", "pen"])
+        self.assertIs(first.Company, second.Company)
+        self.assertIs(first.Status, second.Status)
+
+    def test_metadata_is_not_compared_or_shown(self) -> None:
+        first, second = self._record("Open"), self._record("Open")
+        first._metadata["task_id"] = "t1"
+        self.assertEqual(first, second)
+        self.assertNotIn("_meta", repr(first))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from disk_cache import DiskCache, configured_max_entries, default_cache_dir
+
+
+class DiskCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = Path(self.tmp_dir.name) / "nested" / "cache.json"
+
+    def test_values_persist_across_instances(self) -> None:
+        DiskCache(self.path).put("k", {"a": 1}, etag="v1")
+        cache = DiskCache(self.path)
+        self.assertEqual(cache.get("k"), {"a": 1})
+        self.assertEqual(cache.entry("k")["etag"], "v1")
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = DiskCache(self.path, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+
+        reloaded = DiskCache(self.path)
+        self.assertEqual(reloaded.get("a"), 1)
+        self.assertIsNone(reloaded.get("b"))
+        self.assertEqual(reloaded.get("c"), 3)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_max_age_expires_entries(self) -> None:
+        cache = DiskCache(self.path)
+        with patch("disk_cache.time.time", return_value=1000.0):
+            cache.put("k", "v")
+        with patch("disk_cache.time.time", return_value=1100.0):
+            self.assertEqual(cache.get("k", max_age=100), "v")
+            self.assertIsNone(cache.get("k", max_age=99))
+            cache.touch("k")
+            self.assertEqual(cache.get("k", max_age=0), "v")
+
+    def test_refresh_mode_misses_but_still_writes(self) -> None:
+        DiskCache(self.path).put("k", "old")
+        cache = DiskCache(self.path, refresh=True)
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", "new")
+        self.assertEqual(DiskCache(self.path).get("k"), "new")
+
+    def test_corrupt_file_is_treated_as_empty(self) -> None:
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text("{not json", encoding="utf-8")
+        cache = DiskCache(self.path)
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", "v")
+        self.assertEqual(DiskCache(self.path).get("k"), "v")
+
+    def test_without_autosave_changes_persist_on_flush(self) -> None:
+        cache = DiskCache(self.path, autosave=False)
+        cache.put("k", "v")
+        self.assertFalse(self.path.exists())
+        cache.flush()
+        self.assertEqual(DiskCache(self.path).get("k"), "v")
+
+    def test_clear_removes_file(self) -> None:
+        cache = DiskCache(self.path)
+        cache.put("k", "v")
+        cache.clear()
+        self.assertFalse(self.path.exists())
+        self.assertEqual(len(cache), 0)
+
+    def test_cache_dir_and_size_come_from_env(self) -> None:
+        with patch.dict(
+            "os.environ",
+            {"CLICKUP_CACHE_DIR": self.tmp_dir.name, "CLICKUP_CACHE_MAX_ENTRIES": "7"},
+        ):
+            self.assertEqual(default_cache_dir(), Path(self.tmp_dir.name))
+            self.assertEqual(configured_max_entries("CLICKUP_CACHE_MAX_ENTRIES"), 7)
+        with patch.dict("os.environ", {"CLICKUP_CACHE_MAX_ENTRIES": "x"}):
+            self.assertEqual(configured_max_entries("CLICKUP_CACHE_MAX_ENTRIES", 5), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,14 +4,19 @@
 Unit tests for ETA Calculator module.
 """
 
+import tempfile
 import unittest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 import eta_calculator
 from config import AISource
+from disk_cache import DiskCache
 from eta_calculator import (
+    ETACache,
     calculate_eta,
     get_claude_eta,
+    get_claude_summaries_with_etas,
     _get_fallback_eta,
     PRIORITY_ETA_DAYS,
 )
@@ -416,5 +421,125 @@ class ClaudeETATests(unittest.TestCase):
         self.assertEqual(eta_date.date(), expected_date.date())
 
 
+
+class FusedSummaryETATests(unittest.TestCase):
+    """One Claude call yields both the summary and a validated ETA."""
+
+    TASKS = [
+        ("Fix printer", [("Status", "in progress")], {"priority": "High", "status": "in progress"}),
+        ("Renew cert", [("Status", "to do")], {"priority": "Low", "status": "to do", "subject": "TLS"}),
+    ]
+
+    def test_summaries_and_validated_etas_from_one_call(self) -> None:
+        reply = (
+            '{"id": 1, "summary": "I rebooted the printer", "eta": "12/25/26."}\n'
+            '{"id": 2, "summary": "I need to renew the cert.", "eta": "next week"}'
+        )
+        with patch(
+            "eta_calculator.run_claude_cli", return_value=(reply, False)
+        ) as mock_run:
+            results = get_claude_summaries_with_etas(self.TASKS)
+
+        self.assertEqual(
+            results,
+            [
+                ("I rebooted the printer.", "12/25/2026"),
+                ("I need to renew the cert.", None),  # unparseable ETA dropped
+            ],
+        )
+        mock_run.assert_called_once()
+        prompt = mock_run.call_args.args[0]
+        self.assertIn("Task: Renew cert\nStatus: to do\nPriority: Low", prompt)
+        self.assertIn("Subject: TLS", prompt)
+
+    def test_tasks_without_a_summary_fall_back_to_summary_batch(self) -> None:
+        reply = '{"id": 2, "summary": "Renewing.", "eta": "01/05/2027"}'
+        with patch(
+            "eta_calculator.run_claude_cli", return_value=(reply, False)
+        ), patch(
+            "eta_calculator.get_claude_summaries", return_value=["Printer fixed."]
+        ) as fallback:
+            results = get_claude_summaries_with_etas(self.TASKS)
+
+        self.assertEqual(
+            results, [("Printer fixed.", None), ("Renewing.", "01/05/2027")]
+        )
+        self.assertEqual(
+            fallback.call_args.args[0], [("Fix printer", [("Status", "in progress")])]
+        )
+
+    def test_failed_call_is_not_retried_as_a_summary_batch(self) -> None:
+        with patch(
+            "eta_calculator.run_claude_cli", return_value=(None, False)
+        ) as mock_run, patch("eta_calculator.get_claude_summaries") as fallback:
+            results = get_claude_summaries_with_etas(self.TASKS)
+
+        self.assertEqual(results, [(None, None), (None, None)])
+        mock_run.assert_called_once()
+        fallback.assert_not_called()
+
+
+class ETACacheTests(unittest.TestCase):
+    """Memoized AI ETAs are stored as day offsets and keyed on every input."""
+
+    INPUTS = {
+        "task_name": "Replace printer",
+        "priority": "High",
+        "status": "to do",
+        "description": "",
+        "subject": "",
+        "resolution": "",
+    }
+
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = ETACache(DiskCache(Path(tmp_dir.name) / "etas.json"))
+
+    def test_hit_is_reanchored_to_lookup_day(self) -> None:
+        self.cache.store_eta(self.INPUTS, AISource.CLAUDE, "6/13/2026", today=date(2026, 6, 10))
+        self.assertEqual(
+            self.cache.lookup(self.INPUTS, AISource.CLAUDE, today=date(2026, 6, 17)),
+            "6/20/2026",
+        )
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_status_or_priority_change_misses(self) -> None:
+        self.cache.store_eta(self.INPUTS, None, "6/13/2026", today=date(2026, 6, 10))
+        self.assertIsNotNone(self.cache.lookup(self.INPUTS))  # None == Claude
+        for changed in ({"status": "in progress"}, {"priority": "Urgent"}):
+            with self.subTest(changed=changed):
+                self.assertIsNone(self.cache.lookup({**self.INPUTS, **changed}))
+
+    def test_source_is_part_of_the_key(self) -> None:
+        self.cache.store_eta(self.INPUTS, AISource.CLAUDE, "6/13/2026")
+        self.assertIsNone(self.cache.lookup(self.INPUTS, AISource.GEMINI))
+
+    def test_both_shares_claude_entries(self) -> None:
+        self.cache.store_eta(self.INPUTS, AISource.BOTH, "6/13/2026")
+        self.assertIsNotNone(self.cache.lookup(self.INPUTS, AISource.CLAUDE))
+        self.assertEqual(
+            ETACache.key(self.INPUTS, AISource.BOTH), ETACache.key(self.INPUTS, None)
+        )
+
+    def test_prompt_templates_are_part_of_the_key(self) -> None:
+        base = ETACache.key(self.INPUTS, AISource.CLAUDE)
+        for name in (
+            "_CLAUDE_ETA_SYSTEM_PROMPT",
+            "_CLAUDE_ETA_PROMPT",
+            "_CLAUDE_FUSED_SYSTEM_PROMPT",
+            "_CLAUDE_FUSED_TASK_BLOCK",
+            "_CLAUDE_FUSED_PROMPT",
+        ):
+            with self.subTest(template=name), patch.object(eta_calculator, name, "Edited"):
+                self.assertNotEqual(base, ETACache.key(self.INPUTS, AISource.CLAUDE))
+        gemini = ETACache.key(self.INPUTS, AISource.GEMINI)
+        with patch.object(eta_calculator, "_GEMINI_ETA_PROMPT", "Edited"):
+            self.assertNotEqual(gemini, ETACache.key(self.INPUTS, AISource.GEMINI))
+
+    def test_unparseable_eta_is_not_stored(self) -> None:
+        self.cache.store_eta(self.INPUTS, None, "soon")
+        self.assertIsNone(self.cache.lookup(self.INPUTS))
+
 if __name__ == "__main__":
     unittest.main()
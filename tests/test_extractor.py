@@ -1,6 +1,8 @@
 import tempfile
+import threading
 import unittest
 import csv
+import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
@@ -13,8 +15,16 @@ from config import (
     sort_tasks_by_priority_and_name,
     AISource,
     CLICKUP_AI_SUMMARY_FIELD_ID,
+    TaskFetchMode,
+    TaskQueryMode,
+)
+from api_client import APIError, JSONArrayStream, iter_task_pages
+from extractor import (
+    TASK_LISTING_KEYS,
+    ClickUpTaskExtractor,
+    _CustomFieldPlan,
+    get_export_fields,
 )
-from extractor import ClickUpTaskExtractor, get_export_fields
 
 
 class DummyAPIClient:
@@ -142,6 +152,64 @@ class ClickUpTaskExtractorProcessTaskTests(unittest.TestCase):
             ai_fields[-1], ("Task Description", "Default description body")
         )
 
+    def test_field_plan_maps_branch_from_the_list_definition(self) -> None:
+        definitions = [
+            {
+                "id": "branch-field",
+                "name": "Branch",
+                "type_config": {"options": [{"id": "opt-7", "name": "Main Office"}]},
+            }
+        ]
+        task = {
+            "id": "t9",
+            "name": "Plan task",
+            "priority": {"priority": 2},
+            "status": {"status": "open"},
+            "due_date": "1759838400000",
+            "description": "",
+            "custom_fields": [
+                # No type_config on the task: only the compiled plan knows
+                # the option labels.
+                {"id": "branch-field", "name": "Branch", "value": "opt-7"},
+                {"id": "s", "name": "Subject", "value": "Printer"},
+                {"id": "s2", "name": "Subject", "value": "Scanner"},  # last wins
+                {"id": "u", "name": "Unrelated", "value": "ignored"},
+            ],
+        }
+        self.config.task_fetch_mode = TaskFetchMode.LIST_PAYLOAD
+        plan = _CustomFieldPlan(definitions)
+
+        record = self.extractor._process_task(
+            task, definitions, {"name": "Support"}, field_plan=plan
+        )
+
+        record = cast(TaskRecord, record)
+        self.assertEqual(record.Branch, "Main Office")
+        self.assertEqual(record.Notes, "Subject: Scanner")
+        self.assertEqual(plan.collect(task["custom_fields"]).keys(), {"Branch", "Subject"})
+
+    def test_field_plan_falls_back_to_the_task_options(self) -> None:
+        """An option missing from the (cached) definitions maps via the task's options."""
+        plan = _CustomFieldPlan(
+            [
+                {
+                    "id": "branch-field",
+                    "name": "Branch",
+                    "type_config": {"options": [{"id": "o1", "name": "Plant 1"}]},
+                }
+            ]
+        )
+        field = {
+            "id": "branch-field",
+            "name": "Branch",
+            "value": "o2",
+            "type_config": {
+                "options": [{"id": "o1", "name": "Plant 1"}, {"id": "o2", "name": "Plant 2"}]
+            },
+        }
+        self.assertEqual(plan.branch_label(field), "Plant 2")
+        self.assertEqual(plan.branch_label({**field, "value": "o1"}), "Plant 1")
+
     def test_process_task_with_ai_summary_enabled(self) -> None:
         # Generation is deferred: _process_task stashes AI inputs, and the
         # concurrent pass (_generate_summaries_concurrently) calls the provider.
@@ -221,9 +289,13 @@ class ClickUpTaskExtractorProcessTaskTests(unittest.TestCase):
         task = {"id": self.task_id, "name": "Printer outage"}
         list_item = {"name": "Support"}
 
+        # The task has no due date, so its summary and ETA share one call.
         with patch(
-            "extractor.get_claude_summary", return_value="Claude summary text"
+            "extractor.get_claude_summaries_with_etas",
+            return_value=[("Claude summary text", "12/25/2026")],
         ) as mock_claude, patch(
+            "extractor.get_claude_summary"
+        ) as mock_single, patch(
             "extractor.get_ai_summary_with_status"
         ) as mock_gemini:
             record = self.extractor._process_task(task, [], list_item)
@@ -233,11 +305,14 @@ class ClickUpTaskExtractorProcessTaskTests(unittest.TestCase):
 
         record = cast(TaskRecord, record)
         self.assertEqual(record.Notes, "Claude summary text")
+        self.assertEqual(record.ETA, "12/25/2026")
         mock_claude.assert_called_once()
+        mock_single.assert_not_called()
         mock_gemini.assert_not_called()
-        called_task_name, fields_arg = mock_claude.call_args[0]
+        [(called_task_name, fields_arg, eta_inputs)] = mock_claude.call_args[0][0]
         self.assertEqual(called_task_name, "Detailed Task")
         self.assertEqual(fields_arg[0], ("Name", "Custom Task Name"))
+        self.assertEqual(eta_inputs["task_name"], "Detailed Task")
 
     def test_both_source_falls_back_to_claude(self) -> None:
         """Both: with no ClickUp Summary field, fall back to Claude (not Gemini)."""
@@ -250,7 +325,8 @@ class ClickUpTaskExtractorProcessTaskTests(unittest.TestCase):
         list_item = {"name": "Support"}
 
         with patch(
-            "extractor.get_claude_summary", return_value="Claude fallback summary"
+            "extractor.get_claude_summaries_with_etas",
+            return_value=[("Claude fallback summary", None)],
         ) as mock_claude, patch(
             "extractor.get_ai_summary_with_status"
         ) as mock_gemini:
@@ -272,7 +348,9 @@ class ClickUpTaskExtractorProcessTaskTests(unittest.TestCase):
         task = {"id": self.task_id, "name": "Printer outage"}
         list_item = {"name": "Support"}
 
-        with patch("extractor.get_claude_summary", return_value=None):
+        with patch(
+            "extractor.get_claude_summaries_with_etas", return_value=[(None, None)]
+        ):
             record = self.extractor._process_task(task, [], list_item)
             self.assertIsNotNone(record)
             self.extractor._generate_summaries_concurrently([record])
@@ -429,7 +507,7 @@ class FetchProcessTasksTests(unittest.TestCase):
             "/space/space1/list?archived=false": {
                 "lists": [{"id": "list1", "name": "Support"}]
             },
-            "/list/list1/task?archived=false&subtasks=true": {
+            "/list/list1/task?archived=false&subtasks=true&page=0": {
                 "tasks": [
                     {
                         "id": "task1",
@@ -511,7 +589,7 @@ class FetchProcessTasksTests(unittest.TestCase):
             "/space/space1/list?archived=false": {
                 "lists": [{"id": "list1", "name": "Support"}]
             },
-            "/list/list1/task?archived=false&subtasks=true": {
+            "/list/list1/task?archived=false&subtasks=true&page=0": {
                 "tasks": [
                     {
                         "id": "task1",
@@ -577,7 +655,7 @@ class FetchProcessTasksTests(unittest.TestCase):
                     {"id": "list2", "name": "Other List"},
                 ]
             },
-            "/list/list1/task?archived=false&subtasks=true": {
+            "/list/list1/task?archived=false&subtasks=true&page=0": {
                 "tasks": [
                     {
                         "id": "task1",
@@ -635,7 +713,7 @@ class FetchProcessTasksTests(unittest.TestCase):
             "/space/space1/list?archived=false": {
                 "lists": [{"id": "list1", "name": "Support"}]
             },
-            "/list/list1/task?archived=false&subtasks=true": {
+            "/list/list1/task?archived=false&subtasks=true&page=0": {
                 "tasks": [
                     {
                         "id": "task1",
@@ -701,6 +779,698 @@ class FetchProcessTasksTests(unittest.TestCase):
             )
 
 
+    def test_incremental_run_fetches_only_changed_tasks(self) -> None:
+        def list_task(task_id: str, updated: int, status: str = "open") -> dict:
+            return {
+                "id": task_id,
+                "name": task_id,
+                "archived": False,
+                "status": {"status": status},
+                "date_created": "1759838400000",
+                "date_updated": str(updated),
+            }
+
+        def detail(name: str) -> dict:
+            return {"name": name, "status": {"status": "open"}, "custom_fields": []}
+
+        base: dict[str, Any] = {
+            "/team": {"teams": [{"id": "team1", "name": "KMS"}]},
+            "/team/team1/space": {"spaces": [{"id": "space1", "name": "Kikkoman"}]},
+            "/space/space1/folder": {"folders": []},
+            "/space/space1/list?archived=false": {
+                "lists": [{"id": "list1", "name": "Support"}]
+            },
+            "/list/list1": {"custom_fields": []},
+        }
+        first_run = {
+            **base,
+            "/list/list1/task?archived=false&subtasks=true&page=0": {
+                "tasks": [
+                    list_task("t1", 100),
+                    list_task("t2", 200),
+                    list_task("t3", 150),
+                ]
+            },
+            "/task/t1": detail("Task 1"),
+            "/task/t2": detail("Task 2"),
+            "/task/t3": detail("Task 3"),
+        }
+        second_run = {
+            **base,
+            "/list/list1/task?archived=false&subtasks=true"
+            "&include_closed=true&date_updated_gt=200&page=0": {
+                "tasks": [
+                    list_task("t2", 300),
+                    list_task("t3", 250, status="closed"),
+                    list_task("t4", 260),
+                ]
+            },
+            "/task/t2": detail("Task 2 edited"),
+            "/task/t4": detail("Task 4"),
+        }
+
+        class CountingAPIClient(DummyAPIClient):
+            def __init__(self, responses: dict[str, Any]) -> None:
+                super().__init__(responses)
+                self.calls: list[str] = []
+
+            def get(self, endpoint: str) -> Any:
+                self.calls.append(endpoint)
+                return super().get(endpoint)
+
+        class RecordingExtractor(ClickUpTaskExtractor):
+            def export(self, tasks: list[TaskRecord]) -> None:  # type: ignore[override]
+                self.exported = tasks
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(
+            "os.environ", {"CLICKUP_CACHE_DIR": tmpdir}
+        ):
+            config = ClickUpConfig(
+                api_key="dummy",
+                output_path=str(Path(tmpdir) / "out.md"),
+                workspace_name="KMS",
+                space_name="Kikkoman",
+                incremental=True,
+            )
+            first = RecordingExtractor(config, CountingAPIClient(first_run))
+            first._fetch_and_process_tasks()
+            self.assertEqual(
+                [r.Task for r in first.exported], ["Task 1", "Task 2", "Task 3"]
+            )
+
+            api = CountingAPIClient(second_run)
+            second = RecordingExtractor(config, api)
+            second._fetch_and_process_tasks()
+
+        # t1 reused from the snapshot, t2 replaced in place, closed t3 dropped,
+        # new t4 appended; only the changed open tasks were re-fetched.
+        self.assertEqual(
+            [r.Task for r in second.exported], ["Task 1", "Task 2 edited", "Task 4"]
+        )
+        self.assertEqual(
+            sorted(call for call in api.calls if call.startswith("/task/")),
+            ["/task/t2", "/task/t4"],
+        )
+        self.assertEqual(second.exported[0]._metadata["task_id"], "t1")
+
+    def test_incremental_run_refetches_tasks_that_failed_to_process(self) -> None:
+        base: dict[str, Any] = {
+            "/team": {"teams": [{"id": "team1", "name": "KMS"}]},
+            "/team/team1/space": {"spaces": [{"id": "space1", "name": "Kikkoman"}]},
+            "/space/space1/folder": {"folders": []},
+            "/space/space1/list?archived=false": {
+                "lists": [{"id": "list1", "name": "Support"}]
+            },
+            "/list/list1": {"custom_fields": []},
+        }
+        t1 = {
+            "id": "t1",
+            "name": "t1",
+            "archived": False,
+            "status": {"status": "open"},
+            "date_created": "1759838400000",
+            "date_updated": "200",
+        }
+        # First run: the /task/t1 detail fetch fails (no response).
+        first_run = {
+            **base,
+            "/list/list1/task?archived=false&subtasks=true&page=0": {"tasks": [t1]},
+        }
+        second_run = {
+            **base,
+            "/list/list1/task?archived=false&subtasks=true"
+            "&include_closed=true&date_updated_gt=199&page=0": {"tasks": [t1]},
+            "/task/t1": {"name": "Task 1", "status": {"status": "open"}, "custom_fields": []},
+        }
+
+        class RecordingExtractor(ClickUpTaskExtractor):
+            def export(self, tasks: list[TaskRecord]) -> None:  # type: ignore[override]
+                self.exported = tasks
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(
+            "os.environ", {"CLICKUP_CACHE_DIR": tmpdir}
+        ):
+            config = ClickUpConfig(
+                api_key="dummy",
+                output_path=str(Path(tmpdir) / "out.md"),
+                workspace_name="KMS",
+                space_name="Kikkoman",
+                incremental=True,
+            )
+            first = RecordingExtractor(config, DummyAPIClient(first_run))
+            first._fetch_and_process_tasks()
+            self.assertEqual(first.exported, [])
+
+            second = RecordingExtractor(config, DummyAPIClient(second_run))
+            second._fetch_and_process_tasks()
+
+        self.assertEqual([r.Task for r in second.exported], ["Task 1"])
+
+    def _two_list_responses(self) -> dict[str, Any]:
+        def detail(name: str) -> dict:
+            return {
+                "name": name,
+                "status": {"status": "open"},
+                "due_date": "1759838400000",  # no AI ETA needed
+                "description": f"{name} details",
+                "custom_fields": [],
+            }
+
+        responses: dict[str, Any] = {
+            "/team": {"teams": [{"id": "team1", "name": "KMS"}]},
+            "/team/team1/space": {"spaces": [{"id": "space1", "name": "Kikkoman"}]},
+            "/space/space1/folder": {"folders": []},
+            "/space/space1/list?archived=false": {
+                "lists": [
+                    {"id": "list1", "name": "Support"},
+                    {"id": "list2", "name": "Projects"},
+                ]
+            },
+        }
+        for list_id, task_id in (("list1", "t1"), ("list2", "t2")):
+            responses[f"/list/{list_id}"] = {"custom_fields": []}
+            responses[f"/list/{list_id}/task?archived=false&subtasks=true&page=0"] = {
+                "tasks": [
+                    {
+                        "id": task_id,
+                        "name": task_id,
+                        "archived": False,
+                        "status": {"status": "open"},
+                        "date_created": "1759838400000",
+                    }
+                ]
+            }
+            responses[f"/task/{task_id}"] = detail(f"Task {task_id}")
+        return responses
+
+    def _run_two_lists(self, interactive: bool) -> tuple[list[str], list[TaskRecord]]:
+        """Run a Gemini-summarized fetch of two lists, logging API and AI events."""
+        events: list[str] = []
+        first_summary = threading.Event()
+
+        class LoggingAPIClient(DummyAPIClient):
+            def get(self, endpoint: str) -> Any:
+                if endpoint.startswith("/list/list2/task"):
+                    # Give a streamed summary of list1 the chance to finish first.
+                    first_summary.wait(0 if interactive else 2)
+                events.append(endpoint)
+                return super().get(endpoint)
+
+        def fake_summary(task_name, *args, **kwargs):
+            events.append(f"summary:{task_name}")
+            first_summary.set()
+            return f"Summary of {task_name}.", True
+
+        class RecordingExtractor(ClickUpTaskExtractor):
+            def export(self, tasks: list[TaskRecord]) -> None:  # type: ignore[override]
+                self.exported = tasks
+
+            def interactive_include(self, tasks):  # type: ignore[override]
+                return tasks
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch(
+            "extractor.get_ai_summary_with_status", side_effect=fake_summary
+        ):
+            config = ClickUpConfig(
+                api_key="dummy",
+                output_path=str(Path(tmpdir) / "out.md"),
+                workspace_name="KMS",
+                space_name="Kikkoman",
+                enable_ai_summary=True,
+                ai_source=AISource.GEMINI,
+                gemini_api_key="key",
+                interactive_selection=interactive,
+            )
+            extractor = RecordingExtractor(
+                config, LoggingAPIClient(self._two_list_responses())
+            )
+            extractor._fetch_and_process_tasks()
+        return events, extractor.exported
+
+    def test_ai_summaries_start_while_later_lists_are_fetched(self) -> None:
+        events, exported = self._run_two_lists(interactive=False)
+
+        self.assertLess(
+            events.index("summary:Task t1"),
+            events.index("/list/list2/task?archived=false&subtasks=true&page=0"),
+        )
+        self.assertEqual(
+            [r.Notes for r in exported], ["Summary of Task t1.", "Summary of Task t2."]
+        )
+
+    def test_interactive_mode_summarizes_after_selection(self) -> None:
+        events, exported = self._run_two_lists(interactive=True)
+
+        summaries = [e for e in events if e.startswith("summary:")]
+        self.assertEqual(len(summaries), 2)
+        self.assertEqual(events[-2:], summaries)
+        self.assertEqual(
+            [r.Notes for r in exported], ["Summary of Task t1.", "Summary of Task t2."]
+        )
+
+    def test_team_query_lists_tasks_in_bulk_and_groups_them_by_list(self) -> None:
+        def team_task(task_id: str, list_id: str) -> dict:
+            return {
+                "id": task_id,
+                "name": task_id,
+                "archived": False,
+                "status": {"status": "open"},
+                "date_created": "1759838400000",
+                "list": {"id": list_id},
+            }
+
+        responses = self._two_list_responses()
+        for list_id in ("list1", "list2"):
+            del responses[f"/list/{list_id}/task?archived=false&subtasks=true&page=0"]
+        responses[
+            "/team/team1/task?subtasks=true&include_closed=false"
+            "&space_ids[]=space1&page=0"
+        ] = {
+            "tasks": [
+                team_task("t2", "list2"),
+                team_task("t1", "list1"),
+                team_task("x9", "archived-list"),  # not a discovered list
+            ]
+        }
+
+        class CountingAPIClient(DummyAPIClient):
+            def __init__(self, responses: dict[str, Any]) -> None:
+                super().__init__(responses)
+                self.calls: list[str] = []
+
+            def get(self, endpoint: str) -> Any:
+                self.calls.append(endpoint)
+                return super().get(endpoint)
+
+        class RecordingExtractor(ClickUpTaskExtractor):
+            def export(self, tasks: list[TaskRecord]) -> None:  # type: ignore[override]
+                self.exported = tasks
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = ClickUpConfig(
+                api_key="dummy",
+                output_path=str(Path(tmpdir) / "out.md"),
+                workspace_name="KMS",
+                space_name="Kikkoman",
+                task_query=TaskQueryMode.TEAM,
+            )
+            api = CountingAPIClient(responses)
+            extractor = RecordingExtractor(config, api)
+            extractor._fetch_and_process_tasks()
+
+        self.assertEqual(
+            [(r.Task, r.Company) for r in extractor.exported],
+            [("Task t1", "Support"), ("Task t2", "Projects")],
+        )
+        task_queries = [call for call in api.calls if "/task?" in call]
+        self.assertEqual(len(task_queries), 1)
+        self.assertTrue(task_queries[0].startswith("/team/team1/task?"))
+
+    def test_team_query_uses_the_oldest_list_watermark(self) -> None:
+        class StubSnapshot:
+            def __init__(self, marks: dict[str, int | None]) -> None:
+                self.marks = marks
+
+            def watermark(self, list_id: str) -> int | None:
+                return self.marks[list_id]
+
+        class EmptyTeamClient:
+            def __init__(self) -> None:
+                self.calls: list[str] = []
+
+            def get(self, endpoint: str) -> Any:
+                self.calls.append(endpoint)
+                return {"tasks": []}
+
+        lists = [{"id": "list1"}, {"id": "list2"}]
+        for marks, expected_query, expected_since in (
+            (
+                {"list1": 200, "list2": 100},
+                "subtasks=true&include_closed=true&space_ids[]=s1&date_updated_gt=100",
+                100,
+            ),
+            (
+                {"list1": 200, "list2": None},  # list2 is due a full sync
+                "subtasks=true&include_closed=false&space_ids[]=s1",
+                None,
+            ),
+        ):
+            with self.subTest(marks=marks):
+                api = EmptyTeamClient()
+                extractor = ClickUpTaskExtractor(ClickUpConfig(api_key="dummy"), api)
+                grouped, since = extractor._query_team_tasks(
+                    "team1", {"id": "s1"}, lists, StubSnapshot(marks)
+                )
+                self.assertEqual(grouped, {"list1": [], "list2": []})
+                self.assertEqual(since, expected_since)
+                self.assertEqual(
+                    api.calls, [f"/team/team1/task?{expected_query}&page=0"]
+                )
+
+    def test_status_filters_are_sent_with_the_task_query(self) -> None:
+        responses = self._two_list_responses()
+        # list1 reports its statuses, so "Blocked" and the closed status are
+        # filtered by ClickUp; list2 doesn't, so it is queried unfiltered.
+        responses["/list/list1"] = {
+            "custom_fields": [],
+            "task_count": 4,
+            "statuses": [
+                {"status": "to do", "type": "open"},
+                {"status": "in progress", "type": "custom"},
+                {"status": "Blocked", "type": "custom"},
+                {"status": "complete", "type": "closed"},
+            ],
+        }
+        responses[
+            "/list/list1/task?archived=false&subtasks=true"
+            "&statuses[]=to%20do&statuses[]=in%20progress&page=0"
+        ] = responses.pop("/list/list1/task?archived=false&subtasks=true&page=0")
+
+        class RecordingExtractor(ClickUpTaskExtractor):
+            def export(self, tasks: list[TaskRecord]) -> None:  # type: ignore[override]
+                self.exported = tasks
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = ClickUpConfig(
+                api_key="dummy",
+                output_path=str(Path(tmpdir) / "out.md"),
+                workspace_name="KMS",
+                space_name="Kikkoman",
+                exclude_statuses=["blocked"],
+            )
+            extractor = RecordingExtractor(config, DummyAPIClient(responses))
+            extractor._fetch_and_process_tasks()
+
+        self.assertEqual([r.Task for r in extractor.exported], ["Task t1", "Task t2"])
+        self.assertEqual(extractor._server_filtered_lists, 1)
+        self.assertEqual(extractor._server_filter_saved_tasks, 3)
+        self.assertEqual(extractor._client_filter_drops, 0)
+
+    def test_list_tasks_fetches_pages_without_prefetch(self) -> None:
+        extractor = ClickUpTaskExtractor(
+            ClickUpConfig(api_key="dummy"),
+            DummyAPIClient({"/list/l1/task?page=0": {"tasks": [{"id": "t1"}]}}),
+        )
+        with patch("extractor.iter_task_pages", wraps=iter_task_pages) as pages:
+            tasks = extractor._list_tasks("/list/l1/task")
+
+        self.assertEqual(tasks, [{"id": "t1"}])
+        self.assertIs(pages.call_args.kwargs["prefetch"], False)
+
+    def test_status_whitelist_uses_uncached_list_details(self) -> None:
+        class CachingClient:
+            def __init__(self) -> None:
+                self.calls: list[tuple[str, str]] = []
+
+            def get(self, endpoint: str) -> Any:
+                self.calls.append(("get", endpoint))
+                return {"statuses": [{"status": "open", "type": "open"}]}
+
+            def get_fresh(self, endpoint: str) -> Any:
+                self.calls.append(("get_fresh", endpoint))
+                return {"statuses": [{"status": "open", "type": "open"}]}
+
+        api = CachingClient()
+        extractor = ClickUpTaskExtractor(ClickUpConfig(api_key="dummy"), api)
+        extractor._get_list_details("l1")  # e.g. custom fields, may be cached
+        extractor._get_list_details("l1", fresh=True)
+        extractor._get_list_details("l1", fresh=True)
+        extractor._get_list_details("l1")
+
+        self.assertEqual(api.calls, [("get", "/list/l1"), ("get_fresh", "/list/l1")])
+
+    def test_stream_json_lists_tasks_projected_to_the_keys_used(self) -> None:
+        class StreamingClient:
+            def __init__(self) -> None:
+                self.streamed: list[tuple[str, tuple]] = []
+
+            def stream(self, endpoint: str, key: str, fields: tuple) -> Any:
+                self.streamed.append((endpoint, tuple(fields)))
+                body = json.dumps(
+                    {"tasks": [{"id": "t1", "name": "T", "watchers": [1] * 50}]}
+                ).encode()
+                return JSONArrayStream([body], key, fields)
+
+        api = StreamingClient()
+        config = ClickUpConfig(api_key="dummy", stream_json=True)
+        tasks = ClickUpTaskExtractor(config, api)._list_tasks("/list/l1/task")
+
+        self.assertEqual(tasks, [{"id": "t1", "name": "T"}])
+        self.assertEqual(api.streamed, [("/list/l1/task?page=0", TASK_LISTING_KEYS)])
+
+    def test_server_filter_params(self) -> None:
+        statuses = {
+            "statuses": [
+                {"status": "open", "type": "open"},
+                {"status": "done", "type": "closed"},
+            ]
+        }
+        start, end = datetime(2025, 10, 6), datetime(2025, 10, 12)
+        start_ms = int(start.timestamp() * 1000)
+        end_ms = int(end.timestamp() * 1000)
+
+        extractor = ClickUpTaskExtractor(ClickUpConfig(api_key="dummy"), None)
+        self.assertEqual(
+            extractor._server_filter_params([statuses], start, end),
+            [
+                "statuses[]=open",
+                f"date_created_gt={start_ms - 1}",
+                f"date_created_lt={end_ms + 1}",
+            ],
+        )
+
+        # Completed tasks wanted: nothing to narrow, closed tasks requested.
+        config = ClickUpConfig(api_key="dummy", include_completed=True)
+        extractor = ClickUpTaskExtractor(config, None)
+        self.assertEqual(
+            extractor._server_filter_params([statuses], None, None),
+            ["include_closed=true"],
+        )
+
+        # Every status excluded: the list needn't be queried at all.
+        config = ClickUpConfig(api_key="dummy", exclude_statuses=["Open"])
+        extractor = ClickUpTaskExtractor(config, None)
+        self.assertIsNone(extractor._server_filter_params([statuses], None, None))
+
+
+class TaskDetailFetchConcurrencyTests(unittest.TestCase):
+    def _extractor(self, api_client: Any) -> ClickUpTaskExtractor:
+        config = ClickUpConfig(api_key="dummy", output_path="output/test.md")
+        return ClickUpTaskExtractor(config, api_client)
+
+    def test_fetch_concurrency_is_configurable_and_clamped(self) -> None:
+        extractor = self._extractor(DummyAPIClient({}))
+        with patch.dict("os.environ", {"CLICKUP_FETCH_CONCURRENCY": "16"}):
+            self.assertEqual(extractor._fetch_concurrency(100), 16)
+            self.assertEqual(extractor._fetch_concurrency(3), 3)
+        with patch.dict("os.environ", {"CLICKUP_FETCH_CONCURRENCY": "0"}):
+            self.assertEqual(extractor._fetch_concurrency(100), 1)
+        with patch.dict("os.environ", {"CLICKUP_FETCH_CONCURRENCY": "x"}):
+            self.assertEqual(extractor._fetch_concurrency(100), 8)
+
+    def test_records_keep_list_order_when_fetches_finish_out_of_order(self) -> None:
+        import threading
+        import time
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        class SlowAPIClient:
+            def get(self, endpoint: str) -> Any:
+                nonlocal active, peak
+                task_id = endpoint.rsplit("/", 1)[-1]
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                # Earlier tasks take longer, so completion order is reversed.
+                time.sleep(0.05 - 0.01 * int(task_id[1:]))
+                with lock:
+                    active -= 1
+                return {
+                    "name": f"Task {task_id}",
+                    "status": {"status": "open"},
+                    "due_date": "1760000000000",
+                    "custom_fields": [],
+                }
+
+        tasks = [{"id": f"t{i}", "name": f"t{i}"} for i in range(5)]
+        progress = DummyProgress()
+        with patch.object(progress, "advance") as mock_advance, patch.dict(
+            "os.environ", {"CLICKUP_FETCH_CONCURRENCY": "5"}
+        ):
+            records = self._extractor(SlowAPIClient())._process_tasks_concurrently(
+                tasks, [], {"name": "Support"}, progress, 1
+            )
+
+        self.assertEqual([r.Task for r in records], [f"Task t{i}" for i in range(5)])
+        self.assertEqual(mock_advance.call_count, 5)
+        self.assertGreater(peak, 1)
+
+    def test_skipped_tasks_are_dropped(self) -> None:
+        responses = {
+            "/task/ok": {"name": "OK", "status": {"status": "open"}, "custom_fields": []},
+            "/task/bad": None,
+        }
+        tasks = [{"id": "bad"}, {"id": "ok"}]
+        with patch("extractor.console"):
+            records = self._extractor(DummyAPIClient(responses))._process_tasks_concurrently(
+                tasks, [], {"name": "Support"}, DummyProgress(), 1
+            )
+        self.assertEqual([r.Task for r in records], ["OK"])
+
+    def test_async_client_fetches_all_details_concurrently_in_order(self) -> None:
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        class FakeAsyncAPIClient:
+            max_connections = 10
+
+            def __init__(self) -> None:
+                self.closed = False
+
+            async def get(self, endpoint: str) -> Any:
+                nonlocal in_flight, peak
+                task_id = endpoint.rsplit("/", 1)[-1]
+                in_flight += 1
+                peak = max(peak, in_flight)
+                # Earlier tasks answer last, so completion order is reversed.
+                await asyncio.sleep(0.05 - 0.01 * int(task_id[1:]))
+                in_flight -= 1
+                if task_id == "t3":
+                    raise APIError("HTTP 500")
+                return {
+                    "name": f"Task {task_id}",
+                    "status": {"status": "open"},
+                    "due_date": "1760000000000",
+                    "custom_fields": [],
+                }
+
+            async def aclose(self) -> None:
+                self.closed = True
+
+        class FailingSyncClient:
+            def get(self, endpoint: str) -> Any:
+                raise AssertionError("details must come from the async client")
+
+        async_client = FakeAsyncAPIClient()
+        extractor = ClickUpTaskExtractor(
+            ClickUpConfig(api_key="dummy"),
+            FailingSyncClient(),
+            async_api_client=async_client,
+        )
+        tasks = [{"id": f"t{i}", "name": f"t{i}"} for i in range(5)]
+        progress = DummyProgress()
+        with patch.object(progress, "advance") as mock_advance, patch(
+            "extractor.console"
+        ):
+            records = extractor._process_tasks_concurrently(
+                tasks, [], {"name": "Support"}, progress, 1
+            )
+
+        self.assertEqual(
+            [r.Task for r in records], ["Task t0", "Task t1", "Task t2", "Task t4"]
+        )
+        self.assertEqual(peak, 5)
+        self.assertEqual(mock_advance.call_count, 5)
+        self.assertEqual(extractor._detail_fetch_count, 5)
+        self.assertTrue(async_client.closed)
+
+    def test_discover_lists_merges_folders_in_order_then_space_lists(self) -> None:
+        import time
+
+        class SlowFolderAPIClient(DummyAPIClient):
+            def get(self, endpoint: str) -> Any:
+                # The first folder answers last, so completion order differs.
+                if endpoint == "/folder/f1/list":
+                    time.sleep(0.05)
+                return super().get(endpoint)
+
+        responses = {
+            "/space/s1/folder": {"folders": [{"id": "f1"}, {"id": "f2"}]},
+            "/folder/f1/list": {"lists": [{"id": "a"}, {"id": "b"}]},
+            "/folder/f2/list": {"lists": [{"id": "c"}]},
+            "/space/s1/list?archived=false": {"lists": [{"id": "d"}]},
+        }
+        lists = self._extractor(SlowFolderAPIClient(responses))._discover_lists({"id": "s1"})
+        self.assertEqual([item["id"] for item in lists], ["a", "b", "c", "d"])
+
+    def test_discover_lists_tolerates_unexpected_folder_response(self) -> None:
+        responses = {
+            "/space/s1/folder": None,
+            "/space/s1/list?archived=false": {"lists": [{"id": "d"}]},
+        }
+        with patch("extractor.console"):
+            lists = self._extractor(DummyAPIClient(responses))._discover_lists({"id": "s1"})
+        self.assertEqual([item["id"] for item in lists], ["d"])
+
+class ListPayloadModeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.list_task = {
+            "id": "t1",
+            "name": "From List",
+            "priority": {"priority": 4},
+            "status": {"status": "open"},
+            "due_date": None,
+            "description": "List description",
+            "custom_fields": [{"name": "Subject", "value": "VPN down"}],
+        }
+        self.detail = {
+            "name": "From Detail",
+            "status": {"status": "open"},
+            "custom_fields": [],
+        }
+
+    class CountingAPIClient(DummyAPIClient):
+        def __init__(self, responses: dict[str, Any]) -> None:
+            super().__init__(responses)
+            self.calls: list[str] = []
+
+        def get(self, endpoint: str) -> Any:
+            self.calls.append(endpoint)
+            return super().get(endpoint)
+
+    def _extractor(self, mode: TaskFetchMode):
+        api = self.CountingAPIClient({"/task/t1": self.detail})
+        config = ClickUpConfig(
+            api_key="dummy", output_path="output/test.md", task_fetch_mode=mode
+        )
+        return ClickUpTaskExtractor(config, api), api
+
+    def test_complete_list_payload_skips_detail_request(self) -> None:
+        extractor, api = self._extractor(TaskFetchMode.LIST_PAYLOAD)
+
+        record = extractor._process_task(self.list_task, [], {"name": "Support"})
+
+        self.assertEqual(api.calls, [])
+        self.assertEqual(extractor._detail_fetch_count, 0)
+        self.assertIsNotNone(record)
+        record = cast(TaskRecord, record)
+        self.assertEqual(record.Task, "From List")
+        self.assertEqual(record.Priority, "Urgent")
+        self.assertIn("Subject: VPN down", record.Notes)
+
+    def test_incomplete_list_payload_fetches_detail(self) -> None:
+        extractor, api = self._extractor(TaskFetchMode.LIST_PAYLOAD)
+        del self.list_task["custom_fields"]
+
+        record = extractor._process_task(self.list_task, [], {"name": "Support"})
+
+        self.assertEqual(api.calls, ["/task/t1"])
+        self.assertEqual(cast(TaskRecord, record).Task, "From Detail")
+
+    def test_detail_mode_always_fetches(self) -> None:
+        extractor, api = self._extractor(TaskFetchMode.DETAIL)
+
+        record = extractor._process_task(self.list_task, [], {"name": "Support"})
+
+        self.assertEqual(api.calls, ["/task/t1"])
+        self.assertEqual(extractor._detail_fetch_count, 1)
+        self.assertEqual(cast(TaskRecord, record).Task, "From Detail")
+
+
 class TaskExportSortingTests(unittest.TestCase):
     """Test that tasks are properly sorted during export."""
 
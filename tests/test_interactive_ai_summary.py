@@ -47,7 +47,7 @@ class TestInteractiveAISummary(unittest.TestCase):
             f"/space/{self.space_id}/list?archived=false": {
                 "lists": [{"id": self.list_id, "name": "Test List"}]
             },
-            f"/list/{self.list_id}/task?archived=false&subtasks=true": {
+            f"/list/{self.list_id}/task?archived=false&subtasks=true&page=0": {
                 "tasks": [
                     {"id": "task_1", "name": "Task 1", "date_created": "1609459200000"},
                     {"id": "task_2", "name": "Task 2", "date_created": "1609459200000"},
@@ -287,7 +287,7 @@ class TestInteractiveAISummary(unittest.TestCase):
     @patch("extractor.Progress")
     @patch("extractor.console")
     @patch("extractor.get_yes_no_input")
-    @patch("extractor.get_claude_summary")
+    @patch("extractor.get_claude_summaries_with_etas")
     def test_claude_opt_in_interactive_needs_no_key(
         self, mock_claude, mock_get_yes_no, mock_console, mock_progress
     ):
@@ -305,7 +305,10 @@ class TestInteractiveAISummary(unittest.TestCase):
         # Select tasks 1 and 2, skip task 3, then opt in to AI summaries.
         mock_get_yes_no.side_effect = [True, True, False, True]
         mock_console.input = Mock(side_effect=AssertionError("should not prompt for a key"))
-        mock_claude.return_value = "Claude generated summary."
+        # Due-date-less tasks get summary and ETA from one fused Claude call.
+        mock_claude.side_effect = lambda tasks, **_: [
+            ("Claude generated summary.", None) for _ in tasks
+        ]
 
         config = ClickUpConfig(
             api_key="test_key",
@@ -325,7 +328,7 @@ class TestInteractiveAISummary(unittest.TestCase):
             extractor.run()
 
         self.assertEqual(
-            mock_claude.call_count,
+            sum(len(c.args[0]) for c in mock_claude.call_args_list),
             2,
             "Claude summary should be generated for the 2 selected tasks",
         )
@@ -10,7 +10,7 @@ loader. No network, Google Sheets, or Claude CLI calls are made.
 import os
 import tempfile
 import unittest
-from datetime import date
+from datetime import date, datetime, timedelta
 from unittest import mock
 
 from config import TaskRecord, sort_tasks_by_priority_and_eta
@@ -465,6 +465,41 @@ class TestApplyAiEtas(unittest.TestCase):
             apply_ai_etas([candidate])
         self.assertEqual(candidate.ETA, "12/25/2026")
 
+    def test_cached_estimates_skip_preflight_and_model(self):
+        from pathlib import Path
+
+        from disk_cache import DiskCache
+        from eta_calculator import ETACache
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "etas.json"
+            available, authenticated = self._cli_ready()
+            first = _record_with_eta_inputs("A")
+            future = (date.today() + timedelta(days=5)).strftime("%m/%d/%Y")
+            with (
+                available,
+                authenticated,
+                mock.patch(
+                    "kfj_task_extractor.calculate_eta_with_source",
+                    return_value=(future, True),
+                ),
+            ):
+                apply_ai_etas([first], ETACache(DiskCache(path, autosave=False)))
+
+            again = _record_with_eta_inputs("A")
+            with (
+                mock.patch("kfj_task_extractor.claude_cli_available") as preflight,
+                mock.patch("kfj_task_extractor.calculate_eta_with_source") as calc,
+            ):
+                apply_ai_etas([again], ETACache(DiskCache(path)))
+
+        preflight.assert_not_called()
+        calc.assert_not_called()
+        self.assertEqual(
+            datetime.strptime(again.ETA, "%m/%d/%Y").date(),
+            date.today() + timedelta(days=5),
+        )
+
     def test_exception_keeps_baseline_for_that_record_only(self):
         rec_ok = _record_with_eta_inputs("OK")
         rec_bad = _record_with_eta_inputs("BAD")
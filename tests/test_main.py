@@ -3,7 +3,7 @@ import sys
 from pathlib import Path
 from typing import Any, Sequence
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 from config import DateFilter, OutputFormat
 
@@ -76,7 +76,7 @@ class MainEntrypointTests(unittest.TestCase):
         mock_load_secret.assert_not_called()
         mock_console.input.assert_not_called()
 
-        mock_api_client_cls.assert_called_once_with("test-key")
+        mock_api_client_cls.assert_called_once_with("test-key", cache=ANY)
         mock_extractor_cls.assert_called_once()
         extractor_instance.run.assert_called_once()
 
@@ -146,6 +146,79 @@ class MainEntrypointTests(unittest.TestCase):
         config_arg = mock_extractor_cls.call_args.args[0]
         self.assertEqual(config_arg.output_format, OutputFormat.CSV)
 
+    def test_cache_flags_control_response_cache(self) -> None:
+        main_module = self._import_main_module()
+
+        for flag, expect_cache, expect_refresh in (
+            (None, True, False),
+            ("--refresh-cache", True, True),
+            ("--no-cache", False, False),
+        ):
+            with self.subTest(flag=flag):
+                mock_api_client_cls = MagicMock()
+                mock_extractor_cls = MagicMock()
+                argv = [
+                    str(Path(__file__).resolve().parents[1] / "main.py"),
+                    "--api-key",
+                    "test-key",
+                    "--workspace",
+                    "TestWorkspace",
+                    "--output-format",
+                    "Markdown",
+                ]
+                if flag:
+                    argv.append(flag)
+                with (
+                    patch.object(main_module, "console", MagicMock()),
+                    patch.object(main_module, "get_yes_no_input", return_value=False),
+                    patch.object(
+                        main_module,
+                        "_load_runtime_dependencies",
+                        return_value=(mock_api_client_cls, mock_extractor_cls),
+                    ),
+                ):
+                    self._run_main_with_args(main_module, argv)
+
+                cache = mock_api_client_cls.call_args.kwargs["cache"]
+                if expect_cache:
+                    self.assertEqual(cache.refresh, expect_refresh)
+                else:
+                    self.assertIsNone(cache)
+
+    def test_async_fetch_passes_an_async_client_sharing_the_rate_limiter(self) -> None:
+        from api_client import AsyncClickUpAPIClient
+
+        main_module = self._import_main_module()
+        mock_api_client_cls = MagicMock()
+        mock_extractor_cls = MagicMock()
+        argv = [
+            str(Path(__file__).resolve().parents[1] / "main.py"),
+            "--api-key",
+            "test-key",
+            "--workspace",
+            "TestWorkspace",
+            "--output-format",
+            "Markdown",
+            "--async-fetch",
+        ]
+        with (
+            patch.object(main_module, "console", MagicMock()),
+            patch.object(main_module, "get_yes_no_input", return_value=False),
+            patch.object(
+                main_module,
+                "_load_runtime_dependencies",
+                return_value=(mock_api_client_cls, mock_extractor_cls),
+            ),
+        ):
+            self._run_main_with_args(main_module, argv)
+
+        self.assertTrue(mock_extractor_cls.call_args.args[0].async_fetch)
+        async_client = mock_extractor_cls.call_args.kwargs["async_api_client"]
+        self.assertIsInstance(async_client, AsyncClickUpAPIClient)
+        self.assertIs(
+            async_client.rate_limiter, mock_api_client_cls.return_value.rate_limiter
+        )
+
     def test_environment_auth_attempted_without_secret_reference(self) -> None:
         """Regression: an OP_ENVIRONMENT_ID-only setup must still attempt 1Password.
 
@@ -192,7 +265,7 @@ class MainEntrypointTests(unittest.TestCase):
         mock_load_secret.assert_called_once_with("", "ClickUp API key")
         # Key resolved from the Environment — no manual prompt, key flows through.
         mock_console.input.assert_not_called()
-        mock_api_client_cls.assert_called_once_with("env-key")
+        mock_api_client_cls.assert_called_once_with("env-key", cache=ANY)
 
     def test_no_op_lookup_when_no_reference_and_no_environment(self) -> None:
         """Without a reference or OP_ENVIRONMENT_ID, skip 1Password and prompt."""
@@ -230,7 +303,7 @@ class MainEntrypointTests(unittest.TestCase):
 
         mock_load_secret.assert_not_called()
         mock_console.input.assert_called_once()
-        mock_api_client_cls.assert_called_once_with("typed-key")
+        mock_api_client_cls.assert_called_once_with("typed-key", cache=ANY)
 
 
 class OpRunReexecTests(unittest.TestCase):
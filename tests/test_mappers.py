@@ -7,6 +7,7 @@ Tests cover:
 - get_date_range function with different filter options
 - extract_images function with various image patterns
 - LocationMapper.map_location with different matching strategies
+- DropdownOptions indexed lookups (same results as map_location)
 """
 
 import unittest
@@ -18,6 +19,7 @@ from config import DateFilter
 from mappers import (
     get_date_range,
     extract_images,
+    DropdownOptions,
     LocationMapper,
     get_yes_no_input,
     get_choice_input,
@@ -124,7 +126,7 @@ class TestExtractImages(unittest.TestCase):
         self.assertIn('<img src="https://example.com/photo.jpg" alt="photo">', result)
 
     def test_direct_url_patterns(self):
-        """Test extraction of direct image URLs (captures extension)."""
+        """Test extraction of direct image URLs (the full URL is returned)."""
         test_cases = [
             ("https://example.com/image.jpg", "jpg"),
             ("http://example.com/photo.jpeg", "jpeg"),
@@ -137,10 +139,8 @@ class TestExtractImages(unittest.TestCase):
         for url, expected_ext in test_cases:
             text = f"Look at this: {url} and more text"
             result = extract_images(text)
-            # The regex captures just the extension, not the full URL
-            self.assertIn(
-                expected_ext, result, f"Failed to extract extension from {url}"
-            )
+            self.assertTrue(result.endswith(expected_ext))
+            self.assertEqual(result, url, f"Failed to extract {url}")
 
     def test_attachment_patterns(self):
         """Test extraction of attachment patterns."""
@@ -154,10 +154,8 @@ class TestExtractImages(unittest.TestCase):
         for pattern, expected_ext in test_cases:
             text = f"See {pattern} for details"
             result = extract_images(text)
-            # Should find the extension
-            self.assertIn(
-                expected_ext, result, f"Failed to find extension in: {pattern}"
-            )
+            self.assertEqual(result, pattern, f"Failed to find: {pattern}")
+            self.assertTrue(result.endswith(expected_ext))
 
     def test_multiple_images(self):
         """Test extraction of multiple images."""
@@ -178,9 +176,43 @@ class TestExtractImages(unittest.TestCase):
         text = "Images: https://example.com/IMAGE.JPG and https://example.com/photo.PNG"
         result = extract_images(text)
 
-        # The regex extracts extensions (case-insensitive), not full URLs
-        self.assertIn("JPG", result)
-        self.assertIn("PNG", result)
+        self.assertEqual(
+            result, "https://example.com/IMAGE.JPG; https://example.com/photo.PNG"
+        )
+
+    def test_case_insensitive_with_non_ascii_text(self):
+        """Non-ASCII text, including letters Unicode folds to i/s, still matches."""
+        self.assertEqual(
+            extract_images("Café: HTTPS://example.com/a.PNG"), "HTTPS://example.com/a.PNG"
+        )
+        # re.IGNORECASE equates U+017F (long s) with "s".
+        self.assertEqual(
+            extract_images("Attachment\u017f:x.png"), "Attachment\u017f:x.png"
+        )
+
+    def test_references_are_deduplicated_in_document_order(self):
+        """Repeated references are reported once, in the order they appear."""
+        text = (
+            "https://example.com/b.png then https://example.com/a.png "
+            "and https://example.com/b.png again"
+        )
+        self.assertEqual(
+            extract_images(text), "https://example.com/b.png; https://example.com/a.png"
+        )
+
+    def test_url_inside_markup_is_not_reported_again(self):
+        """A Markdown image or <img> tag is reported whole, not also its URL."""
+        text = (
+            "![shot](https://example.com/one.png) "
+            '<img src="https://example.com/two.jpg"> '
+            "https://example.com/three.gif"
+        )
+        self.assertEqual(
+            extract_images(text),
+            "![shot](https://example.com/one.png); "
+            '<img src="https://example.com/two.jpg">; '
+            "https://example.com/three.gif",
+        )
 
     def test_text_without_images(self):
         """Test text without any images returns empty string."""
@@ -271,6 +303,118 @@ class TestLocationMapper(unittest.TestCase):
         result = LocationMapper.map_location(2, "dropdown", options)
         self.assertEqual(result, "Two")
 
+    def test_map_location_reuses_the_index_for_equal_options(self):
+        """Equal options (even a fresh copy) hit the cached index."""
+        options = [{"id": "1", "name": "One", "orderindex": 0}]
+        first = LocationMapper._index(options, "field-reuse")
+        again = LocationMapper._index([dict(opt) for opt in options], "field-reuse")
+        self.assertIs(first, again)
+
+    def test_map_location_rebuilds_when_options_change(self):
+        """Renamed options for the same field id are not served stale."""
+        options = [{"id": "1", "name": "One", "orderindex": 0}]
+        self.assertEqual(
+            LocationMapper.map_location("1", "dropdown", options, field_id="f-change"),
+            "One",
+        )
+        options[0]["name"] = "Uno"  # mutated in place, as a reused payload could be
+        self.assertEqual(
+            LocationMapper.map_location("1", "dropdown", options, field_id="f-change"),
+            "Uno",
+        )
+
+    def test_map_location_with_unhashable_option_values(self):
+        """Options that can't be fingerprinted are still mapped, just not cached."""
+        options = [{"id": "1", "name": "One", "orderindex": 0}, {"id": ["x"], "name": "X"}]
+        self.assertEqual(
+            LocationMapper.map_location("1", "dropdown", options, field_id="f-odd"), "One"
+        )
+        self.assertNotIn("f-odd", {key[0] for key in LocationMapper._indexes})
+
+    def test_map_location_keeps_fields_apart(self):
+        """Fields with the same option count but different options both resolve."""
+        a = [{"id": "1", "name": "Alpha", "orderindex": 0}]
+        b = [{"id": "1", "name": "Beta", "orderindex": 0}]
+        for _ in range(2):
+            self.assertEqual(
+                LocationMapper.map_location("1", "dropdown", a, field_id="fa"), "Alpha"
+            )
+            self.assertEqual(
+                LocationMapper.map_location("1", "dropdown", b, field_id="fb"), "Beta"
+            )
+
+    def test_map_location_index_cache_is_bounded(self):
+        """The least recently used indexes are evicted past INDEX_CACHE_SIZE."""
+        with patch.object(LocationMapper, "INDEX_CACHE_SIZE", 3):
+            for n in range(5):
+                LocationMapper.map_location(
+                    "1", "dropdown", [{"id": "1", "name": "One"}], field_id=f"bounded-{n}"
+                )
+            self.assertLessEqual(len(LocationMapper._indexes), 3)
+            fields = {key[0] for key in LocationMapper._indexes}
+            self.assertIn("bounded-4", fields)
+            self.assertNotIn("bounded-0", fields)
+
+
+def _scan_label(val, options):
+    """The original linear-scan map_location, as a reference."""
+    if not options:
+        return str(val)
+    for opt in options:
+        if str(opt.get("id")) == str(val):
+            return opt.get("name", str(val))
+    try:
+        val_int = int(val)
+        for opt in options:
+            if "orderindex" in opt and int(opt["orderindex"]) == val_int:
+                return opt.get("name", str(val))
+    except Exception:
+        pass
+    for opt in options:
+        if str(opt.get("name")) == str(val):
+            return opt.get("name", str(val))
+    return str(val)
+
+
+class TestDropdownOptions(unittest.TestCase):
+    """DropdownOptions must resolve values exactly like the option scans did."""
+
+    def test_lookups_match_map_location(self):
+        """Id, orderindex and name matches, in that order, as the scans do."""
+        option_sets = [
+            [
+                {"id": "a1", "name": "Alpha", "orderindex": 0},
+                {"id": "b2", "name": "Beta", "orderindex": "1"},
+                {"id": "1", "name": "Gamma", "orderindex": 2},
+            ],
+            [{"id": "123", "orderindex": 0}],  # missing name
+            [{"id": "x", "name": None, "orderindex": 0}],  # explicit None name
+            [
+                {"id": "a", "name": "A", "orderindex": 0},
+                {"id": "b", "name": "B", "orderindex": "bad"},
+                {"id": "c", "name": "C", "orderindex": 2},  # unreachable by index
+            ],
+            [],
+        ]
+        values = ["a1", "1", 1, 2, 1.9, "Beta", "123", 0, "x", "nope", None, "None"]
+        for options in option_sets:
+            dropdown = DropdownOptions(options)
+            for value in values:
+                with self.subTest(options=options, value=value):
+                    expected = _scan_label(value, options)
+                    self.assertEqual(dropdown.label(value), expected)
+                    self.assertEqual(
+                        LocationMapper.map_location(value, "dropdown", options),
+                        expected,
+                    )
+
+    def test_find_returns_default_when_nothing_matches(self):
+        dropdown = DropdownOptions([{"id": "a", "name": "A"}, {"id": "b"}])
+        self.assertEqual(dropdown.find("a"), "A")
+        self.assertIsNone(dropdown.find("zzz"))
+        self.assertEqual(dropdown.find("b", "miss"), "miss")  # option without a name
+        self.assertEqual(DropdownOptions([]).find("a", "miss"), "miss")
+
 
 class TestGetYesNoInput(unittest.TestCase):
     """Tests for the get_yes_no_input function."""
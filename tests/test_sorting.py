@@ -7,8 +7,13 @@ then by ETA (earliest first) or alphabetically by task name.
 """
 
 import unittest
+from datetime import datetime
+from unittest.mock import patch
+
 from config import (
     TaskRecord,
+    _parse_eta,
+    _parse_eta_slow,
     sort_tasks_by_priority_and_name,
     sort_tasks_by_priority_and_eta,
 )
@@ -921,5 +926,55 @@ class TestTaskSortingByETA(unittest.TestCase):
         self.assertEqual(actual, expected)
 
 
+
+class TestETAParsing(unittest.TestCase):
+    """Tests for the regex front end and memoization of ETA parsing."""
+
+    def test_fast_path_matches_the_strptime_chain(self):
+        """Recognized and unusual shapes parse exactly as the full chain does."""
+        for eta in (
+            "2/15/2026 at 3:45 PM",
+            "02/05/2026 at 12:05 am",
+            "2/15/2026",
+            "2026-2-15",
+            "2/15/2026 at 13:45 PM",  # hour out of range
+            "2/30/2026",  # day out of range
+            "2/15/2026 at 3:5 PM",  # single-digit minute (full chain only)
+            "2026-02-15T10:00:00Z",
+        ):
+            with self.subTest(eta=eta):
+                self.assertEqual(_parse_eta(eta), _parse_eta_slow(eta))
+
+    def test_common_shapes_skip_strptime(self):
+        """Display-format, date-only and text ETAs are parsed without strptime."""
+        _parse_eta.cache_clear()
+        with patch("config._parse_eta_slow") as slow:
+            self.assertEqual(
+                _parse_eta("2/15/2026 at 3:45 PM"), (0, datetime(2026, 2, 15, 15, 45))
+            )
+            self.assertEqual(_parse_eta("2026-02-15"), (0, datetime(2026, 2, 15)))
+            self.assertEqual(_parse_eta("TBD"), (1, datetime.max))
+        slow.assert_not_called()
+
+    def test_sort_key_is_reused_until_fields_change(self):
+        """Re-sorting reuses stored keys; reassigning ETA invalidates them."""
+        first = TaskRecord(
+            Task="A", Company="", Branch="", Priority="High", Status="", ETA="2/20/2026"
+        )
+        second = TaskRecord(
+            Task="B", Company="", Branch="", Priority="High", Status="", ETA="2/25/2026"
+        )
+        self.assertEqual(sort_tasks_by_priority_and_eta([second, first]), [first, second])
+
+        with patch("config._parse_eta") as parse:
+            self.assertEqual(
+                sort_tasks_by_priority_and_eta([second, first]), [first, second]
+            )
+        parse.assert_not_called()
+
+        first.ETA = "3/1/2026"
+        self.assertEqual(sort_tasks_by_priority_and_eta([first, second]), [second, first])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,10 +4,14 @@
 Unit tests for the concurrent AI-summary pass (_generate_summaries_concurrently).
 
 Covers: order/mapping preservation across workers, per-task call count,
-concurrency clamping, the ClickUp-only no-op, and that a mid-run provider
-usage-limit short-circuits remaining calls.
+concurrency clamping, the ClickUp-only no-op, that a mid-run provider
+usage-limit short-circuits remaining calls, the persistent summary cache,
+batched Claude dispatch, fused summary + ETA calls, and the shared scheduler
+running both kinds of job.
 """
 
+import tempfile
+import threading
 import time
 import unittest
 from unittest.mock import patch
@@ -74,6 +78,19 @@ def _config(source: AISource = AISource.CLAUDE) -> ClickUpConfig:
     )
 
 
+_batch_size_patch = patch.dict("os.environ", {"CLAUDE_SUMMARY_BATCH_SIZE": "1"})
+
+
+def setUpModule() -> None:
+    # Most tests here count per-task get_claude_summary calls; batching is
+    # exercised explicitly in BatchedSummaryTests.
+    _batch_size_patch.start()
+
+
+def tearDownModule() -> None:
+    _batch_size_patch.stop()
+
+
 class SummaryConcurrencyTests(unittest.TestCase):
     def setUp(self) -> None:
         ai_summary._reset_claude_state()
@@ -444,5 +461,316 @@ class ResultReportingTests(unittest.TestCase):
         self.assertIn("0 of 1 AI-estimated", text)
 
 
+
+class SummaryCacheTests(unittest.TestCase):
+    """Unchanged tasks reuse cached summaries/ETAs across runs (no provider call)."""
+
+    def setUp(self) -> None:
+        ai_summary._reset_claude_state()
+        ai_summary._reset_api_state()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def tearDown(self) -> None:
+        ai_summary._reset_claude_state()
+        ai_summary._reset_api_state()
+
+    def _run(self, records, refresh: bool = False, summary=None):
+        config = _config(AISource.CLAUDE)
+        config.ai_cache_dir = self.tmp_dir.name
+        config.refresh_summaries = refresh
+        extractor = ClickUpTaskExtractor(config, _DummyAPIClient())
+        with patch(
+            "extractor.get_claude_summary",
+            side_effect=summary or (lambda name, fields, **_: f"summary::{name}"),
+        ) as mock_claude, patch("extractor.console") as mock_console:
+            extractor._generate_summaries_concurrently(records)
+        return mock_claude, _console_text(mock_console)
+
+    def test_second_run_serves_unchanged_tasks_from_cache(self) -> None:
+        self._run([_make_record("A"), _make_record("B")])
+
+        changed = _make_record("B")
+        changed._metadata["ai_fields"] = (("Name", "B"), ("Status", "Closed"))
+        records = [_make_record("A"), changed]
+        mock_claude, text = self._run(records)
+
+        self.assertEqual(mock_claude.call_count, 1)  # only the changed task
+        self.assertEqual([r.Notes for r in records], ["summary::A", "summary::B"])
+        self.assertIn("2 of 2 generated (1 from cache)", text)
+
+    def test_failed_generation_is_not_cached(self) -> None:
+        self._run([_make_record("A")], summary=lambda name, fields, **_: None)
+        mock_claude, _ = self._run([_make_record("A")])
+        self.assertEqual(mock_claude.call_count, 1)
+
+    def test_refresh_summaries_regenerates(self) -> None:
+        self._run([_make_record("A")])
+        records = [_make_record("A")]
+        mock_claude, _ = self._run(
+            records, refresh=True, summary=lambda name, fields, **_: "fresh"
+        )
+        self.assertEqual(mock_claude.call_count, 1)
+        self.assertEqual(records[0].Notes, "fresh")
+
+    def test_cache_disabled_by_default(self) -> None:
+        extractor = ClickUpTaskExtractor(_config(), _DummyAPIClient())
+        self.assertIsNone(extractor._summary_cache)
+        self.assertIsNone(extractor._eta_cache)
+
+    def test_unchanged_eta_inputs_reuse_memoized_estimate(self) -> None:
+        config = _config(AISource.CLAUDE)
+        config.ai_cache_dir = self.tmp_dir.name
+        with patch(
+            "extractor.calculate_eta_with_source", return_value=("12/31/2099", True)
+        ) as first_calc, patch("extractor.console"):
+            ClickUpTaskExtractor(config, _DummyAPIClient())._generate_etas_concurrently(
+                [_make_eta_record("A")]
+            )
+        self.assertEqual(first_calc.call_count, 1)
+
+        changed = _make_eta_record("B")
+        tasks = [_make_eta_record("A"), changed]
+        ai_summary.mark_claude_unavailable()  # cached ETAs need no CLI
+        with patch("extractor.calculate_eta_with_source") as calc, patch(
+            "extractor.console"
+        ):
+            ClickUpTaskExtractor(config, _DummyAPIClient())._generate_etas_concurrently(
+                tasks
+            )
+        calc.assert_not_called()
+        self.assertEqual(tasks[0].ETA.rsplit("/", 1)[-1], "2099")
+        self.assertEqual(changed.ETA, "01/01/2026")  # uncached baseline kept
+
+class BatchedSummaryTests(unittest.TestCase):
+    """Claude summaries are dispatched CLAUDE_SUMMARY_BATCH_SIZE tasks per call."""
+
+    def setUp(self) -> None:
+        ai_summary._reset_claude_state()
+        env = patch.dict("os.environ", {"CLAUDE_SUMMARY_BATCH_SIZE": "5"})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(ai_summary._reset_claude_state)
+
+    @staticmethod
+    def _fake_batch(tasks, progress_pause_callback=None):
+        return [f"summary::{name}" for name, _ in tasks]
+
+    def test_tasks_are_summarized_in_batches_in_order(self) -> None:
+        extractor = ClickUpTaskExtractor(_config(AISource.CLAUDE), _DummyAPIClient())
+        records = [_make_record(f"Task {i}") for i in range(12)]
+
+        with patch(
+            "extractor.get_claude_summaries", side_effect=self._fake_batch
+        ) as mock_batch, patch(
+            "extractor.get_claude_summary", side_effect=lambda name, *_a, **_k: f"summary::{name}"
+        ) as mock_single, patch("extractor.console"):
+            extractor._generate_summaries_concurrently(records)
+
+        self.assertEqual(
+            sorted(len(call.args[0]) for call in mock_batch.call_args_list), [2, 5, 5]
+        )
+        mock_single.assert_not_called()
+        for i, rec in enumerate(records):
+            self.assertEqual(rec.Notes, f"summary::Task {i}")
+
+    def test_both_source_only_batches_tasks_without_clickup_summary(self) -> None:
+        extractor = ClickUpTaskExtractor(_config(AISource.BOTH), _DummyAPIClient())
+        records = [_make_record(f"Task {i}") for i in range(4)]
+        records[1]._metadata["clickup_ai_summary"] = "from clickup"
+
+        with patch(
+            "extractor.get_claude_summaries", side_effect=self._fake_batch
+        ) as mock_batch, patch("extractor.console"):
+            extractor._generate_summaries_concurrently(records)
+
+        mock_batch.assert_called_once()
+        self.assertEqual(
+            [name for name, _ in mock_batch.call_args.args[0]],
+            ["Task 0", "Task 2", "Task 3"],
+        )
+        self.assertEqual(records[1].Notes, "from clickup")
+        self.assertEqual(records[3].Notes, "summary::Task 3")
+
+    def test_batch_failures_fall_back_to_base_notes(self) -> None:
+        extractor = ClickUpTaskExtractor(_config(AISource.CLAUDE), _DummyAPIClient())
+        records = [_make_record(f"Task {i}") for i in range(3)]
+
+        with patch(
+            "extractor.get_claude_summaries",
+            return_value=["one.", None, "three."],
+        ), patch("extractor.console") as mock_console:
+            extractor._generate_summaries_concurrently(records)
+
+        self.assertEqual(records[1].Notes, "base notes for Task 1")
+        self.assertIn(
+            "2 of 3 generated, 1 fell back to base notes", _console_text(mock_console)
+        )
+
+
+class FusedSummaryETAPassTests(unittest.TestCase):
+    """Due-date-less tasks get summary and ETA from the summary pass's call."""
+
+    def setUp(self) -> None:
+        ai_summary._reset_claude_state()
+        self.addCleanup(ai_summary._reset_claude_state)
+        env = patch.dict("os.environ", {"CLAUDE_SUMMARY_BATCH_SIZE": "5"})
+        env.start()
+        self.addCleanup(env.stop)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    @staticmethod
+    def _fake_fused(tasks, progress_pause_callback=None):
+        return [
+            (f"summary::{name}", None if name == "Vague" else "12/31/2099")
+            for name, _, _ in tasks
+        ]
+
+    def test_eta_pass_skips_tasks_estimated_with_their_summary(self) -> None:
+        extractor = ClickUpTaskExtractor(_config(AISource.CLAUDE), _DummyAPIClient())
+        plain = _make_record("Plain")  # has a due date: summary only
+        records = [_make_eta_record("A"), plain, _make_eta_record("Vague")]
+
+        with patch(
+            "extractor.get_claude_summaries_with_etas", side_effect=self._fake_fused
+        ) as fused, patch(
+            "extractor.get_claude_summary", return_value="summary::Plain"
+        ) as single, patch(
+            "extractor.calculate_eta_with_source", return_value=("06/01/2099", True)
+        ) as calc, patch("extractor.console") as mock_console:
+            extractor._generate_summaries_concurrently(records)
+            extractor._generate_etas_concurrently(records)
+
+        fused.assert_called_once()
+        self.assertEqual([t[0] for t in fused.call_args.args[0]], ["A", "Vague"])
+        single.assert_called_once()
+        self.assertEqual(records[0].Notes, "summary::A")
+        self.assertEqual(records[0].ETA, "12/31/2099")
+        # Only the task whose fused ETA was unparseable reaches the ETA pass.
+        calc.assert_called_once()
+        self.assertEqual(calc.call_args.kwargs["task_name"], "Vague")
+        self.assertEqual(records[2].ETA, "06/01/2099")
+        self.assertIn(
+            "2 of 2 AI-estimated (1 with their summary)", _console_text(mock_console)
+        )
+
+    def test_failed_fused_call_keeps_baseline_etas_without_more_calls(self) -> None:
+        extractor = ClickUpTaskExtractor(_config(AISource.CLAUDE), _DummyAPIClient())
+        records = [_make_eta_record("A"), _make_eta_record("B")]
+
+        with patch(
+            "extractor.get_claude_summaries_with_etas",
+            side_effect=lambda tasks, **_: [(None, None)] * len(tasks),
+        ) as fused, patch(
+            "extractor.calculate_eta_with_source", return_value=("06/01/2099", True)
+        ) as calc, patch("extractor.console"):
+            extractor._generate_ai_content(records)
+
+        fused.assert_called_once()
+        calc.assert_not_called()
+        self.assertEqual([r.ETA for r in records], ["01/01/2026", "01/01/2026"])
+        self.assertNotIn("ai_eta_failed", records[0]._metadata)
+
+    def test_memoized_eta_is_not_requested_again(self) -> None:
+        config = _config(AISource.CLAUDE)
+        config.ai_cache_dir = self.tmp_dir.name
+        record = _make_eta_record("A")
+        first = ClickUpTaskExtractor(config, _DummyAPIClient())
+        with patch(
+            "extractor.get_claude_summaries_with_etas", side_effect=self._fake_fused
+        ), patch("extractor.console"):
+            first._generate_summaries_concurrently([record])
+
+        changed = _make_eta_record("A")
+        changed._metadata["ai_fields"] = (("Name", "A"), ("Status", "Blocked"))
+        with patch(
+            "extractor.get_claude_summaries_with_etas"
+        ) as fused, patch(
+            "extractor.get_claude_summary", return_value="new summary"
+        ) as single, patch("extractor.console"):
+            second = ClickUpTaskExtractor(config, _DummyAPIClient())
+            second._generate_summaries_concurrently([changed])
+            second._generate_etas_concurrently([changed])
+
+        fused.assert_not_called()
+        single.assert_called_once()
+        self.assertEqual(changed.ETA.rsplit("/", 1)[-1], "2099")
+
+
+class SharedSchedulerTests(unittest.TestCase):
+    """_generate_ai_content runs summary and ETA jobs on one pool."""
+
+    def setUp(self) -> None:
+        ai_summary._reset_claude_state()
+        ai_summary._reset_api_state()
+        self.addCleanup(ai_summary._reset_claude_state)
+        self.addCleanup(ai_summary._reset_api_state)
+
+    def test_gemini_summaries_and_etas_run_interleaved(self) -> None:
+        config = _config(AISource.GEMINI)
+        config.gemini_api_key = "g"
+        extractor = ClickUpTaskExtractor(config, _DummyAPIClient())
+        records = [_make_eta_record("A"), _make_eta_record("B")]
+        eta_started = threading.Event()
+
+        def slow_summary(task_name, fields, key, progress_pause_callback=None):
+            # Completes only once an ETA job runs alongside the summaries.
+            self.assertTrue(eta_started.wait(2))
+            return f"summary::{task_name}", True
+
+        def fake_eta(**kwargs):
+            eta_started.set()
+            return "12/31/2099", True
+
+        with patch(
+            "extractor.get_ai_summary_with_status", side_effect=slow_summary
+        ), patch(
+            "extractor.calculate_eta_with_source", side_effect=fake_eta
+        ), patch("extractor.console") as mock_console, patch.dict(
+            "os.environ", {"AI_SUMMARY_CONCURRENCY": "4"}
+        ):
+            extractor._generate_ai_content(records)
+
+        self.assertEqual([r.Notes for r in records], ["summary::A", "summary::B"])
+        self.assertEqual([r.ETA for r in records], ["12/31/2099", "12/31/2099"])
+        text = _console_text(mock_console)
+        self.assertIn("2/2 summaries, 2/2 ETAs processed", text)
+        self.assertIn("AI summaries complete: 2 of 2 generated", text)
+        self.assertIn("ETA estimation complete: 2 of 2 AI-estimated", text)
+
+    def test_claude_eta_job_follows_its_summary_batch(self) -> None:
+        extractor = ClickUpTaskExtractor(_config(AISource.CLAUDE), _DummyAPIClient())
+        records = [_make_eta_record("A"), _make_eta_record("Vague")]
+        events: list[str] = []
+
+        def fused(tasks, progress_pause_callback=None):
+            events.append("summary")
+            return [
+                (f"summary::{name}", None if name == "Vague" else "12/31/2099")
+                for name, _, _ in tasks
+            ]
+
+        def fake_eta(**kwargs):
+            events.append(f"eta::{kwargs['task_name']}")
+            return "06/01/2099", True
+
+        with patch(
+            "extractor.get_claude_summaries_with_etas", side_effect=fused
+        ), patch(
+            "extractor.calculate_eta_with_source", side_effect=fake_eta
+        ), patch("extractor.console") as mock_console, patch.dict(
+            "os.environ", {"CLAUDE_SUMMARY_BATCH_SIZE": "5"}
+        ):
+            extractor._generate_ai_content(records)
+
+        self.assertEqual(events, ["summary", "eta::Vague"])
+        self.assertEqual([r.ETA for r in records], ["12/31/2099", "06/01/2099"])
+        self.assertIn(
+            "ETA estimation complete: 2 of 2 AI-estimated (1 with their summary)",
+            _console_text(mock_console),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
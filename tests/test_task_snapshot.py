@@ -0,0 +1,143 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from config import TaskRecord
+from eta_calculator import calculate_eta
+from task_snapshot import TaskSnapshot, record_from_dict, record_to_dict
+
+
+def make_record(task_id: str, name: str) -> TaskRecord:
+    record = TaskRecord(
+        Task=name, Company="Support", Branch="", Priority="High", Status="open"
+    )
+    record._metadata = {
+        "task_id": task_id,
+        "ai_fields": (("Subject", "VPN"), ("Branch", "(not provided)")),
+        "eta_inputs": None,
+    }
+    return record
+
+
+class RecordSerializationTests(unittest.TestCase):
+    def test_round_trip_restores_fields_and_metadata(self) -> None:
+        record = make_record("t1", "Fix VPN")
+        record.Notes = "Subject: VPN"
+        restored = record_from_dict(record_to_dict(record))
+        self.assertEqual(restored, record)
+        self.assertEqual(restored._metadata, record._metadata)
+        self.assertIsInstance(restored._metadata["ai_fields"][0], tuple)
+
+    def test_baseline_eta_is_recomputed_for_today(self) -> None:
+        record = make_record("t1", "Fix VPN")
+        record.ETA = "01/02/2020"  # stale baseline from an old run
+        record._metadata["eta_inputs"] = {
+            "task_name": "Fix VPN",
+            "priority": "High",
+            "status": "open",
+            "description": "",
+            "subject": "",
+            "resolution": "",
+        }
+        record._metadata["ai_eta"] = "01/02/2020"
+        restored = record_from_dict(record_to_dict(record))
+        self.assertEqual(
+            restored.ETA,
+            calculate_eta(**record._metadata["eta_inputs"], enable_ai=False),
+        )
+        self.assertNotIn("ai_eta", restored._metadata)
+
+    def test_due_date_eta_is_kept(self) -> None:
+        record = make_record("t1", "Fix VPN")
+        record.ETA = "01/02/2020"
+        self.assertEqual(record_from_dict(record_to_dict(record)).ETA, "01/02/2020")
+
+
+class TaskSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = Path(self.tmp_dir.name) / "snap.json"
+
+    def _seed(self, signature: str = "sig") -> None:
+        snapshot = TaskSnapshot(self.path, signature)
+        snapshot.merge(
+            "list1",
+            [{"id": "t1", "date_updated": "100"}, {"id": "t2", "date_updated": "50"}],
+            [make_record("t1", "One"), make_record("t2", "Two")],
+            full_sync=True,
+        )
+        snapshot.save()
+
+    def test_watermark_is_highest_date_updated(self) -> None:
+        self._seed()
+        self.assertEqual(TaskSnapshot(self.path, "sig").watermark("list1"), 100)
+        self.assertIsNone(TaskSnapshot(self.path, "sig").watermark("other"))
+
+    def test_signature_mismatch_discards_snapshot(self) -> None:
+        self._seed()
+        self.assertIsNone(TaskSnapshot(self.path, "different").watermark("list1"))
+
+    def test_stale_full_sync_forces_full_fetch(self) -> None:
+        self._seed()
+        snapshot = TaskSnapshot(self.path, "sig", full_sync_max_age=60)
+        with patch("task_snapshot.time.time", return_value=10**12):
+            self.assertIsNone(snapshot.watermark("list1"))
+
+    def test_delta_merge_replaces_in_place_and_counts_reuse(self) -> None:
+        self._seed()
+        snapshot = TaskSnapshot(self.path, "sig")
+        merged = snapshot.merge(
+            "list1",
+            [{"id": "t1", "date_updated": "300"}, {"id": "t3", "date_updated": "200"}],
+            [make_record("t3", "Three"), make_record("t1", "One edited")],
+            full_sync=False,
+        )
+        self.assertEqual([r.Task for r in merged], ["One edited", "Two", "Three"])
+        self.assertEqual(snapshot.reused_count, 1)
+        self.assertEqual(snapshot.watermark("list1"), 300)
+
+    def test_failed_tasks_keep_their_records_and_are_fetched_again(self) -> None:
+        self._seed()
+        snapshot = TaskSnapshot(self.path, "sig")
+        merged = snapshot.merge(
+            "list1",
+            [{"id": "t1", "date_updated": "200"}, {"id": "t3", "date_updated": "300"}],
+            [make_record("t3", "Three")],
+            full_sync=False,
+            failed_ids=["t1"],
+        )
+        self.assertEqual([r.Task for r in merged], ["One", "Two", "Three"])
+        # Below t1's date_updated, so the next delta includes it again.
+        self.assertEqual(snapshot.watermark("list1"), 199)
+
+        merged = snapshot.merge(
+            "list1",
+            [{"id": "t1", "date_updated": "200"}],
+            [make_record("t1", "One edited")],
+            full_sync=False,
+        )
+        self.assertEqual([r.Task for r in merged], ["One edited", "Two", "Three"])
+        self.assertEqual(snapshot.watermark("list1"), 200)
+
+    def test_failed_task_survives_a_full_sync(self) -> None:
+        self._seed()
+        snapshot = TaskSnapshot(self.path, "sig")
+        merged = snapshot.merge(
+            "list1",
+            [{"id": "t1", "date_updated": "100"}, {"id": "t2", "date_updated": "50"}],
+            [make_record("t2", "Two")],
+            full_sync=True,
+            failed_ids=["t1"],
+        )
+        self.assertEqual([r.Task for r in merged], ["Two", "One"])
+        self.assertEqual(snapshot.watermark("list1"), 99)
+
+    def test_corrupt_file_is_treated_as_empty(self) -> None:
+        self.path.write_text("nope", encoding="utf-8")
+        self.assertIsNone(TaskSnapshot(self.path, "sig").watermark("list1"))
+
+
+if __name__ == "__main__":
+    unittest.main()